@@ -1,6 +1,7 @@
 """Public interface for the LCS consensus library."""
 
-from src.client import LcsClient, consensus, list_strategies
+from src.adapters.orchestration.warmup import WarmupReport
+from src.client import BatchItem, LcsClient, consensus, list_strategies
 from src.contracts.request import ConsensusRequest
 from src.contracts.response import ConsensusResult
 from src.core.concurrency import calculate_concurrency_budget, ConcurrencyBudgetInput, ConcurrencyBudgetResult
@@ -8,6 +9,8 @@ from src.errors import LcsError
 
 __all__ = [
     "LcsClient",
+    "BatchItem",
+    "WarmupReport",
     "consensus",
     "list_strategies",
     "ConsensusRequest",
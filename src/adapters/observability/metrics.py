@@ -9,6 +9,8 @@ __all__ = [
     "http_requests_total",
     "llm_call_duration_seconds",
     "llm_calls_total",
+    "llm_time_to_first_token_seconds",
+    "llm_generation_tokens_per_second",
     "consensus_duration_seconds",
     "run_event_callback_total",
     "run_event_callback_duration_seconds",
@@ -22,6 +24,46 @@ __all__ = [
     "quality_score_stats",
     "provider_breaker_open_total",
     "provider_breaker_state",
+    "provider_hedges_total",
+    "provider_hedge_wins_total",
+    "provider_retries_total",
+    "provider_cache_requests_total",
+    "provider_cache_evictions_total",
+    "provider_cache_bytes",
+    "provider_calls_coalesced_total",
+    "provider_fallbacks_total",
+    "provider_adaptive_timeout_ms",
+    "warmup_step_duration_seconds",
+    "deadline_stage_skipped_total",
+    "quorum_outcomes_total",
+    "quorum_cancelled_calls_total",
+    "scheduler_calls_in_flight",
+    "scheduler_wait_seconds",
+    "provider_concurrency_limit",
+    "provider_concurrency_in_flight",
+    "provider_concurrency_wait_seconds",
+    "provider_concurrency_rejections_total",
+    "provider_bulkhead_in_flight",
+    "provider_bulkhead_queued",
+    "provider_bulkhead_saturation",
+    "provider_bulkhead_rejections_total",
+    "admission_queue_depth",
+    "admission_running",
+    "admission_wait_seconds",
+    "admission_shed_total",
+    "request_duration_by_priority_seconds",
+    "tenant_queue_wait_seconds",
+    "tenant_calls_total",
+    "tenant_in_flight",
+    "scoring_queue_wait_seconds",
+    "scoring_execution_seconds",
+    "scoring_analyzer_seconds",
+    "scoring_timeouts_total",
+    "scoring_pool_fallbacks_total",
+    "provider_rate_limit_wait_seconds",
+    "provider_rate_limit_rejections_total",
+    "provider_rate_limit_throttles_total",
+    "provider_retry_exhausted_total",
     "policy_reload_total",
     "policy_reload_duration_seconds",
     "policy_active_info",
@@ -32,6 +74,10 @@ __all__ = [
     "output_validation_total",
     "output_validation_reasks_total",
     "gate_decisions_total",
+    "http_client_created_total",
+    "http_pool_connections",
+    "http_pool_max_connections",
+    "http_pool_requests_in_flight",
 ]
 
 http_request_duration_seconds = Histogram(
@@ -58,6 +104,19 @@ llm_calls_total = Counter(
     ["provider", "model", "outcome"],
 )
 
+llm_time_to_first_token_seconds = Histogram(
+    "llm_time_to_first_token_seconds",
+    "Time from request dispatch to the first streamed content token",
+    ["provider", "model"],
+)
+
+llm_generation_tokens_per_second = Histogram(
+    "llm_generation_tokens_per_second",
+    "Streamed generation rate after the first token",
+    ["provider", "model"],
+    buckets=[1, 5, 10, 20, 40, 60, 80, 120, 200, 400],
+)
+
 consensus_duration_seconds = Histogram(
     "consensus_duration_seconds",
     "Duration of consensus computation in seconds",
@@ -159,6 +218,245 @@ provider_breaker_state = Gauge(
     ["model"],
 )
 
+provider_hedges_total = Counter(
+    "provider_hedges_total",
+    "Duplicate (hedged) provider calls fired after the latency percentile elapsed",
+    ["model"],
+)
+
+provider_hedge_wins_total = Counter(
+    "provider_hedge_wins_total",
+    "Which attempt of a hedged provider call answered first",
+    ["model", "winner"],
+)
+
+provider_retries_total = Counter(
+    "provider_retries_total",
+    "Provider calls retried after a retryable error",
+    ["model", "error_type"],
+)
+
+provider_cache_requests_total = Counter(
+    "provider_cache_requests_total",
+    "Provider response cache lookups",
+    ["outcome"],
+)
+
+provider_cache_evictions_total = Counter(
+    "provider_cache_evictions_total",
+    "Provider response cache evictions",
+    ["reason"],
+)
+
+provider_cache_bytes = Gauge(
+    "provider_cache_bytes",
+    "Approximate bytes held by the provider response cache",
+)
+
+provider_calls_coalesced_total = Counter(
+    "provider_calls_coalesced_total",
+    "Provider calls served by joining an identical call already in flight",
+    ["model"],
+)
+
+provider_fallbacks_total = Counter(
+    "provider_fallbacks_total",
+    "Calls served by a fallback model because the primary was breaker-open or rate-limited",
+    ["model", "fallback", "reason"],
+)
+
+provider_adaptive_timeout_ms = Gauge(
+    "provider_adaptive_timeout_ms",
+    "Current per-model provider timeout learned from live latency",
+    ["model"],
+)
+
+warmup_step_duration_seconds = Gauge(
+    "warmup_step_duration_seconds",
+    "Duration of the last warm-up run per step",
+    ["step"],
+)
+
+quorum_outcomes_total = Counter(
+    "quorum_outcomes_total",
+    "Quorum-mode runs by outcome (reached or not_reached)",
+    ["outcome"],
+)
+
+quorum_cancelled_calls_total = Counter(
+    "quorum_cancelled_calls_total",
+    "Provider calls cancelled because a quorum was already reached",
+    ["model"],
+)
+
+deadline_stage_skipped_total = Counter(
+    "deadline_stage_skipped_total",
+    "Optional pipeline stages skipped because the request budget was spent",
+    ["stage"],
+)
+
+provider_concurrency_limit = Gauge(
+    "provider_concurrency_limit",
+    "Current adaptive concurrency limit by model",
+    ["model"],
+)
+
+provider_concurrency_in_flight = Gauge(
+    "provider_concurrency_in_flight",
+    "Provider calls holding an adaptive concurrency slot by model",
+    ["model"],
+)
+
+provider_concurrency_wait_seconds = Histogram(
+    "provider_concurrency_wait_seconds",
+    "Time provider calls queued for an adaptive concurrency slot",
+    ["model"],
+    buckets=[0, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10],
+)
+
+provider_concurrency_rejections_total = Counter(
+    "provider_concurrency_rejections_total",
+    "Provider calls rejected locally because no concurrency slot freed up in time",
+    ["model"],
+)
+
+provider_bulkhead_in_flight = Gauge(
+    "provider_bulkhead_in_flight",
+    "Provider calls holding a bulkhead slot by provider",
+    ["provider"],
+)
+
+provider_bulkhead_queued = Gauge(
+    "provider_bulkhead_queued",
+    "Provider calls queued for a bulkhead slot by provider",
+    ["provider"],
+)
+
+provider_bulkhead_saturation = Gauge(
+    "provider_bulkhead_saturation",
+    "Share of a provider's bulkhead slots in use (0-1)",
+    ["provider"],
+)
+
+provider_bulkhead_rejections_total = Counter(
+    "provider_bulkhead_rejections_total",
+    "Provider calls rejected because the provider's bulkhead was full",
+    ["provider", "reason"],
+)
+
+admission_queue_depth = Gauge(
+    "admission_queue_depth",
+    "Requests waiting in the admission queue",
+)
+
+admission_running = Gauge(
+    "admission_running",
+    "Requests admitted and running",
+)
+
+admission_wait_seconds = Histogram(
+    "admission_wait_seconds",
+    "Time admitted requests waited in the admission queue",
+    buckets=[0, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+)
+
+admission_shed_total = Counter(
+    "admission_shed_total",
+    "Requests shed by admission control",
+    ["reason"],
+)
+
+request_duration_by_priority_seconds = Histogram(
+    "request_duration_by_priority_seconds",
+    "End-to-end consensus request latency by request priority",
+    ["priority", "outcome"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1, 2, 4, 8, 16, 32, 64],
+)
+
+tenant_queue_wait_seconds = Histogram(
+    "tenant_queue_wait_seconds",
+    "Time provider calls queued in the tenant fair queue (tenants outside the policy are 'other')",
+    ["tenant"],
+    buckets=[0, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+)
+
+tenant_calls_total = Counter(
+    "tenant_calls_total",
+    "Provider calls started through the tenant fair queue",
+    ["tenant"],
+)
+
+tenant_in_flight = Gauge(
+    "tenant_in_flight",
+    "Provider calls holding a tenant fair-queue slot",
+    ["tenant"],
+)
+
+scoring_queue_wait_seconds = Histogram(
+    "scoring_queue_wait_seconds",
+    "Time a response waited for a free scoring worker process",
+)
+
+scoring_execution_seconds = Histogram(
+    "scoring_execution_seconds",
+    "Time spent scoring one response",
+    ["mode"],
+)
+
+scoring_analyzer_seconds = Histogram(
+    "scoring_analyzer_seconds",
+    "Time one analyzer took on one response when analyzers are fanned out",
+    ["analyzer"],
+)
+
+scoring_timeouts_total = Counter(
+    "scoring_timeouts_total",
+    "Responses not scored within the scoring pool timeout",
+)
+
+scoring_pool_fallbacks_total = Counter(
+    "scoring_pool_fallbacks_total",
+    "Scoring runs done in-process because the worker pool was unavailable",
+    ["reason"],
+)
+
+scheduler_calls_in_flight = Gauge(
+    "scheduler_calls_in_flight",
+    "Provider calls currently holding a batch scheduler slot",
+)
+
+scheduler_wait_seconds = Histogram(
+    "scheduler_wait_seconds",
+    "Time provider calls queued for a batch scheduler slot",
+    ["provider"],
+    buckets=[0, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+)
+
+provider_rate_limit_wait_seconds = Histogram(
+    "provider_rate_limit_wait_seconds",
+    "Time provider calls queued in the client-side rate limiter",
+    ["provider"],
+    buckets=[0, 0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5],
+)
+
+provider_rate_limit_rejections_total = Counter(
+    "provider_rate_limit_rejections_total",
+    "Provider calls rejected locally because the rate limiter wait exceeded the budget",
+    ["provider"],
+)
+
+provider_rate_limit_throttles_total = Counter(
+    "provider_rate_limit_throttles_total",
+    "Provider 429 responses that paused and slowed the client-side rate limiter",
+    ["provider"],
+)
+
+provider_retry_exhausted_total = Counter(
+    "provider_retry_exhausted_total",
+    "Provider calls that still failed when retries stopped (max_attempts or deadline)",
+    ["model", "reason"],
+)
+
 provider_resolution_failures_total = Counter(
     "provider_resolution_failures_total",
     "Total provider resolution failures (unknown provider, unsupported model, etc.)",
@@ -201,6 +499,30 @@ preamble_usage_total = Counter(
     ["key", "outcome"],
 )
 
+http_client_created_total = Counter(
+    "http_client_created_total",
+    "Pooled HTTP clients created (stays flat once pools are warm)",
+    ["pool"],
+)
+
+http_pool_connections = Gauge(
+    "http_pool_connections",
+    "Connections held by a pooled HTTP client by state",
+    ["pool", "state"],
+)
+
+http_pool_max_connections = Gauge(
+    "http_pool_max_connections",
+    "Configured maximum connections for a pooled HTTP client",
+    ["pool"],
+)
+
+http_pool_requests_in_flight = Gauge(
+    "http_pool_requests_in_flight",
+    "Requests currently dispatched through a pooled HTTP client",
+    ["pool"],
+)
+
 
 def render_metrics() -> bytes:
     return generate_latest()
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque
+
+from src.policy.models import AdmissionConfig
+
+# Weight of the latest request duration in the service-time average used to predict waits.
+_SERVICE_ALPHA = 0.2
+
+
+@dataclass
+class _Ticket:
+    cost: int
+    start_by: float
+    waiter: asyncio.Future = field(repr=False)
+
+
+class AdmissionController:
+    """
+    Process-wide admission control in front of `Orchestrator.run`.
+
+    At most `max_concurrent` requests run; up to `max_queue` more wait in FIFO order, each
+    with its own deadline. A request is shed up front when the queue is full, when the
+    prompt memory it would add (prompt chars x models) exceeds the limit, or when the
+    predicted queue wait leaves less than `min_start_ms` of its budget; a queued request
+    whose budget runs out is shed before it has made any provider call.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self.running = 0
+        self.running_cost = 0
+        self.queued_cost = 0
+        self._queue: Deque[_Ticket] = deque()
+        self._service_s: float | None = None
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._queue)
+
+    def expected_wait_s(self, max_concurrent: int) -> float:
+        """Predicted wait of a request joining the queue now (0 until a request has finished)."""
+        if self._service_s is None:
+            return 0.0
+        return (len(self._queue) // max_concurrent + 1) * self._service_s
+
+    async def acquire(self, config: AdmissionConfig, cost: int, deadline_at: float) -> str | None:
+        """Admit one request; returns None once it may start, or the reason it was shed."""
+        now = self._clock()
+        start_by = deadline_at - config.min_start_ms / 1000
+        limit = config.max_inflight_prompt_chars
+        # A lone oversized request is still admitted; the limit only stops piling up.
+        if limit is not None and self.running and self.running_cost + self.queued_cost + cost > limit:
+            return "memory"
+        if self.running < config.max_concurrent and not self._queue:
+            self.running += 1
+            self.running_cost += cost
+            return None
+        if len(self._queue) >= config.max_queue:
+            return "queue_full"
+        if now + self.expected_wait_s(config.max_concurrent) > start_by:
+            return "deadline"
+
+        ticket = _Ticket(cost=cost, start_by=start_by, waiter=asyncio.get_running_loop().create_future())
+        self._queue.append(ticket)
+        self.queued_cost += cost
+        try:
+            await asyncio.wait_for(ticket.waiter, start_by - now)
+        except asyncio.TimeoutError:
+            return "expired"
+        except asyncio.CancelledError:
+            if ticket.waiter.done() and not ticket.waiter.cancelled():
+                # Admitted just as the caller went away: hand the slot on.
+                self.release(config, cost)
+            raise
+        finally:
+            if ticket in self._queue:
+                self._queue.remove(ticket)
+                self.queued_cost -= cost
+        return None
+
+    def release(self, config: AdmissionConfig, cost: int, service_s: float | None = None) -> None:
+        """Finish an admitted request and start queued ones while capacity allows."""
+        self.running -= 1
+        self.running_cost -= cost
+        if service_s is not None:
+            previous = self._service_s
+            self._service_s = service_s if previous is None else previous + _SERVICE_ALPHA * (service_s - previous)
+        now = self._clock()
+        while self.running < config.max_concurrent:
+            # Tickets already shed or past their start-by time leave through their own timeout.
+            ticket = next((t for t in self._queue if not t.waiter.done() and t.start_by > now), None)
+            if ticket is None:
+                break
+            self._queue.remove(ticket)
+            self.queued_cost -= ticket.cost
+            self.running += 1
+            self.running_cost += ticket.cost
+            ticket.waiter.set_result(None)
+
+    def reset(self) -> None:
+        self.running = self.running_cost = self.queued_cost = 0
+        self._queue.clear()
+        self._service_s = None
+
+
+_CONTROLLER = AdmissionController()
+
+
+def get_admission_controller() -> AdmissionController:
+    return _CONTROLLER
@@ -1,140 +1,386 @@
 from __future__ import annotations
 
 import asyncio
+import sqlite3
+import threading
 import time
-from typing import Callable, Dict, Literal, Tuple
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Literal, Protocol, Tuple, TypeVar
 
+from src.adapters.observability.logging import get_logger
 from src.policy.models import BreakerConfig
 
+logger = get_logger()
+
 BreakerState = Literal["closed", "open", "half_open"]
+T = TypeVar("T")
+
+
+@dataclass
+class BreakerRecord:
+    """Mutable state of one model's breaker, as kept by a `BreakerStore`."""
+
+    state: BreakerState = "closed"
+    failures: int = 0
+    opened_at: float | None = None
+    last_failure_at: float | None = None
+    # Start of the outstanding half-open probe; the probe token is a lease that lapses after
+    # open_ms so a worker dying mid-probe cannot keep the breaker half-open forever.
+    probe_at: float | None = None
+    # Outcomes of the most recent calls for slow-call mode, oldest first ("1" = slow).
+    slow_window: str = ""
+
+
+class BreakerStore(Protocol):
+    async def update(self, key: str, apply: Callable[[BreakerRecord], T]) -> T:
+        """Apply `apply` to the record of `key` atomically and persist the mutated record."""
+        ...
+
+    async def read(self, key: str) -> BreakerRecord:
+        """Snapshot of the record of `key`; never writes."""
+        ...
+
+
+class MemoryBreakerStore:
+    """Process-local records (the default); transitions run synchronously on the event loop."""
+
+    def __init__(self) -> None:
+        self._records: Dict[str, BreakerRecord] = {}
+
+    async def update(self, key: str, apply: Callable[[BreakerRecord], T]) -> T:
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = BreakerRecord()
+        return apply(record)
+
+    async def read(self, key: str) -> BreakerRecord:
+        record = self._records.get(key)
+        return replace(record) if record is not None else BreakerRecord()
+
+
+class SqliteBreakerStore:
+    """
+    Records in a SQLite file (WAL mode) shared by every worker process on the host.
+
+    Each transition is one `BEGIN IMMEDIATE` transaction, so failure counts, open/half-open
+    transitions and the half-open probe token are host-wide. Calls that leave the record
+    unchanged (an allowed call while closed, a state read) are answered from a plain read
+    on the event loop; only changes take the write lock, in a worker thread. When the file
+    cannot be used the call falls back to process-local state; a file that cannot be opened
+    at all is handled by `breaker_store_for`.
+    """
+
+    def __init__(self, path: str, *, busy_timeout_ms: int = 1000) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(
+            path, timeout=busy_timeout_ms / 1000, isolation_level=None, check_same_thread=False
+        )
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS breaker_state ("
+                "model TEXT PRIMARY KEY, state TEXT NOT NULL, failures INTEGER NOT NULL, "
+                "opened_at REAL, last_failure_at REAL, probe_at REAL, slow_window TEXT NOT NULL DEFAULT '')"
+            )
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+        self._lock = threading.Lock()
+        self._fallback = MemoryBreakerStore()
+
+    def _select(self, key: str) -> BreakerRecord:
+        row = self._conn.execute(
+            "SELECT state, failures, opened_at, last_failure_at, probe_at, slow_window "
+            "FROM breaker_state WHERE model = ?",
+            (key,),
+        ).fetchone()
+        return BreakerRecord(*row) if row else BreakerRecord()
+
+    def _read_sync(self, key: str) -> BreakerRecord:
+        with self._lock:
+            return self._select(key)
+
+    def _read_nowait(self, key: str) -> BreakerRecord | None:
+        """Record read on the calling thread, or None while a transaction holds the connection."""
+        if not self._lock.acquire(blocking=False):
+            return None
+        try:
+            # WAL readers do not wait for writers.
+            return self._select(key)
+        finally:
+            self._lock.release()
+
+    def _update_sync(self, key: str, apply: Callable[[BreakerRecord], T]) -> T:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                record = self._select(key)
+                before = replace(record)
+                result = apply(record)
+                if record != before:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO breaker_state "
+                        "(model, state, failures, opened_at, last_failure_at, probe_at, slow_window) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (
+                            key,
+                            record.state,
+                            record.failures,
+                            record.opened_at,
+                            record.last_failure_at,
+                            record.probe_at,
+                            record.slow_window,
+                        ),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            return result
+
+    async def update(self, key: str, apply: Callable[[BreakerRecord], T]) -> T:
+        try:
+            record = self._read_nowait(key)
+            if record is not None:
+                before = replace(record)
+                result = apply(record)
+                if record == before:
+                    return result
+            # A change (or a busy connection): re-apply to the current row under the write lock.
+            return await asyncio.to_thread(self._update_sync, key, apply)
+        except sqlite3.Error as exc:
+            logger.warning("breaker_store_unavailable", path=self.path, model=key, error=str(exc))
+            return await self._fallback.update(key, apply)
+
+    async def read(self, key: str) -> BreakerRecord:
+        try:
+            record = self._read_nowait(key)
+            return record if record is not None else await asyncio.to_thread(self._read_sync, key)
+        except sqlite3.Error as exc:
+            logger.warning("breaker_store_unavailable", path=self.path, model=key, error=str(exc))
+            return await self._fallback.read(key)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+_SQLITE_STORES: Dict[str, BreakerStore] = {}
+
+
+def breaker_store_for(config: BreakerConfig) -> BreakerStore:
+    """
+    Store selected by `config.backend`; SQLite stores are shared per path within a process.
+
+    A `state_path` that cannot be opened falls back to one process-local store for that path.
+    """
+    if config.backend == "sqlite":
+        assert config.state_path is not None  # enforced by BreakerConfig
+        store = _SQLITE_STORES.get(config.state_path)
+        if store is None:
+            try:
+                store = SqliteBreakerStore(config.state_path)
+            except sqlite3.Error as exc:
+                logger.warning("breaker_store_unavailable", path=config.state_path, error=str(exc))
+                store = MemoryBreakerStore()
+            _SQLITE_STORES[config.state_path] = store
+        return store
+    return MemoryBreakerStore()
 
 
 class CircuitBreaker:
     """
-    Minimal in-memory circuit breaker (per model) with decay and half-open probe.
+    Minimal circuit breaker (per model) with decay and half-open probe.
 
     States:
     - closed: calls flow; failures accumulate.
     - open: calls short-circuit until open_ms elapses.
     - half_open: one probe allowed; success -> closed, failure -> open.
+
+    With `config.slow_call` enabled, callers also report whether each call was slow; the
+    breaker opens once the slow share of the last `window_size` calls reaches
+    `rate_threshold` (after `min_calls`), and a slow half-open probe re-opens it.
+
+    State lives in a `BreakerStore` (process-local unless a shared store is passed).
     """
 
-    def __init__(self, config: BreakerConfig, clock: Callable[[], float] = time.monotonic):
+    def __init__(
+        self,
+        config: BreakerConfig,
+        clock: Callable[[], float] = time.monotonic,
+        *,
+        store: BreakerStore | None = None,
+        key: str = "default",
+    ):
         self.config = config
         self._clock = clock
-        self._state: BreakerState = "closed"
-        self._failures: int = 0
-        self._opened_at: float | None = None
-        self._last_failure_at: float | None = None
-        self._half_open_in_flight: bool = False
-        self._lock = asyncio.Lock()
+        self._store = store or MemoryBreakerStore()
+        self._key = key
 
     def _now(self) -> float:
         return self._clock()
 
-    def _reset_failures_if_decayed(self, now: float) -> None:
-        if self._last_failure_at is None:
+    def _reset_failures_if_decayed(self, record: BreakerRecord, now: float) -> None:
+        if record.last_failure_at is None:
             return
-        if (now - self._last_failure_at) * 1000 >= self.config.failure_decay_ms:
-            self._failures = 0
-            self._last_failure_at = None
+        if (now - record.last_failure_at) * 1000 >= self.config.failure_decay_ms:
+            record.failures = 0
+            record.last_failure_at = None
+
+    def _open(self, record: BreakerRecord, now: float) -> None:
+        record.state = "open"
+        record.opened_at = now
+        record.slow_window = ""
+
+    def _slow_rate_breached(self, record: BreakerRecord, slow: bool) -> bool:
+        """Push one outcome into the slow-call window; True once the slow ratio is breached."""
+        cfg = self.config.slow_call
+        if not cfg.enabled:
+            return False
+        window = (record.slow_window + ("1" if slow else "0"))[-cfg.window_size :]
+        record.slow_window = window
+        if len(window) < cfg.min_calls:
+            return False
+        return window.count("1") / len(window) >= cfg.rate_threshold
 
     async def should_allow(self) -> Tuple[bool, BreakerState]:
         if not self.config.enabled:
             return True, "closed"
 
-        async with self._lock:
-            now = self._now()
-            self._reset_failures_if_decayed(now)
+        now = self._now()
 
-            if self._state == "open":
-                assert self._opened_at is not None  # defensive
-                if (now - self._opened_at) * 1000 >= self.config.open_ms:
+        def allow(record: BreakerRecord) -> Tuple[bool, BreakerState]:
+            self._reset_failures_if_decayed(record, now)
+
+            if record.state == "open":
+                assert record.opened_at is not None  # defensive
+                if (now - record.opened_at) * 1000 >= self.config.open_ms:
                     # Move to half-open and allow one probe
-                    self._state = "half_open"
-                    self._half_open_in_flight = False
+                    record.state = "half_open"
+                    record.probe_at = None
                 else:
                     return False, "open"
 
-            if self._state == "half_open":
-                if self._half_open_in_flight:
+            if record.state == "half_open":
+                if record.probe_at is not None and (now - record.probe_at) * 1000 < self.config.open_ms:
                     return False, "half_open"
-                self._half_open_in_flight = True
+                record.probe_at = now
                 return True, "half_open"
 
             # closed
             return True, "closed"
 
-    async def record_success(self) -> BreakerState:
+        return await self._store.update(self._key, allow)
+
+    async def record_success(self, slow: bool = False) -> BreakerState:
+        """Record a successful call; returns "open" when it tripped the slow-call ratio."""
         if not self.config.enabled:
             return "closed"
 
-        async with self._lock:
-            self._failures = 0
-            self._last_failure_at = None
-            self._half_open_in_flight = False
-            self._state = "closed"
-            self._opened_at = None
-            return self._state
+        now = self._now()
+
+        def success(record: BreakerRecord) -> BreakerState:
+            breached = self._slow_rate_breached(record, slow)
+            if breached or (slow and self.config.slow_call.enabled and record.state == "half_open"):
+                record.probe_at = None
+                self._open(record, now)
+                return record.state
+            record.failures = 0
+            record.last_failure_at = None
+            record.probe_at = None
+            record.state = "closed"
+            record.opened_at = None
+            return record.state
 
-    async def record_failure(self) -> Tuple[bool, BreakerState]:
+        return await self._store.update(self._key, success)
+
+    async def record_failure(self, slow: bool = False) -> Tuple[bool, BreakerState]:
         """
-        Returns tuple (opened_now, state_after).
+        Returns tuple (opened_now, state_after). `slow` marks failures such as timeouts that
+        also count towards the slow-call ratio.
         """
         if not self.config.enabled:
             return False, "closed"
 
-        async with self._lock:
-            now = self._now()
-            self._reset_failures_if_decayed(now)
+        now = self._now()
+
+        def failure(record: BreakerRecord) -> Tuple[bool, BreakerState]:
+            self._reset_failures_if_decayed(record, now)
+            breached = self._slow_rate_breached(record, slow)
 
-            self._failures += 1
-            self._last_failure_at = now
-            self._half_open_in_flight = False
+            record.failures += 1
+            record.last_failure_at = now
+            record.probe_at = None
 
             opened_now = False
-            if self._failures >= self.config.failure_threshold:
-                self._state = "open"
-                self._opened_at = now
-                opened_now = True
-            elif self._state == "half_open":
+            if record.state == "open":
+                # another worker already opened it; keep the original open window
+                pass
+            elif record.failures >= self.config.failure_threshold or record.state == "half_open" or breached:
                 # any failure in half-open re-opens immediately
-                self._state = "open"
-                self._opened_at = now
+                self._open(record, now)
                 opened_now = True
             else:
-                self._state = "closed"
+                record.state = "closed"
+
+            return opened_now, record.state
 
-            return opened_now, self._state
+        return await self._store.update(self._key, failure)
+
+    async def release(self) -> BreakerState:
+        """Forget an allowed call that never reached the provider (frees a half-open probe slot)."""
+        if not self.config.enabled:
+            return "closed"
+
+        def release(record: BreakerRecord) -> BreakerState:
+            record.probe_at = None
+            return record.state
+
+        return await self._store.update(self._key, release)
 
     async def state(self) -> BreakerState:
         if not self.config.enabled:
             return "closed"
-        async with self._lock:
-            return self._state
+        return (await self._store.read(self._key)).state
 
 
 class BreakerManager:
-    """Per-model breaker registry."""
+    """
+    Per-model breaker registry.
 
-    def __init__(self, config: BreakerConfig, clock: Callable[[], float] = time.monotonic):
+    A shared backend records wall-clock timestamps (monotonic clocks are not comparable
+    across reboots, and the SQLite file outlives the process).
+    """
+
+    def __init__(
+        self,
+        config: BreakerConfig,
+        clock: Callable[[], float] | None = None,
+        store: BreakerStore | None = None,
+    ):
         self.config = config
+        self.store = store or breaker_store_for(config)
+        if clock is None:
+            clock = time.monotonic if isinstance(self.store, MemoryBreakerStore) else time.time
         self._clock = clock
         self._breakers: Dict[str, CircuitBreaker] = {}
 
     def _get(self, model: str) -> CircuitBreaker:
         if model not in self._breakers:
-            self._breakers[model] = CircuitBreaker(self.config, self._clock)
+            self._breakers[model] = CircuitBreaker(self.config, self._clock, store=self.store, key=model)
         return self._breakers[model]
 
     async def should_allow(self, model: str) -> Tuple[bool, BreakerState]:
         return await self._get(model).should_allow()
 
-    async def record_success(self, model: str) -> BreakerState:
-        return await self._get(model).record_success()
+    async def record_success(self, model: str, slow: bool = False) -> BreakerState:
+        return await self._get(model).record_success(slow)
+
+    async def record_failure(self, model: str, slow: bool = False) -> Tuple[bool, BreakerState]:
+        return await self._get(model).record_failure(slow)
 
-    async def record_failure(self, model: str) -> Tuple[bool, BreakerState]:
-        return await self._get(model).record_failure()
+    async def release(self, model: str) -> BreakerState:
+        return await self._get(model).release()
 
     async def state(self, model: str) -> BreakerState:
         return await self._get(model).state()
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Dict
+
+from src.policy.models import BulkheadConfig, BulkheadRule
+
+# Error message for calls rejected because their provider's bulkhead was full; these
+# never reached the provider.
+BULKHEAD_FULL = "provider_bulkhead_full"
+
+
+class Bulkhead:
+    """
+    In-flight and queue bound of one provider.
+
+    At most `max_in_flight` calls run and at most `max_queue` wait behind them; anything
+    beyond is rejected immediately, so a degraded provider cannot hold every task slot of
+    the process while healthy providers starve.
+    """
+
+    def __init__(self, rule: BulkheadRule) -> None:
+        self.rule = rule
+        self.in_flight = 0
+        self.queued = 0
+        self._slots = asyncio.Semaphore(rule.max_in_flight)
+
+    @property
+    def saturation(self) -> float:
+        return self.in_flight / self.rule.max_in_flight
+
+    async def acquire(self, max_wait_s: float | None) -> str | None:
+        """Take a slot; returns None on success or the rejection reason ("full", "queue_timeout")."""
+        if self.in_flight < self.rule.max_in_flight and not self.queued:
+            await self._slots.acquire()  # a slot is free: returns without suspending
+            self.in_flight += 1
+            return None
+        if self.queued >= self.rule.max_queue:
+            return "full"
+        self.queued += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), max_wait_s)
+        except asyncio.TimeoutError:
+            return "queue_timeout"
+        finally:
+            self.queued -= 1
+        self.in_flight += 1
+        return None
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._slots.release()
+
+
+class BulkheadRegistry:
+    """Process-wide bulkheads keyed by provider name."""
+
+    def __init__(self) -> None:
+        self._bulkheads: Dict[str, Bulkhead] = {}
+
+    def get(self, provider: str, config: BulkheadConfig) -> Bulkhead | None:
+        rule = config.providers.get(provider, config.default)
+        if rule is None:
+            return None
+        bulkhead = self._bulkheads.get(provider)
+        if bulkhead is None or bulkhead.rule != rule:
+            # New provider or the policy changed; calls in flight release the old bulkhead.
+            bulkhead = self._bulkheads[provider] = Bulkhead(rule)
+        return bulkhead
+
+    def reset(self) -> None:
+        self._bulkheads.clear()
+
+
+_BULKHEADS = BulkheadRegistry()
+
+
+def get_bulkheads() -> BulkheadRegistry:
+    return _BULKHEADS
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict
+
+from src.adapters.observability.logging import get_logger
+from src.adapters.observability.metrics import provider_cache_bytes, provider_cache_evictions_total
+from src.adapters.orchestration.models import ProviderResult
+
+logger = get_logger()
+
+# Rough per-entry bookkeeping cost added to the payload size.
+_ENTRY_OVERHEAD_BYTES = 256
+
+
+def _digest(value: str | None) -> str | None:
+    if value is None:
+        return None
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def cache_key(
+    provider: str,
+    model: str,
+    system_preamble: str | None,
+    prompt: str,
+    params: Dict[str, Any] | None = None,
+) -> str:
+    """Fingerprint of everything that shapes a provider answer."""
+    payload = {
+        "provider": provider,
+        "model": model,
+        "preamble": _digest(system_preamble),
+        "prompt": _digest(prompt),
+        "params": params or {},
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _Entry:
+    result: ProviderResult
+    expires_at: float
+    size: int
+
+
+class ResponseCache:
+    """
+    Process-wide LRU cache of successful provider results, bounded by bytes, with TTL.
+
+    Only successful results are stored. Reads return a copy marked `cached=True`.
+    """
+
+    def __init__(self, max_bytes: int, clock: Callable[[], float] = time.monotonic) -> None:
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _drop(self, key: str, reason: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        try:
+            provider_cache_evictions_total.labels(reason=reason).inc()
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="provider_cache_evictions_total", reason=reason)
+
+    def _record_size(self) -> None:
+        try:
+            provider_cache_bytes.set(self._bytes)
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="provider_cache_bytes")
+
+    def get(self, key: str) -> ProviderResult | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= self._clock():
+                self._drop(key, "expired")
+                self._record_size()
+                return None
+            self._entries.move_to_end(key)
+            return replace(entry.result, cached=True, latency_ms=0, hedged=False, attempts=1)
+
+    def put(self, key: str, result: ProviderResult, ttl_s: float) -> bool:
+        if result.error is not None or result.content is None or ttl_s <= 0:
+            return False
+        size = len(result.content.encode("utf-8")) + len(key) + _ENTRY_OVERHEAD_BYTES
+        with self._lock:
+            if size > self.max_bytes:
+                return False
+            if key in self._entries:
+                self._drop(key, "replaced")
+            while self._entries and self._bytes + size > self.max_bytes:
+                self._drop(next(iter(self._entries)), "lru")
+            self._entries[key] = _Entry(
+                result=replace(result, breaker_state=None), expires_at=self._clock() + ttl_s, size=size
+            )
+            self._bytes += size
+            self._record_size()
+            return True
+
+    def resize(self, max_bytes: int) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            while self._entries and self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)), "lru")
+            self._record_size()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self._record_size()
+
+
+_CACHE = ResponseCache(max_bytes=32 * 1024 * 1024)
+
+
+def get_response_cache() -> ResponseCache:
+    return _CACHE
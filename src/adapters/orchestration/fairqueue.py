@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict
+
+from src.adapters.observability.logging import get_logger
+from src.adapters.observability.metrics import tenant_calls_total, tenant_in_flight, tenant_queue_wait_seconds
+from src.policy.models import TenantFairnessConfig
+
+logger = get_logger()
+
+DEFAULT_TENANT = "default"
+
+# Tenant of the request whose provider calls run in the current task; set by `Orchestrator.run`.
+request_tenant: ContextVar[str | None] = ContextVar("request_tenant", default=None)
+
+
+@dataclass
+class _TenantQueue:
+    waiters: Deque[asyncio.Future] = field(default_factory=deque)
+    in_flight: int = 0
+    deficit: int = 0
+    in_turn: bool = False
+
+    def prune(self) -> None:
+        while self.waiters and self.waiters[0].done():
+            self.waiters.popleft()
+
+
+class FairQueue:
+    """
+    Process-wide deficit-round-robin queue for provider-call slots shared by tenants.
+
+    While the `max_in_flight` slots are contended, each tenant with queued calls gets
+    `weight` calls per round in turn, and never more than its own in-flight cap, so one
+    tenant's batch job cannot take every slot. Uncontended calls start immediately.
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self._tenants: Dict[str, _TenantQueue] = {}
+        self._active: Deque[str] = deque()
+
+    def _queue(self, tenant: str) -> _TenantQueue:
+        queue = self._tenants.get(tenant)
+        if queue is None:
+            queue = self._tenants[tenant] = _TenantQueue()
+        return queue
+
+    @staticmethod
+    def _limit(tenant: str, config: TenantFairnessConfig) -> int | None:
+        return config.tenant_max_in_flight.get(tenant, config.default_tenant_max_in_flight)
+
+    def _next(self, config: TenantFairnessConfig) -> _TenantQueue | None:
+        """Tenant queue whose head call should get the next free slot (DRR, unit cost per call)."""
+        for _ in range(2 * len(self._active) + 1):
+            if not self._active:
+                return None
+            tenant = self._active[0]
+            queue = self._tenants[tenant]
+            queue.prune()
+            if not queue.waiters:
+                self._active.popleft()
+                queue.deficit, queue.in_turn = 0, False
+                self._forget_if_idle(tenant)
+                continue
+            limit = self._limit(tenant, config)
+            if limit is not None and queue.in_flight >= limit:
+                queue.in_turn = False
+                self._active.rotate(-1)
+                continue
+            if not queue.in_turn:
+                queue.deficit += config.weights.get(tenant, config.default_weight)
+                queue.in_turn = True
+            if queue.deficit >= 1:
+                queue.deficit -= 1
+                return queue
+            queue.in_turn = False
+            self._active.rotate(-1)
+        return None
+
+    def _dispatch(self, config: TenantFairnessConfig) -> None:
+        while self.in_flight < config.max_in_flight:
+            queue = self._next(config)
+            if queue is None:
+                return
+            queue.in_flight += 1
+            self.in_flight += 1
+            queue.waiters.popleft().set_result(None)
+
+    async def acquire(self, tenant: str, config: TenantFairnessConfig) -> None:
+        queue = self._queue(tenant)
+        waiter = asyncio.get_running_loop().create_future()
+        queue.waiters.append(waiter)
+        if tenant not in self._active:
+            self._active.append(tenant)
+        self._dispatch(config)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as the caller went away: hand the slot on.
+                self.release(tenant, config)
+            elif self._tenants.get(tenant) is queue:
+                # Cancelled while queued: drop the waiter, and the tenant if that was its last call.
+                if waiter in queue.waiters:
+                    queue.waiters.remove(waiter)
+                if not queue.waiters and tenant in self._active:
+                    self._active.remove(tenant)
+                    queue.deficit, queue.in_turn = 0, False
+                self._forget_if_idle(tenant)
+            raise
+
+    def release(self, tenant: str, config: TenantFairnessConfig) -> None:
+        queue = self._tenants[tenant]
+        queue.in_flight -= 1
+        self.in_flight -= 1
+        self._dispatch(config)
+        self._forget_if_idle(tenant)
+
+    def _forget_if_idle(self, tenant: str) -> None:
+        queue = self._tenants.get(tenant)
+        if queue is not None and not queue.in_flight and not queue.waiters and tenant not in self._active:
+            # Forget idle tenants so arbitrary tenant keys do not accumulate.
+            del self._tenants[tenant]
+
+    def in_flight_of(self, tenant: str) -> int:
+        queue = self._tenants.get(tenant)
+        return queue.in_flight if queue is not None else 0
+
+    @asynccontextmanager
+    async def slot(self, config: TenantFairnessConfig, tenant: str | None = None) -> AsyncIterator[None]:
+        """Hold one slot for `tenant` (default: the current request's tenant)."""
+        tenant = tenant or request_tenant.get() or DEFAULT_TENANT
+        label = tenant_label(tenant, config)
+        started = time.perf_counter()
+        await self.acquire(tenant, config)
+        try:
+            tenant_queue_wait_seconds.labels(tenant=label).observe(time.perf_counter() - started)
+            tenant_calls_total.labels(tenant=label).inc()
+            tenant_in_flight.labels(tenant=label).set(self.in_flight_of(tenant))
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="tenant_queue_wait_seconds", tenant=label)
+        try:
+            yield
+        finally:
+            self.release(tenant, config)
+            try:
+                tenant_in_flight.labels(tenant=label).set(self.in_flight_of(tenant))
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="tenant_in_flight", tenant=label)
+
+    def reset(self) -> None:
+        self.in_flight = 0
+        self._tenants.clear()
+        self._active.clear()
+
+
+def tenant_label(tenant: str, config: TenantFairnessConfig) -> str:
+    """Metric label: tenants named in the policy keep their name, every other one is "other"."""
+    if tenant == DEFAULT_TENANT or tenant in config.weights or tenant in config.tenant_max_in_flight:
+        return tenant
+    return "other"
+
+
+_FAIR_QUEUE = FairQueue()
+
+
+def get_fair_queue() -> FairQueue:
+    return _FAIR_QUEUE
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Literal
+
+from src.adapters.orchestration.models import ProviderResult
+
+HedgeWinner = Literal["primary", "hedge"]
+
+
+async def hedged_call(
+    call: Callable[[], Awaitable[ProviderResult]],
+    delay_ms: int,
+    hedge: Callable[[], Awaitable[ProviderResult | None]] | None = None,
+) -> tuple[ProviderResult, HedgeWinner | None]:
+    """
+    Run `call`, firing one duplicate if it has not finished after `delay_ms`.
+
+    The first successful result wins and the other attempt is cancelled. When both
+    attempts fail, the first failure is returned. The second tuple element names the
+    winning attempt, or is None when no hedge was fired.
+
+    `hedge` runs the duplicate instead of `call`; it may return None when the duplicate
+    could not be sent (e.g. no rate-limit token), and the primary then runs on alone.
+    """
+    primary = asyncio.ensure_future(call())
+    labels: dict[asyncio.Future, HedgeWinner] = {primary: "primary"}
+    pending = {primary}
+    fallback: tuple[ProviderResult, HedgeWinner] | None = None
+    first_exc: BaseException | None = None
+    try:
+        done, pending = await asyncio.wait(pending, timeout=max(delay_ms, 0) / 1000)
+        if done:
+            return primary.result(), None
+
+        duplicate = asyncio.ensure_future((hedge or call)())
+        labels[duplicate] = "hedge"
+        pending = {primary, duplicate}
+        fired = True
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=lambda t: labels[t] != "primary"):
+                exc = task.exception()
+                if exc is not None:
+                    first_exc = first_exc or exc
+                    continue
+                result = task.result()
+                if result is None:
+                    fired = False
+                    continue
+                if result.error is None:
+                    return result, labels[task] if fired else None
+                fallback = fallback or (result, labels[task])
+    finally:
+        # Cancel the loser (or both attempts when the caller itself is cancelled).
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    if fallback is not None:
+        return fallback[0], fallback[1] if fired else None
+    assert first_exc is not None  # both attempts raised
+    raise first_exc
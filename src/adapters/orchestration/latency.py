@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import threading
+from math import ceil, log
+from typing import Dict, List
+
+
+class QuantileSketch:
+    """
+    Streaming latency quantile sketch with bounded memory.
+
+    Samples are buffered exactly until `buffer_size` is reached, then folded into
+    logarithmic buckets whose estimates are within `relative_accuracy` of the true value,
+    so memory stays at a few hundred buckets regardless of traffic. Once more than
+    `window` samples have been folded in, older mass is scaled down so the sketch follows
+    live behaviour instead of the whole process history.
+    """
+
+    def __init__(self, window: int = 512, relative_accuracy: float = 0.01, buffer_size: int = 64) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0,1)")
+        self.window = window
+        self.buffer_size = max(1, min(buffer_size, window))
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = log(self._gamma)
+        self._buckets: Dict[int, float] = {}
+        self._zero = 0.0
+        self._total = 0.0
+        self._buffer: List[float] = []
+
+    def count(self) -> int:
+        return int(round(self._total)) + len(self._buffer)
+
+    def add(self, value: float) -> None:
+        self._buffer.append(value)
+        if len(self._buffer) >= self.buffer_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        for value in self._buffer:
+            if value <= 0:
+                self._zero += 1
+            else:
+                index = ceil(log(value) / self._log_gamma)
+                self._buckets[index] = self._buckets.get(index, 0.0) + 1
+            self._total += 1
+        self._buffer.clear()
+        if self._total > self.window:
+            scale = self.window / self._total
+            self._zero *= scale
+            self._buckets = {i: c * scale for i, c in self._buckets.items() if c * scale >= 0.01}
+            self._total = self._zero + sum(self._buckets.values())
+
+    def quantile(self, q: float) -> float | None:
+        if not self._buckets and not self._zero:
+            if not self._buffer:
+                return None
+            # Exact until the first flush; same nearest-rank rule as the offline tuner.
+            values = sorted(self._buffer)
+            return values[ceil(q * (len(values) - 1))]
+        if self._buffer:
+            self._flush()
+        rank = q * self._total
+        seen = self._zero
+        if rank <= seen:
+            return 0.0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return 2 * self._gamma**index / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
+
+
+class LatencyTracker:
+    """
+    Process-wide streaming latency sketch per model.
+
+    Orchestrator instances are short-lived (one per request), so latency history lives
+    at module level and is shared by every request in the process.
+    """
+
+    def __init__(self, window: int = 512) -> None:
+        self.window = window
+        self._sketches: Dict[str, QuantileSketch] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, model: str, latency_ms: float | None) -> None:
+        if latency_ms is None or latency_ms < 0:
+            return
+        with self._lock:
+            sketch = self._sketches.get(model)
+            if sketch is None:
+                sketch = QuantileSketch(window=self.window)
+                self._sketches[model] = sketch
+            sketch.add(float(latency_ms))
+
+    def count(self, model: str) -> int:
+        with self._lock:
+            sketch = self._sketches.get(model)
+            return sketch.count() if sketch is not None else 0
+
+    def quantile(self, model: str, q: float, min_samples: int = 1) -> float | None:
+        """Return the q-quantile latency for `model`, or None below `min_samples`."""
+        if not 0 < q <= 1:
+            raise ValueError("quantile must be in (0,1]")
+        with self._lock:
+            sketch = self._sketches.get(model)
+            if sketch is None or sketch.count() < max(min_samples, 1):
+                return None
+            return sketch.quantile(q)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._sketches.clear()
+
+
+_TRACKER = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    return _TRACKER
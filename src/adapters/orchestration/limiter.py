@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from collections import deque
+from typing import Deque, Dict
+
+from src.policy.models import ConcurrencyLimitConfig
+
+
+class AimdLimit:
+    """
+    Concurrency limit of one model, adjusted by additive increase / multiplicative decrease.
+
+    Each successful call that found the limit well used grows it by 1/limit (about +1 per
+    round of `limit` calls); each overload signal (timeout, provider 429, latency far above
+    the model's baseline) multiplies it by `backoff_ratio`. Calls beyond the limit queue FIFO.
+    """
+
+    def __init__(self, config: ConcurrencyLimitConfig) -> None:
+        self.config = config
+        self.limit = float(min(max(config.initial_limit, config.min_limit), config.max_limit))
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @property
+    def capacity(self) -> int:
+        return max(self.config.min_limit, math.floor(self.limit))
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < self.capacity:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def adjust(self, overloaded: bool, in_flight: int) -> None:
+        cfg = self.config
+        if overloaded:
+            self.limit = max(float(cfg.min_limit), self.limit * cfg.backoff_ratio)
+        elif in_flight * 2 >= self.capacity:
+            # Only grow when the limit was actually being used; idle models keep theirs.
+            self.limit = min(float(cfg.max_limit), self.limit + 1 / self.limit)
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self._wake()
+
+
+class AdaptiveLimiter:
+    """
+    Process-wide adaptive concurrency limits keyed by model.
+
+    Unlike the per-request semaphore, the limit is shared by every request of the process and
+    converges on the concurrency the provider sustains without queueing or throttling.
+    """
+
+    def __init__(self) -> None:
+        self._limits: Dict[str, AimdLimit] = {}
+
+    def get(self, key: str, config: ConcurrencyLimitConfig) -> AimdLimit:
+        state = self._limits.get(key)
+        if state is None or state.config != config:
+            # New key or the policy changed: restart from the configured initial limit.
+            previous = state
+            state = AimdLimit(config)
+            if previous is not None:
+                state.in_flight = previous.in_flight
+                state._waiters = previous._waiters
+            self._limits[key] = state
+        return state
+
+    async def acquire(self, key: str, config: ConcurrencyLimitConfig, max_wait_s: float) -> float | None:
+        """Take one slot; returns the time waited in seconds, or None when none freed up in time."""
+        state = self.get(key, config)
+        if state.in_flight < state.capacity and not state.queued:
+            state.in_flight += 1
+            return 0.0
+        if max_wait_s <= 0:
+            return None
+        loop = asyncio.get_running_loop()
+        waiter = loop.create_future()
+        state._waiters.append(waiter)
+        started = loop.time()
+        try:
+            await asyncio.wait_for(waiter, max_wait_s)
+        except asyncio.TimeoutError:
+            return None
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as the caller went away: pass the slot on.
+                state.release()
+            raise
+        return loop.time() - started
+
+    def release(self, key: str, overloaded: bool | None) -> AimdLimit:
+        """Return a slot; `overloaded` adjusts the limit (None leaves it unchanged)."""
+        state = self._limits[key]
+        if overloaded is not None:
+            state.adjust(overloaded, state.in_flight)
+        state.release()
+        return state
+
+    def reset(self) -> None:
+        self._limits.clear()
+
+
+_LIMITER = AdaptiveLimiter()
+
+
+def get_adaptive_limiter() -> AdaptiveLimiter:
+    return _LIMITER
@@ -7,7 +7,29 @@ from src.contracts.errors import ErrorEnvelope
 from src.contracts.response import ModelResponse
 from src.contracts.run_event import RunEvent
 from src.errors import LcsError
-from src.errors import LcsError
+
+
+@dataclass(frozen=True)
+class ProviderCall:
+    """
+    One logical provider call as it travels down the orchestrator's fetch layers.
+
+    Layers that change it (fallback model, clamped timeout) derive a copy with
+    `dataclasses.replace` instead of re-threading every argument.
+    """
+
+    prompt: str
+    model: str
+    request_id: str
+    normalize_output: bool
+    system_preamble: str | None = None
+    include_scores: bool = False
+    provider_timeout_ms: int | None = None
+    provider_overrides: dict[str, str] | None = None
+    stream: bool = False
+    deadline_at: float | None = None
+    seed: int | None = None
+    cache_bypass: bool = False
 
 
 @dataclass
@@ -18,6 +40,13 @@ class ProviderResult:
     provider: str = "openrouter"
     error: ErrorEnvelope | None = None
     breaker_state: str | None = None
+    ttft_ms: int | None = None
+    completion_tokens: int | None = None
+    tokens_per_second: float | None = None
+    hedged: bool = False
+    attempts: int = 1
+    cached: bool = False
+    fallback_for: str | None = None
 
     def to_contract(self) -> ModelResponse:
         return ModelResponse(
@@ -27,6 +56,13 @@ class ProviderResult:
             latency_ms=self.latency_ms,
             error=self.error,
             breaker_state=self.breaker_state,
+            ttft_ms=self.ttft_ms,
+            completion_tokens=self.completion_tokens,
+            tokens_per_second=self.tokens_per_second,
+            hedged=self.hedged,
+            attempts=self.attempts,
+            cached=self.cached,
+            fallback_for=self.fallback_for,
         )
 
 
@@ -85,7 +121,7 @@ def build_run_event(
 
     provider_avg = None
     if responses:
-        latencies = [r.latency_ms for r in responses if r.latency_ms is not None]
+        latencies = [r.latency_ms for r in responses if r.latency_ms is not None and not r.cached]
         if latencies:
             provider_avg = int(sum(latencies) / len(latencies))
 
@@ -121,38 +157,46 @@ def _derive_outcome(*, gated: bool | None, error_type: str | None) -> str:
     return "success"
 
 
+def resolve_system_preamble(
+    normalize_output: bool, include_scores: bool, system_preamble: str | None = None
+) -> str | None:
+    """Preamble actually sent to the provider: the one selected upstream, else the mode default."""
+    from src.adapters.providers.openrouter import STRUCTURED_PREAMBLE, get_python_code_format_preamble
+
+    if system_preamble is not None:
+        return system_preamble
+    if normalize_output:
+        return STRUCTURED_PREAMBLE
+    if include_scores:
+        return get_python_code_format_preamble()
+    return None
+
+
 async def fetch_provider_result(
     prompt: str,
     model: str,
     request_id: str,
     normalize_output: bool,
-    preamble_key: str | None,
+    preamble_key: str | None = None,
     include_scores: bool = False,
     provider_timeout_ms: int | None = None,
     provider_overrides: dict[str, str] | None = None,
+    system_preamble: str | None = None,
+    stream: bool = False,
 ) -> ProviderResult:
     # Lazy imports to avoid import cycles with provider registry
-    from src.adapters.providers import registry
-    from src.adapters.providers.openrouter import (
-        STRUCTURED_PREAMBLE,
-        get_python_code_format_preamble,
-        register_default_openrouter,
-    )
+    from src.adapters.providers.openrouter import register_default_openrouter
+    from src.adapters.providers.routing import get_routing_table
     from src.adapters.observability.metrics import provider_resolution_failures_total
 
-    # Determine preamble once per call
-    system_preamble = None
-    if normalize_output:
-        # Preamble selected upstream; fallback to structured if missing
-        system_preamble = STRUCTURED_PREAMBLE
-    elif include_scores:
-        system_preamble = get_python_code_format_preamble()
+    # Determine preamble once per call; a preamble selected upstream takes precedence.
+    system_preamble = resolve_system_preamble(normalize_output, include_scores, system_preamble)
 
     register_default_openrouter()
 
-    provider_name_override = provider_overrides.get(model) if provider_overrides else None
     try:
-        provider, stripped_model = registry.resolve_provider(model, override_name=provider_name_override)
+        route = get_routing_table(provider_overrides).resolve(model)
+        provider, stripped_model = route.provider, route.stripped_model
     except Exception as exc:
         reason = "unknown"
         if isinstance(exc, LcsError):
@@ -169,13 +213,10 @@ async def fetch_provider_result(
             provider="unknown",
         )
 
-    result = await provider.call(
-        prompt,
-        stripped_model,
-        request_id,
-        system_preamble=system_preamble,
-        provider_timeout_ms=provider_timeout_ms,
-    )
+    call_kwargs = {"system_preamble": system_preamble, "provider_timeout_ms": provider_timeout_ms}
+    if stream:
+        call_kwargs["stream"] = True
+    result = await provider.call(prompt, stripped_model, request_id, **call_kwargs)
     # Ensure the returned ProviderResult reports the normalized model name
     result.model = stripped_model
     result.provider = getattr(provider, "name", None)
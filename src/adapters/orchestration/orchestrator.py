@@ -3,7 +3,9 @@ from __future__ import annotations
 import asyncio
 import time
 import random
-from typing import Iterable, Callable, Awaitable, Any
+from contextlib import nullcontext
+from dataclasses import replace
+from typing import Iterable, Callable, Awaitable, Any, Collection
 
 from opentelemetry import trace
 
@@ -12,15 +14,41 @@ from src.contracts.errors import ErrorEnvelope
 from src.contracts.request import ConsensusRequest
 from src.contracts.response import ConsensusResult, Timing, CostSummary, LatencySummary, ModelResponse, RedactionSummary, RedactionEntry
 from src.contracts.early_stop import EarlyStopReport
+from src.contracts.quorum import QuorumConfig, QuorumReport
 from src.adapters.observability.logging import get_logger
 from src.adapters.observability.metrics import (
     consensus_duration_seconds,
     llm_call_duration_seconds,
     llm_calls_total,
+    llm_generation_tokens_per_second,
+    llm_time_to_first_token_seconds,
     quality_score,
     quality_score_stats,
     provider_breaker_open_total,
     provider_breaker_state,
+    request_duration_by_priority_seconds,
+    provider_bulkhead_in_flight,
+    provider_bulkhead_queued,
+    provider_bulkhead_rejections_total,
+    provider_bulkhead_saturation,
+    provider_concurrency_in_flight,
+    provider_concurrency_limit,
+    provider_concurrency_rejections_total,
+    provider_concurrency_wait_seconds,
+    provider_hedges_total,
+    provider_hedge_wins_total,
+    provider_rate_limit_rejections_total,
+    provider_rate_limit_throttles_total,
+    provider_rate_limit_wait_seconds,
+    provider_cache_requests_total,
+    provider_calls_coalesced_total,
+    provider_fallbacks_total,
+    provider_adaptive_timeout_ms,
+    deadline_stage_skipped_total,
+    quorum_outcomes_total,
+    quorum_cancelled_calls_total,
+    provider_retries_total,
+    provider_retry_exhausted_total,
     run_event_callback_total,
     run_event_callback_duration_seconds,
     run_events_total,
@@ -36,12 +64,28 @@ from src.adapters.observability.metrics import (
     gate_decisions_total,
 )
 from src.adapters.orchestration.models import (
+    ProviderCall,
     ProviderResult,
     build_model_responses,
     fetch_provider_result,
     build_run_event,
+    resolve_system_preamble,
 )
-from src.adapters.orchestration.timeouts import enforce_timeout
+from src.adapters.orchestration.timeouts import Deadline, clamp_to_deadline, enforce_timeout
+from src.adapters.orchestration.hedging import hedged_call
+from src.adapters.orchestration.latency import get_latency_tracker
+from src.adapters.orchestration.retry import call_with_retries
+from src.adapters.orchestration.cache import cache_key, get_response_cache
+from src.adapters.orchestration.singleflight import get_single_flight
+from src.adapters.orchestration.bulkhead import BULKHEAD_FULL, Bulkhead, get_bulkheads
+from src.adapters.orchestration.fairqueue import get_fair_queue, request_tenant
+from src.adapters.orchestration.limiter import get_adaptive_limiter
+from src.adapters.orchestration.scheduler import CallScheduler, request_priority
+from src.adapters.orchestration.scoring_pool import get_scoring_pool
+from src.adapters.orchestration.warmup import WarmupReport, warm_up
+from src.adapters.providers.routing import RoutingTable, get_routing_table
+from src.tools.timeout_tuner import provider_timeout_from_percentile
+from src.adapters.providers.ratelimit import CLIENT_RATE_LIMITED, estimate_tokens, get_rate_limiter
 from src.core.consensus.base import Judge
 from src.core.consensus.strategies import ScorePreferredJudge
 from src.contracts.safety import PromptSafetyDecision
@@ -51,6 +95,7 @@ from src.core.consensus.calibration import IdentityCalibrator
 from src.core.validation import resolve_validator
 from src.core.consensus.utils import apply_calibrator
 from src.core.consensus.early_stop import early_stop_decision
+from src.core.consensus.quorum import QuorumDecision, quorum_decision
 from src.core.scoring.engine import compute_scores
 from src.core.consensus.replay import build_replay_token
 from src.errors import LcsError
@@ -71,6 +116,23 @@ logger = get_logger()
 tracer = trace.get_tracer(__name__)
 
 _BREAKER_NUMERIC = {"closed": 0.0, "half_open": 0.5, "open": 1.0}
+# Run-event callbacks detached because the request budget was already spent.
+_BACKGROUND_CALLBACKS: set[asyncio.Future] = set()
+
+
+def _task_outcome(task: asyncio.Task, model: str) -> ProviderResult | Exception:
+    """Result of a finished provider task; cancellations and non-`Exception` errors become envelopes."""
+    if task.cancelled():
+        # Cancelled from outside the orchestrator: the call never produced an answer in time.
+        error = ErrorEnvelope(type="timeout", message="provider_call_cancelled", retryable=True)
+    else:
+        exc = task.exception()
+        if exc is None:
+            return task.result()
+        if isinstance(exc, Exception):
+            return exc
+        error = ErrorEnvelope(type="internal", message=type(exc).__name__, retryable=False)
+    return ProviderResult(model=model, content=None, latency_ms=None, error=error)
 
 
 def _record_breaker_state(model: str, state: BreakerState) -> None:
@@ -106,7 +168,7 @@ def _apply_pricing_hints(
 
 
 def _compute_latency_summary(responses: list[ModelResponse]) -> LatencySummary | None:
-    latencies = [r.latency_ms for r in responses if r.latency_ms is not None]
+    latencies = [r.latency_ms for r in responses if r.latency_ms is not None and not r.cached]
     if not latencies:
         return None
     avg_ms = sum(latencies) / len(latencies)
@@ -122,16 +184,114 @@ class Orchestrator:
         callback_timeout_ms: int | None = 250,
         calibrator=None,
         output_validator: Callable[[str], tuple[bool, str | None]] | None = None,
+        breakers: BreakerManager | None = None,
+        scheduler: CallScheduler | None = None,
     ) -> None:
         self.settings = get_settings()
         self.calibrator = calibrator or IdentityCalibrator()
         self.judge = judge or ScorePreferredJudge()
         self.policy_store = policy_store or PolicyStore(loader=load_policy)
-        self.breakers = BreakerManager(self._breaker_config())
+        self.breakers = breakers or BreakerManager(self._breaker_config())
+        self.scheduler = scheduler
         self.run_event_callback = run_event_callback
         self.callback_timeout_ms = callback_timeout_ms
         self.output_validator = output_validator
 
+    async def warmup(
+        self,
+        models: Iterable[str] | None = None,
+        *,
+        provider_overrides: dict[str, str] | None = None,
+        freeze_gc: bool = False,
+    ) -> WarmupReport:
+        """Pre-load policy, preambles, provider connections and analyzers (default models when None)."""
+        return await warm_up(
+            models if models is not None else self.settings.default_models,
+            policy_store=self.policy_store,
+            provider_overrides=provider_overrides,
+            timeout_ms=self.settings.provider_timeout_ms,
+            freeze_gc=freeze_gc,
+        )
+
+    def _deadline(self, policy, start_time: float) -> tuple[Deadline, int]:
+        """Request deadline fixed at entry, and the part of it reserved for post-provider stages."""
+        timeouts = policy.timeouts
+        budget_ms = self.settings.e2e_timeout_ms
+        if timeouts and timeouts.e2e_timeout_ms:
+            budget_ms = timeouts.e2e_timeout_ms
+        reserve_ms = min(timeouts.reserve_ms, budget_ms // 2) if timeouts else 0
+        return Deadline(budget_ms, start=start_time), reserve_ms
+
+    def _skip_stage(self, stage: str, deadline: Deadline, policy, request_id: str, skipped: list[str]) -> bool:
+        """True when an optional stage should be skipped because the request budget is spent."""
+        timeouts = policy.timeouts
+        if not (timeouts and timeouts.skip_late_stages and deadline.expired):
+            return False
+        skipped.append(stage)
+        try:
+            deadline_stage_skipped_total.labels(stage=stage).inc()
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="deadline_stage_skipped_total", stage=stage)
+        logger.warning(
+            "stage_skipped_past_deadline",
+            request_id=request_id,
+            stage=stage,
+            elapsed_ms=deadline.elapsed_ms(),
+            budget_ms=deadline.budget_ms,
+        )
+        return True
+
+    def _check_deadline(self, stage: str, deadline: Deadline, request_id: str) -> None:
+        """Fail fast with a 504 when the request budget is already spent before `stage` starts."""
+        if not deadline.expired:
+            return
+        logger.warning(
+            "deadline_exceeded_before_stage",
+            request_id=request_id,
+            stage=stage,
+            elapsed_ms=deadline.elapsed_ms(),
+            budget_ms=deadline.budget_ms,
+        )
+        envelope = ErrorEnvelope(type="timeout", message="Request timed out", retryable=True, status_code=504)
+        raise OrchestrationError(envelope)
+
+    async def _score(self, responses: list[ModelResponse], policy, deadline: Deadline):
+        """Score responses inline, or off the event loop in the scoring pool when the policy enables it."""
+        if not policy.scoring.enabled:
+            return compute_scores(responses)
+        return await get_scoring_pool().score(
+            responses, policy.scoring, timeout_ms=max(deadline.remaining_ms(), 1)
+        )
+
+    def _slow_call_threshold_ms(self, model: str) -> float | None:
+        """Latency above which a call counts as slow for the breaker; None when slow-call mode is off."""
+        cfg = self.breakers.config.slow_call
+        if not cfg.enabled:
+            return None
+        if cfg.threshold_ms is not None:
+            return cfg.threshold_ms
+        observed = get_latency_tracker().quantile(model, cfg.percentile, min_samples=cfg.min_latency_samples)
+        return observed * cfg.percentile_multiplier if observed is not None else None
+
+    def _note_breaker_opened(self, model: str, request_id: str, state: BreakerState, reason: str) -> None:
+        try:
+            provider_breaker_open_total.labels(model=model, reason=reason).inc()
+        except Exception:
+            logger.warning(
+                "metrics_emit_failed",
+                metric="provider_breaker_open_total",
+                request_id=request_id,
+                model=model,
+                reason=reason,
+            )
+        logger.info(
+            "breaker_open",
+            request_id=request_id,
+            model=model,
+            state=state,
+            reason=reason,
+        )
+
     def _breaker_config(self) -> BreakerConfig:
         # Policy is authoritative; fallback handled by loader defaults.
         policy = self.policy_store.current()
@@ -179,6 +339,351 @@ class Orchestrator:
             pass
         return STRUCTURED_PREAMBLE, "default"
 
+    def _concurrency_limits(self):
+        cfg = getattr(self.policy_store.current(), "concurrency", None)
+        if cfg is None or not cfg.enabled:
+            return None
+        return cfg
+
+    def _record_concurrency(self, model: str, state) -> None:
+        model_label = _sanitize_model_label(model, self.settings.default_models)
+        try:
+            provider_concurrency_limit.labels(model=model_label).set(state.capacity)
+            provider_concurrency_in_flight.labels(model=model_label).set(state.in_flight)
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="provider_concurrency_limit", model=model_label)
+
+    def _record_bulkhead(self, provider: str, bulkhead: Bulkhead) -> None:
+        try:
+            provider_bulkhead_in_flight.labels(provider=provider).set(bulkhead.in_flight)
+            provider_bulkhead_queued.labels(provider=provider).set(bulkhead.queued)
+            provider_bulkhead_saturation.labels(provider=provider).set(bulkhead.saturation)
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="provider_bulkhead_in_flight", provider=provider)
+
+    async def _fetch(self, call: ProviderCall) -> ProviderResult:
+        """Single provider attempt inside its provider's bulkhead, when bulkheads are enabled."""
+        cfg = getattr(self.policy_store.current(), "bulkheads", None)
+        bulkhead = None
+        if cfg is not None and cfg.enabled:
+            provider_name, _ = self._resolve_provider(call.model, call.provider_overrides)
+            bulkhead = get_bulkheads().get(provider_name, cfg)
+        if bulkhead is None:
+            return await self._limited_fetch(call)
+
+        # provider_timeout_ms is already clamped to the request deadline.
+        timeout_ms = call.provider_timeout_ms
+        max_wait_ms = bulkhead.rule.max_wait_ms
+        if timeout_ms:
+            max_wait_ms = min(max_wait_ms, timeout_ms) if max_wait_ms is not None else timeout_ms
+        rejected = await bulkhead.acquire(max_wait_ms / 1000 if max_wait_ms is not None else None)
+        if rejected is not None:
+            try:
+                provider_bulkhead_rejections_total.labels(provider=provider_name, reason=rejected).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_bulkhead_rejections_total")
+            logger.info(
+                "provider_bulkhead_rejected",
+                request_id=call.request_id,
+                model=call.model,
+                provider=provider_name,
+                reason=rejected,
+            )
+            self._record_bulkhead(provider_name, bulkhead)
+            return ProviderResult(
+                model=call.model,
+                content=None,
+                latency_ms=0,
+                provider=provider_name,
+                error=ErrorEnvelope(type="provider_error", message=BULKHEAD_FULL, retryable=True, status_code=503),
+            )
+        self._record_bulkhead(provider_name, bulkhead)
+        try:
+            return await self._limited_fetch(call)
+        finally:
+            bulkhead.release()
+            self._record_bulkhead(provider_name, bulkhead)
+
+    async def _limited_fetch(self, call: ProviderCall) -> ProviderResult:
+        """Provider attempt holding a slot of the model's adaptive concurrency limit when enabled."""
+        cfg = self._concurrency_limits()
+        if cfg is None:
+            return await self._scheduled_fetch(call)
+
+        model = call.model
+        limiter = get_adaptive_limiter()
+        # provider_timeout_ms is already clamped to the request deadline.
+        timeout_ms = call.provider_timeout_ms
+        max_wait_ms = min(cfg.max_wait_ms, timeout_ms) if timeout_ms else cfg.max_wait_ms
+        waited_s = await limiter.acquire(model, cfg, max_wait_ms / 1000)
+        model_label = _sanitize_model_label(model, self.settings.default_models)
+        if waited_s is None:
+            try:
+                provider_concurrency_rejections_total.labels(model=model_label).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_concurrency_rejections_total")
+            logger.info("provider_concurrency_limited", request_id=call.request_id, model=model)
+            return ProviderResult(
+                model=model,
+                content=None,
+                latency_ms=0,
+                error=ErrorEnvelope(
+                    type="rate_limited", message=CLIENT_RATE_LIMITED, retryable=True, status_code=429
+                ),
+            )
+        try:
+            provider_concurrency_wait_seconds.labels(model=model_label).observe(waited_s)
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="provider_concurrency_wait_seconds")
+        self._record_concurrency(model, limiter.get(model, cfg))
+
+        overloaded: bool | None = None
+        try:
+            result = await self._scheduled_fetch(call)
+            if result.error is None:
+                baseline = get_latency_tracker().quantile(model, 0.5, min_samples=cfg.min_latency_samples)
+                overloaded = (
+                    baseline is not None
+                    and result.latency_ms is not None
+                    and result.latency_ms > baseline * cfg.latency_tolerance
+                )
+            elif result.error.type in ("timeout", "rate_limited") and result.error.message != CLIENT_RATE_LIMITED:
+                overloaded = True
+            return result
+        finally:
+            # Cancelled calls and non-overload errors release without moving the limit.
+            self._record_concurrency(model, limiter.release(model, overloaded))
+
+    async def _scheduled_fetch(self, call: ProviderCall) -> ProviderResult:
+        slot = nullcontext()
+        if self.scheduler is not None:
+            provider_name, _ = self._resolve_provider(call.model, call.provider_overrides)
+            slot = self.scheduler.slot(provider_name)
+        tenants = getattr(self.policy_store.current(), "tenants", None)
+        fair_slot = get_fair_queue().slot(tenants) if tenants is not None and tenants.enabled else nullcontext()
+        async with fair_slot, slot:
+            kwargs = {}
+            if call.stream:
+                kwargs["stream"] = True
+            try:
+                return await fetch_provider_result(
+                    prompt=call.prompt,
+                    model=call.model,
+                    request_id=call.request_id,
+                    normalize_output=call.normalize_output,
+                    include_scores=call.include_scores,
+                    provider_timeout_ms=call.provider_timeout_ms,
+                    provider_overrides=call.provider_overrides,
+                    system_preamble=call.system_preamble,
+                    **kwargs,
+                )
+            except TypeError as exc:
+                # Backward compatibility: allow test doubles that lack the system_preamble kwarg.
+                try:
+                    return await fetch_provider_result(
+                        call.prompt,
+                        call.model,
+                        call.request_id,
+                        call.normalize_output,
+                        call.include_scores,
+                        call.provider_timeout_ms,
+                    )
+                except TypeError:
+                    raise exc
+
+    def _hedge_delay_ms(self, model: str) -> int | None:
+        """Hedge delay from the model's observed latency percentile, or None when hedging is off."""
+        policy = self.policy_store.current()
+        cfg = getattr(policy, "hedging", None)
+        if cfg is None or not cfg.enabled:
+            return None
+        observed = get_latency_tracker().quantile(model, cfg.percentile, min_samples=cfg.min_samples)
+        if observed is None:
+            return None
+        delay_ms = max(int(observed), cfg.min_delay_ms)
+        if cfg.max_delay_ms is not None:
+            delay_ms = min(delay_ms, cfg.max_delay_ms)
+        return delay_ms
+
+    def _adaptive_timeouts(self):
+        timeouts = getattr(self.policy_store.current(), "timeouts", None)
+        cfg = getattr(timeouts, "adaptive", None)
+        if cfg is None or not cfg.enabled:
+            return None
+        return cfg
+
+    def _provider_timeout_for(self, model: str, provider_timeout_ms: int | None) -> int | None:
+        """Per-model provider timeout from live latency; the configured value until enough samples exist."""
+        cfg = self._adaptive_timeouts()
+        if cfg is None:
+            return provider_timeout_ms
+        observed = get_latency_tracker().quantile(model, cfg.percentile, min_samples=cfg.min_samples)
+        if observed is None:
+            return provider_timeout_ms
+        timeout_ms = provider_timeout_from_percentile(
+            observed,
+            safety_margin=cfg.safety_margin,
+            overhead_ms=cfg.overhead_ms,
+            provider_min_ms=cfg.min_ms,
+            provider_max_ms=cfg.max_ms,
+        )
+        model_label = _sanitize_model_label(model, self.settings.default_models)
+        try:
+            provider_adaptive_timeout_ms.labels(model=model_label).set(timeout_ms)
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="provider_adaptive_timeout_ms", model=model_label)
+        return timeout_ms
+
+    async def _hedged_fetch(self, call: ProviderCall) -> ProviderResult:
+        """One logical provider call; may fire a duplicate per the hedging policy."""
+        model = call.model
+
+        def attempt():
+            return self._rate_limited_fetch(call)
+
+        delay_ms = self._hedge_delay_ms(model)
+        if delay_ms is None:
+            return await attempt()
+
+        async def hedge() -> ProviderResult | None:
+            # The duplicate is a second provider call and needs its own rate-limit token;
+            # when none frees up within the hedge delay, no hedge is sent.
+            result = await self._rate_limited_fetch(call, max_wait_ms=delay_ms)
+            if result.error is not None and result.error.message == CLIENT_RATE_LIMITED:
+                logger.info("provider_hedge_skipped", request_id=call.request_id, model=model)
+                return None
+            return result
+
+        result, winner = await hedged_call(attempt, delay_ms, hedge)
+        if winner is not None:
+            model_label = _sanitize_model_label(model, self.settings.default_models)
+            try:
+                provider_hedges_total.labels(model=model_label).inc()
+                provider_hedge_wins_total.labels(model=model_label, winner=winner).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_hedges_total", model=model_label)
+            logger.info(
+                "provider_call_hedged",
+                request_id=call.request_id,
+                model=model,
+                delay_ms=delay_ms,
+                winner=winner,
+            )
+            result.hedged = True
+        return result
+
+    def _routing_table(self, provider_overrides: dict[str, str] | None) -> RoutingTable:
+        routing = getattr(self.policy_store.current(), "routing", None)
+        return get_routing_table(provider_overrides, routing.fallbacks if routing is not None else None)
+
+    def _resolve_provider(self, model: str, provider_overrides: dict[str, str] | None) -> tuple[str, str]:
+        """(provider name, stripped model) for `model`; ("unknown", model) when resolution fails."""
+        try:
+            route = self._routing_table(provider_overrides).resolve(model)
+        except Exception:
+            return "unknown", model
+        return route.provider_name, route.stripped_model
+
+    async def _rate_limited_fetch(
+        self, call: ProviderCall, *, max_wait_ms: int | None = None
+    ) -> ProviderResult:
+        """
+        One provider attempt gated by the client-side rate limiter; waits briefly instead of
+        drawing a 429. Every attempt, hedges included, takes its own token.
+        """
+        policy = self.policy_store.current()
+        cfg = getattr(policy, "rate_limits", None)
+        if cfg is None or not cfg.enabled:
+            return await self._fetch(call)
+
+        model = call.model
+        provider_name, _ = self._resolve_provider(model, call.provider_overrides)
+        limiter = get_rate_limiter()
+
+        max_wait_ms = cfg.max_wait_ms if max_wait_ms is None else min(max_wait_ms, cfg.max_wait_ms)
+        if call.deadline_at is not None:
+            max_wait_ms = min(max_wait_ms, int((call.deadline_at - time.perf_counter()) * 1000))
+        tokens = estimate_tokens(call.prompt) + estimate_tokens(call.system_preamble)
+        waited_ms = await limiter.acquire(provider_name, model, cfg, tokens, max_wait_ms)
+        if waited_ms is None:
+            try:
+                provider_rate_limit_rejections_total.labels(provider=provider_name).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_rate_limit_rejections_total")
+            logger.info(
+                "provider_rate_limited_locally", request_id=call.request_id, model=model, provider=provider_name
+            )
+            return ProviderResult(
+                model=model,
+                content=None,
+                latency_ms=0,
+                provider=provider_name,
+                error=ErrorEnvelope(
+                    type="rate_limited", message=CLIENT_RATE_LIMITED, retryable=True, status_code=429
+                ),
+            )
+        try:
+            provider_rate_limit_wait_seconds.labels(provider=provider_name).observe(waited_ms / 1000)
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="provider_rate_limit_wait_seconds")
+
+        result = await self._fetch(call)
+        if result.error is None:
+            completion = result.completion_tokens
+            if completion is None:
+                completion = estimate_tokens(result.content)
+            limiter.debit(provider_name, model, cfg, completion)
+        elif result.error.type == "rate_limited" and result.error.message != CLIENT_RATE_LIMITED:
+            limiter.throttle(provider_name, model, cfg, result.error.retry_after_ms)
+            try:
+                provider_rate_limit_throttles_total.labels(provider=provider_name).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_rate_limit_throttles_total")
+        return result
+
+    async def _retrying_fetch(self, call: ProviderCall) -> ProviderResult:
+        """Hedged fetch, retried on retryable errors per the retry policy within the request deadline."""
+        policy = self.policy_store.current()
+        cfg = getattr(policy, "retries", None)
+
+        def attempt(timeout_ms: int | None):
+            return self._hedged_fetch(replace(call, provider_timeout_ms=timeout_ms))
+
+        if cfg is None or not cfg.enabled:
+            return await attempt(call.provider_timeout_ms)
+
+        model = call.model
+        model_label = _sanitize_model_label(model, self.settings.default_models)
+
+        def on_retry(attempt_no: int, error: ErrorEnvelope, delay_ms: int) -> None:
+            try:
+                provider_retries_total.labels(model=model_label, error_type=error.type).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_retries_total", model=model_label)
+            logger.info(
+                "provider_call_retry",
+                request_id=call.request_id,
+                model=model,
+                attempt=attempt_no,
+                error_type=error.type,
+                delay_ms=delay_ms,
+            )
+
+        def on_give_up(error: ErrorEnvelope, reason: str) -> None:
+            try:
+                provider_retry_exhausted_total.labels(model=model_label, reason=reason).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_retry_exhausted_total", model=model_label)
+
+        return await call_with_retries(
+            attempt,
+            cfg,
+            provider_timeout_ms=call.provider_timeout_ms,
+            deadline_at=call.deadline_at,
+            on_retry=on_retry,
+            on_give_up=on_give_up,
+        )
+
     async def _call_single_model(
         self,
         prompt: str,
@@ -189,7 +694,159 @@ class Orchestrator:
         include_scores: bool = False,
         provider_timeout_ms: int | None = None,
         provider_overrides: dict[str, str] | None = None,
+        stream: bool = False,
+        deadline_at: float | None = None,
+        seed: int | None = None,
+        cache_bypass: bool = False,
+        request_models: Collection[str] = (),
+        fallbacks_taken: set[str] | None = None,
     ) -> ProviderResult:
+        """Entry point of one model call: builds the `ProviderCall` every layer below works on."""
+        call = ProviderCall(
+            prompt=prompt,
+            model=model,
+            request_id=request_id,
+            normalize_output=normalize_output,
+            system_preamble=system_preamble,
+            include_scores=include_scores,
+            provider_timeout_ms=provider_timeout_ms,
+            provider_overrides=provider_overrides,
+            stream=stream,
+            deadline_at=deadline_at,
+            seed=seed,
+            cache_bypass=cache_bypass,
+        )
+        return await self._call_with_fallbacks(call, request_models, fallbacks_taken)
+
+    async def _call_with_fallbacks(
+        self,
+        call: ProviderCall,
+        request_models: Collection[str] = (),
+        fallbacks_taken: set[str] | None = None,
+    ) -> ProviderResult:
+        """
+        Call `call.model`, walking its policy fallback chain when the primary is breaker-open
+        or rate-limited. Models already part of the request are never used as fallbacks, and
+        neither are those in `fallbacks_taken`, the request-wide set of fallbacks already
+        answering for another primary, so one model never casts two votes.
+        """
+        if fallbacks_taken is None:
+            fallbacks_taken = set()
+        model = call.model
+        request_id = call.request_id
+        result = await self._call_model(call)
+        reason = self._fallback_reason(result)
+        if reason is None:
+            return result
+
+        for fallback in self._routing_table(call.provider_overrides).fallbacks(model):
+            if fallback == model or fallback in request_models or fallback in fallbacks_taken:
+                continue
+            # Claimed before the call, so a concurrent primary sharing the chain moves past it.
+            fallbacks_taken.add(fallback)
+            fallback_result = await self._call_model(replace(call, model=fallback))
+            if fallback_result.error is not None:
+                fallbacks_taken.discard(fallback)
+                continue
+            fallback_result.fallback_for = model
+            model_label = _sanitize_model_label(model, self.settings.default_models)
+            fallback_label = _sanitize_model_label(fallback, self.settings.default_models)
+            try:
+                provider_fallbacks_total.labels(
+                    model=model_label, fallback=fallback_label, reason=reason
+                ).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_fallbacks_total", model=model_label)
+            logger.info(
+                "provider_fallback",
+                request_id=request_id,
+                model=model,
+                fallback=fallback,
+                reason=reason,
+            )
+            return fallback_result
+        return result
+
+    def _fallback_reason(self, result: ProviderResult) -> str | None:
+        if result.error is None:
+            return None
+        if result.error.message == "provider_circuit_open":
+            reason = "breaker_open"
+        elif result.error.type == "rate_limited":
+            reason = "rate_limited"
+        else:
+            return None
+        routing = getattr(self.policy_store.current(), "routing", None)
+        if routing is None or reason not in routing.fallback_on:
+            return None
+        return reason
+
+    async def _call_model(self, call: ProviderCall) -> ProviderResult:
+        """Response cache and single-flight in front of the breaker-guarded provider call."""
+        model = call.model
+        call = replace(
+            call,
+            provider_timeout_ms=clamp_to_deadline(
+                self._provider_timeout_for(model, call.provider_timeout_ms), call.deadline_at
+            ),
+        )
+        policy = self.policy_store.current()
+        cache_cfg = getattr(policy, "cache", None)
+        if cache_cfg is not None and not cache_cfg.enabled:
+            cache_cfg = None
+        flight_cfg = getattr(policy, "single_flight", None)
+        if flight_cfg is not None and not flight_cfg.enabled:
+            flight_cfg = None
+
+        key = None
+        if cache_cfg is not None or flight_cfg is not None:
+            provider_name, stripped_model = self._resolve_provider(model, call.provider_overrides)
+            key = cache_key(
+                provider_name,
+                stripped_model,
+                resolve_system_preamble(call.normalize_output, call.include_scores, call.system_preamble),
+                call.prompt,
+                {"seed": call.seed},
+            )
+        if cache_cfg is not None:
+            outcome = "bypass"
+            if not call.cache_bypass:
+                cached = get_response_cache().get(key)
+                outcome = "hit" if cached is not None else "miss"
+            try:
+                provider_cache_requests_total.labels(outcome=outcome).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_cache_requests_total", outcome=outcome)
+            if outcome == "hit":
+                logger.info("provider_cache_hit", request_id=call.request_id, model=model)
+                return cached
+
+        def invoke() -> Awaitable[ProviderResult]:
+            return self._call_provider(call)
+
+        if flight_cfg is None:
+            result, shared = await invoke(), False
+        else:
+            result, shared = await get_single_flight().do(f"{key}:{int(call.stream)}", invoke)
+        if shared:
+            # Waiters get their own copy; provider metrics and breaker were recorded once by the leader.
+            result = replace(result)
+            model_label = _sanitize_model_label(model, self.settings.default_models)
+            try:
+                provider_calls_coalesced_total.labels(model=model_label).inc()
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="provider_calls_coalesced_total", model=model_label)
+            logger.info("provider_call_coalesced", request_id=call.request_id, model=model)
+        elif cache_cfg is not None and result.error is None:
+            cache = get_response_cache()
+            if cache.max_bytes != cache_cfg.max_bytes:
+                cache.resize(cache_cfg.max_bytes)
+            cache.put(key, result, cache_cfg.ttl_s)
+        return result
+
+    async def _call_provider(self, call: ProviderCall) -> ProviderResult:
+        """Breaker-guarded provider call with per-call metrics."""
+        model, request_id = call.model, call.request_id
         allowed, breaker_state = await self.breakers.should_allow(model)
         if not allowed:
             error = ErrorEnvelope(
@@ -214,51 +871,41 @@ class Orchestrator:
             _record_breaker_state(model, breaker_state)
         else:
             try:
-                result = await fetch_provider_result(
-                    prompt=prompt,
-                    model=model,
-                    request_id=request_id,
-                    normalize_output=normalize_output,
-                    include_scores=include_scores,
-                    provider_timeout_ms=provider_timeout_ms,
-                    provider_overrides=provider_overrides,
-                    system_preamble=system_preamble,
-                )
-            except TypeError as exc:
-                # Backward compatibility: allow test doubles that lack the system_preamble kwarg.
-                try:
-                    result = await fetch_provider_result(
-                        prompt,
-                        model,
-                        request_id,
-                        normalize_output,
-                        include_scores,
-                        provider_timeout_ms,
-                    )
-                except TypeError:
-                    raise exc
+                result = await self._retrying_fetch(call)
+            except asyncio.CancelledError:
+                # Cancelled by the caller (quorum, e2e timeout): no outcome to record, but a
+                # half-open probe slot must not stay taken.
+                await self.breakers.release(model)
+                raise
+            slow_threshold_ms = self._slow_call_threshold_ms(model)
+            if (
+                result.error is not None
+                and result.error.type == "timeout"
+                and self._adaptive_timeouts() is not None
+            ):
+                # A timed-out call took at least the timeout; without this sample the learned
+                # timeout would only ever see the fast calls and keep shrinking.
+                get_latency_tracker().observe(model, call.provider_timeout_ms)
             if result.error is None:
-                breaker_state = await self.breakers.record_success(model)
+                slow = (
+                    slow_threshold_ms is not None
+                    and result.latency_ms is not None
+                    and result.latency_ms > slow_threshold_ms
+                )
+                get_latency_tracker().observe(model, result.latency_ms)
+                breaker_state = await self.breakers.record_success(model, slow=slow)
+                if breaker_state == "open":
+                    self._note_breaker_opened(model, request_id, breaker_state, "slow_calls")
+            elif result.error.message in (CLIENT_RATE_LIMITED, BULKHEAD_FULL):
+                # Never reached the provider: not evidence of provider failure.
+                breaker_state = await self.breakers.release(model)
             else:
-                opened, breaker_state = await self.breakers.record_failure(model)
+                # Timeouts took at least the timeout: they count as slow calls too.
+                slow = slow_threshold_ms is not None and result.error.type == "timeout"
+                opened, breaker_state = await self.breakers.record_failure(model, slow=slow)
                 if opened:
-                    reason = getattr(result.error, "type", "unknown")
-                    try:
-                        provider_breaker_open_total.labels(model=model, reason=reason).inc()
-                    except Exception:
-                        logger.warning(
-                            "metrics_emit_failed",
-                            metric="provider_breaker_open_total",
-                            request_id=request_id,
-                            model=model,
-                            reason=reason,
-                        )
-                    logger.info(
-                        "breaker_open",
-                        request_id=request_id,
-                        model=model,
-                        state=breaker_state,
-                        reason=reason,
+                    self._note_breaker_opened(
+                        model, request_id, breaker_state, getattr(result.error, "type", "unknown")
                     )
             result.breaker_state = breaker_state
             _record_breaker_state(model, breaker_state)
@@ -271,16 +918,139 @@ class Orchestrator:
             llm_call_duration_seconds.labels(
                 provider=provider_label, model=model_label, outcome=outcome
             ).observe(result.latency_ms / 1000)
+        try:
+            if result.ttft_ms is not None:
+                llm_time_to_first_token_seconds.labels(
+                    provider=provider_label, model=model_label
+                ).observe(result.ttft_ms / 1000)
+            if result.tokens_per_second is not None:
+                llm_generation_tokens_per_second.labels(
+                    provider=provider_label, model=model_label
+                ).observe(result.tokens_per_second)
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="llm_time_to_first_token_seconds", model=model_label)
         return result
 
+    async def _gather_quorum(
+        self,
+        tasks: list[asyncio.Task],
+        models: list[str],
+        cfg: QuorumConfig,
+        request_id: str,
+    ) -> tuple[list[str], list[ProviderResult | Exception], QuorumReport]:
+        """
+        Collect provider results as they complete, re-judging after each one, and cancel the
+        stragglers once `cfg.k` successful responses agree. Returns the finished models and
+        results in request order plus the quorum report.
+        """
+        started = time.perf_counter()
+        pending = {task: index for index, task in enumerate(tasks)}
+        finished: dict[int, ProviderResult | Exception] = {}
+        decision = QuorumDecision(reached=False)
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                finished[index] = _task_outcome(task, models[index])
+            order = sorted(finished)
+            responses = build_model_responses([models[i] for i in order], [finished[i] for i in order])
+            confidence = None
+            if cfg.confidence_threshold is not None:
+                confidence = self.judge.judge(responses, None).confidence
+            decision = quorum_decision(responses, cfg, confidence)
+            if decision.reached:
+                break
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+
+        cancelled = [models[index] for index in sorted(pending.values())]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+        time_saved_ms = None
+        tracker = get_latency_tracker()
+        expected = [tracker.quantile(model, 0.5) for model in cancelled]
+        expected = [value for value in expected if value is not None]
+        if expected:
+            time_saved_ms = max(int(max(expected)) - elapsed_ms, 0)
+
+        outcome = "reached" if decision.reached else "not_reached"
+        try:
+            quorum_outcomes_total.labels(outcome=outcome).inc()
+            for model in cancelled:
+                quorum_cancelled_calls_total.labels(
+                    model=_sanitize_model_label(model, self.settings.default_models)
+                ).inc()
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="quorum_outcomes_total", outcome=outcome)
+        if cancelled:
+            logger.info(
+                "quorum_reached",
+                request_id=request_id,
+                agreeing=decision.agreeing,
+                cancelled=cancelled,
+                elapsed_ms=elapsed_ms,
+                time_saved_ms=time_saved_ms,
+            )
+
+        order = sorted(finished)
+        report = QuorumReport(
+            reached=decision.reached,
+            agreeing=decision.agreeing,
+            cancelled=cancelled,
+            elapsed_ms=elapsed_ms,
+            time_saved_ms=time_saved_ms,
+        )
+        return [models[i] for i in order], [finished[i] for i in order], report
+
     async def run(
-        self, consensus_request: ConsensusRequest, request_id: str, strategy_label: str | None = None
+        self,
+        consensus_request: ConsensusRequest,
+        request_id: str,
+        strategy_label: str | None = None,
+        *,
+        started_at: float | None = None,
+    ) -> ConsensusResult:
+        """
+        Run one consensus request. `started_at` (a `perf_counter` timestamp) starts the
+        request budget earlier, e.g. when the request was queued for admission.
+
+        The request's `priority` and `tenant` apply to every provider call it makes through the
+        scheduler and the tenant fair queue.
+        """
+        start_time = started_at if started_at is not None else time.perf_counter()
+        priority = consensus_request.priority
+        token = request_priority.set(priority)
+        tenant_token = request_tenant.set(consensus_request.tenant)
+        outcome = "error"
+        try:
+            result = await self._run(consensus_request, request_id, strategy_label, start_time)
+            outcome = "ok"
+            return result
+        finally:
+            request_tenant.reset(tenant_token)
+            request_priority.reset(token)
+            try:
+                request_duration_by_priority_seconds.labels(priority=priority, outcome=outcome).observe(
+                    time.perf_counter() - start_time
+                )
+            except Exception:
+                logger.warning("metrics_emit_failed", metric="request_duration_by_priority_seconds")
+
+    async def _run(
+        self,
+        consensus_request: ConsensusRequest,
+        request_id: str,
+        strategy_label: str | None,
+        start_time: float,
     ) -> ConsensusResult:
-        start_time = time.perf_counter()
         strategy_label = strategy_label or getattr(self.judge, "method", "unknown")
         if consensus_request.early_stop and consensus_request.early_stop.enabled:
             return await self._run_early_stop(consensus_request, request_id, strategy_label, start_time)
         policy = self.policy_store.current()
+        deadline, reserve_ms = self._deadline(policy, start_time)
+        skipped_stages: list[str] = []
+        quorum_report: QuorumReport | None = None
         token = build_replay_token(consensus_request.seed, consensus_request.models, strategy_label, policy)
         if policy.breaker.model_dump() != self.breakers.config.model_dump():
             self.breakers = BreakerManager(policy.breaker)
@@ -310,6 +1080,9 @@ class Orchestrator:
         redaction_summary: RedactionSummary | None = None
 
         try:
+            # Preflight is synchronous and cannot be cut short, so it only starts with budget left
+            # (e.g. not after an admission wait ate it); provider dispatch re-checks afterwards.
+            self._check_deadline("preflight", deadline, request_id)
             if policy.prefilter.pii.enabled:
                 redaction_result = redact_prompt(prompt_for_processing, policy.prefilter.pii)
                 prompt_for_processing = redaction_result.masked_prompt
@@ -382,6 +1155,7 @@ class Orchestrator:
                 )
                 await self._fire_run_event(
                     consensus_request,
+                    deadline=deadline,
                     request_id=request_id,
                     strategy=strategy_label,
                     responses=[],
@@ -424,23 +1198,15 @@ class Orchestrator:
             if trunc_info and getattr(trunc_info, "applied", False):
                 consensus_request.prompt = prompt_for_processing
 
-            effective_e2e_timeout = self.settings.e2e_timeout_ms
-            if policy.timeouts and policy.timeouts.e2e_timeout_ms:
-                effective_e2e_timeout = policy.timeouts.e2e_timeout_ms
-
             effective_provider_timeout = self.settings.provider_timeout_ms
             if policy.timeouts and policy.timeouts.provider_timeout_ms:
                 effective_provider_timeout = policy.timeouts.provider_timeout_ms
 
             # Validate provider resolution up front to fail fast on misconfiguration
-            from src.adapters.providers import registry
-
+            routes = self._routing_table(consensus_request.provider_overrides)
             for model_name in consensus_request.models:
-                override_name = None
-                if consensus_request.provider_overrides:
-                    override_name = consensus_request.provider_overrides.get(model_name)
                 try:
-                    registry.resolve_provider(model_name, override_name=override_name)
+                    routes.resolve(model_name)
                 except LcsError as exc:
                     envelope = ErrorEnvelope(
                         type="config_error",
@@ -454,25 +1220,53 @@ class Orchestrator:
                 self.settings.max_models, policy.guardrails.request.models.max_models
             )
             semaphore = asyncio.Semaphore(max_models)
+            deadline_at = deadline.before(reserve_ms)
+            if deadline.remaining_ms(reserve_ms) <= 0:
+                envelope = ErrorEnvelope(
+                    type="timeout", message="Request timed out", retryable=True, status_code=504
+                )
+                raise OrchestrationError(envelope)
+
+            def provider_call(model_name: str) -> ProviderCall:
+                return ProviderCall(
+                    prompt=prompt_for_processing,
+                    model=model_name,
+                    request_id=request_id,
+                    normalize_output=consensus_request.normalize_output,
+                    system_preamble=system_preamble,
+                    include_scores=consensus_request.include_scores,
+                    provider_timeout_ms=effective_provider_timeout,
+                    provider_overrides=consensus_request.provider_overrides,
+                    stream=consensus_request.stream,
+                    deadline_at=deadline_at,
+                    seed=consensus_request.seed,
+                    cache_bypass=consensus_request.cache_bypass,
+                )
+
+            fallbacks_taken: set[str] = set()
 
             async def limited_call(model_name: str) -> ProviderResult:
                 async with semaphore:
-                    return await self._call_single_model(
-                        prompt_for_processing,
-                        model_name,
-                        request_id,
-                        consensus_request.normalize_output,
-                        system_preamble,
-                        consensus_request.include_scores,
-                        effective_provider_timeout,
-                        consensus_request.provider_overrides,
+                    return await self._call_with_fallbacks(
+                        provider_call(model_name), consensus_request.models, fallbacks_taken
                     )
 
+            quorum_cfg = consensus_request.quorum or getattr(policy, "quorum", None)
+            if quorum_cfg is not None and (not quorum_cfg.enabled or quorum_cfg.k > len(consensus_request.models)):
+                quorum_cfg = None
+
             tasks = [asyncio.create_task(limited_call(model)) for model in consensus_request.models]
+            completed_models = consensus_request.models
             try:
-                raw_results = await enforce_timeout(
-                    asyncio.gather(*tasks, return_exceptions=True), effective_e2e_timeout
-                )
+                if quorum_cfg is None:
+                    raw_results = await enforce_timeout(
+                        asyncio.gather(*tasks, return_exceptions=True), deadline.remaining_ms()
+                    )
+                else:
+                    completed_models, raw_results, quorum_report = await enforce_timeout(
+                        self._gather_quorum(tasks, consensus_request.models, quorum_cfg, request_id),
+                        deadline.remaining_ms(),
+                    )
             except asyncio.TimeoutError:
                 for task in tasks:
                     task.cancel()
@@ -482,7 +1276,7 @@ class Orchestrator:
                 )
                 raise OrchestrationError(envelope)
 
-            responses = build_model_responses(consensus_request.models, raw_results)
+            responses = build_model_responses(completed_models, raw_results)
             cost_summary = _apply_pricing_hints(responses, consensus_request.pricing_hints)
             latency_summary = _compute_latency_summary(responses)
 
@@ -524,7 +1318,9 @@ class Orchestrator:
                     )
                     raise OrchestrationError(envelope)
 
-            if consensus_request.include_scores:
+            if consensus_request.include_scores and not self._skip_stage(
+                "scoring", deadline, policy, request_id, skipped_stages
+            ):
                 with tracer.start_as_current_span(
                     "consensus.scoring",
                     attributes={
@@ -532,7 +1328,7 @@ class Orchestrator:
                         "model_count": len(responses),
                     },
                 ) as span:
-                    scores, score_stats = compute_scores(responses)
+                    scores, score_stats = await self._score(responses, policy, deadline)
                     scored_count = score_stats.count if score_stats else 0
                     if span is not None:
                         span.set_attribute("scored_count", scored_count)
@@ -634,7 +1430,12 @@ class Orchestrator:
             consensus_duration_seconds.labels(strategy=strategy_label).observe(e2e_ms / 1000)
 
             validation_cfg = consensus_request.output_validation
-            if validation_cfg and getattr(validation_cfg, "enabled", False) and winner:
+            if (
+                validation_cfg
+                and getattr(validation_cfg, "enabled", False)
+                and winner
+                and not self._skip_stage("output_validation", deadline, policy, request_id, skipped_stages)
+            ):
                 validator = resolve_validator(getattr(validation_cfg, "kind", None), self.output_validator)
                 if validator is None:
                     logger.warning(
@@ -657,37 +1458,19 @@ class Orchestrator:
 
                         if not valid:
                             validation_reason = reason or "invalid"
-                            remaining_ms = effective_e2e_timeout - int(
-                                (time.perf_counter() - start_time) * 1000
-                            )
+                            remaining_ms = deadline.remaining_ms()
                             if validation_cfg.max_reask and validation_cfg.max_reask > 0 and remaining_ms > 0:
-                                reask_timeout = effective_provider_timeout
-                                if reask_timeout is not None:
-                                    reask_timeout = min(reask_timeout, remaining_ms)
-                                try:
-                                    reask_result = await fetch_provider_result(
-                                        prompt=prompt_for_processing,
-                                        model=winner,
-                                        request_id=request_id,
-                                        normalize_output=consensus_request.normalize_output,
-                                        system_preamble=system_preamble,
-                                        include_scores=consensus_request.include_scores,
-                                        provider_timeout_ms=reask_timeout,
-                                        provider_overrides=consensus_request.provider_overrides,
+                                # Same path as every other call (breaker, retries, limiters,
+                                # adaptive timeout), cut to the request deadline. No fallback
+                                # model, and the cache must not hand back the rejected answer.
+                                reask_result = await self._call_model(
+                                    replace(
+                                        provider_call(winner),
+                                        provider_timeout_ms=deadline.clamp_ms(effective_provider_timeout),
+                                        deadline_at=deadline.at,
+                                        cache_bypass=True,
                                     )
-                                except TypeError as exc:
-                                    # Backward compatibility for patched fetch_provider_result without system_preamble.
-                                    try:
-                                        reask_result = await fetch_provider_result(
-                                            prompt_for_processing,
-                                            winner,
-                                            request_id,
-                                            consensus_request.normalize_output,
-                                            consensus_request.include_scores,
-                                            reask_timeout,
-                                        )
-                                    except TypeError:
-                                        raise exc
+                                )
                                 responses[target_idx] = reask_result.to_contract()
                                 latency_summary = _compute_latency_summary(responses)
                                 valid, reason = _validate(responses[target_idx])
@@ -733,7 +1516,7 @@ class Orchestrator:
                                 method="validation_failed",
                                 seed=consensus_request.seed,
                                 replay_token=token,
-                                timing=Timing(e2e_ms=e2e_ms),
+                                timing=Timing(e2e_ms=e2e_ms, skipped_stages=skipped_stages or None),
                                 scores=scores,
                                 score_stats=score_stats,
                                 gated=True,
@@ -745,6 +1528,7 @@ class Orchestrator:
                             )
                             await self._fire_run_event(
                                 consensus_request,
+                                deadline=deadline,
                                 request_id=request_id,
                                 strategy=strategy_label,
                                 responses=responses,
@@ -792,11 +1576,12 @@ class Orchestrator:
                 method=method,
                 seed=consensus_request.seed,
                 replay_token=token,
-                timing=Timing(e2e_ms=e2e_ms),
+                timing=Timing(e2e_ms=e2e_ms, skipped_stages=skipped_stages or None),
                 scores=scores,
                 score_stats=score_stats,
                 cost_summary=cost_summary,
                 latency_summary=latency_summary,
+                quorum=quorum_report,
                 redaction=redaction_summary,
                 prompt_truncation=trunc_info,
             )
@@ -811,6 +1596,7 @@ class Orchestrator:
             e2e_ms = int((time.perf_counter() - start_time) * 1000)
             await self._fire_run_event(
                 consensus_request,
+                deadline=deadline,
                 request_id=request_id,
                 strategy=strategy_label,
                 responses=responses,
@@ -829,6 +1615,7 @@ class Orchestrator:
             e2e_ms = int((time.perf_counter() - start_time) * 1000)
             await self._fire_run_event(
                 consensus_request,
+                deadline=deadline,
                 request_id=request_id,
                 strategy=strategy_label,
                 responses=responses,
@@ -846,6 +1633,7 @@ class Orchestrator:
         else:
             await self._fire_run_event(
                 consensus_request,
+                deadline=deadline,
                 request_id=request_id,
                 strategy=strategy_label,
                 responses=responses,
@@ -869,8 +1657,11 @@ class Orchestrator:
         start_time: float,
     ) -> ConsensusResult:
         policy = self.policy_store.current()
+        deadline, reserve_ms = self._deadline(policy, start_time)
+        skipped_stages: list[str] = []
         prompt_for_processing = consensus_request.prompt
         redaction_summary: RedactionSummary | None = None
+        self._check_deadline("preflight", deadline, request_id)
         if policy.prefilter.pii.enabled:
             redaction_result = redact_prompt(prompt_for_processing, policy.prefilter.pii)
             prompt_for_processing = redaction_result.masked_prompt
@@ -913,6 +1704,7 @@ class Orchestrator:
         confidence = None
         result: ConsensusResult | None = None
         stop_reason = "max_samples"
+        waves_used = 0
         trunc_info = None
 
         try:
@@ -965,6 +1757,7 @@ class Orchestrator:
                 )
                 await self._fire_run_event(
                     consensus_request,
+                    deadline=deadline,
                     request_id=request_id,
                     strategy=strategy_label,
                     responses=[],
@@ -1000,6 +1793,7 @@ class Orchestrator:
                 )
                 await self._fire_run_event(
                     consensus_request,
+                    deadline=deadline,
                     request_id=request_id,
                     strategy=strategy_label,
                     responses=[],
@@ -1045,10 +1839,6 @@ class Orchestrator:
                 # Keep the request in sync with the processed prompt for downstream consumers/tests.
                 consensus_request.prompt = prompt_for_processing
 
-            effective_e2e_timeout = self.settings.e2e_timeout_ms
-            if policy.timeouts and policy.timeouts.e2e_timeout_ms:
-                effective_e2e_timeout = policy.timeouts.e2e_timeout_ms
-
             effective_provider_timeout = self.settings.provider_timeout_ms
             if policy.timeouts and policy.timeouts.provider_timeout_ms:
                 effective_provider_timeout = policy.timeouts.provider_timeout_ms
@@ -1057,16 +1847,13 @@ class Orchestrator:
             selected_models = consensus_request.models[:max_samples]
             token = build_replay_token(consensus_request.seed, selected_models, strategy_label, policy)
 
-            from src.adapters.providers import registry
             from src.adapters.providers.openrouter import register_default_openrouter
 
             register_default_openrouter()
+            routes = self._routing_table(consensus_request.provider_overrides)
             for model_name in selected_models:
-                override_name = None
-                if consensus_request.provider_overrides:
-                    override_name = consensus_request.provider_overrides.get(model_name)
                 try:
-                    registry.resolve_provider(model_name, override_name=override_name)
+                    routes.resolve(model_name)
                 except LcsError as exc:
                     envelope = ErrorEnvelope(
                         type="config_error",
@@ -1076,32 +1863,52 @@ class Orchestrator:
                     )
                     raise OrchestrationError(envelope) from exc
 
-            for model_name in selected_models:
-                elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-                remaining_ms = effective_e2e_timeout - elapsed_ms
+            # Dispatch in waves: the first `min_samples` calls (never skippable) run in
+            # parallel, then `wave_size` more at a time until the decision says stop.
+            fallbacks_taken: set[str] = set()
+            next_index = 0
+            while next_index < len(selected_models):
+                remaining_ms = deadline.remaining_ms(reserve_ms)
                 if remaining_ms <= 0:
                     envelope = ErrorEnvelope(
                         type="timeout", message="Request timed out", retryable=True, status_code=504
                     )
                     raise OrchestrationError(envelope)
 
-                provider_result = await enforce_timeout(
-                    self._call_single_model(
-                        prompt_for_processing,
-                        model_name,
-                        request_id,
-                        consensus_request.normalize_output,
-                        system_preamble,
-                        consensus_request.include_scores,
-                        effective_provider_timeout,
-                        consensus_request.provider_overrides,
+                size = (config.first_wave or config.min_samples) if next_index == 0 else config.wave_size
+                wave = selected_models[next_index : next_index + size]
+                next_index += len(wave)
+                waves_used += 1
+                wave_results = await enforce_timeout(
+                    asyncio.gather(
+                        *(
+                            self._call_with_fallbacks(
+                                ProviderCall(
+                                    prompt=prompt_for_processing,
+                                    model=model_name,
+                                    request_id=request_id,
+                                    normalize_output=consensus_request.normalize_output,
+                                    system_preamble=system_preamble,
+                                    include_scores=consensus_request.include_scores,
+                                    provider_timeout_ms=effective_provider_timeout,
+                                    provider_overrides=consensus_request.provider_overrides,
+                                    stream=consensus_request.stream,
+                                    deadline_at=deadline.before(reserve_ms),
+                                    seed=consensus_request.seed,
+                                    cache_bypass=consensus_request.cache_bypass,
+                                ),
+                                selected_models,
+                                fallbacks_taken,
+                            )
+                            for model_name in wave
+                        )
                     ),
                     remaining_ms,
                 )
-                responses.append(provider_result.to_contract())
+                responses.extend(provider_result.to_contract() for provider_result in wave_results)
 
                 if consensus_request.include_scores:
-                    scores, score_stats = compute_scores(responses)
+                    scores, score_stats = await self._score(responses, policy, deadline)
 
                 judgement = self.judge.judge(
                     responses, scores if consensus_request.include_scores else None
@@ -1119,13 +1926,15 @@ class Orchestrator:
                     stop_reason = decision.reason or "max_samples"
                     break
 
-            # Ensure final scoring/judgement are consistent
+            # Ensure final scoring/judgement are consistent; past the deadline the last
+            # in-loop judgement (already scored on every response) is kept.
             if consensus_request.include_scores:
-                scores, score_stats = compute_scores(responses)
-                judgement = self.judge.judge(responses, scores)
-                winner = judgement.winner
-                confidence = judgement.confidence
-                method = judgement.method
+                if not self._skip_stage("scoring", deadline, policy, request_id, skipped_stages):
+                    scores, score_stats = await self._score(responses, policy, deadline)
+                    judgement = self.judge.judge(responses, scores)
+                    winner = judgement.winner
+                    confidence = judgement.confidence
+                    method = judgement.method
             else:
                 judgement = self.judge.judge(responses, None)
                 winner = judgement.winner
@@ -1202,7 +2011,7 @@ class Orchestrator:
                 method=method,
                 seed=consensus_request.seed,
                 replay_token=token,
-                timing=Timing(e2e_ms=e2e_ms),
+                timing=Timing(e2e_ms=e2e_ms, skipped_stages=skipped_stages or None),
                 scores=scores,
                 score_stats=score_stats,
                 early_stop=EarlyStopReport(
@@ -1210,6 +2019,7 @@ class Orchestrator:
                     stop_reason=stop_reason,
                     current_confidence=confidence or 0.0,
                     winner=winner,
+                    waves=waves_used,
                 ),
                 prompt_truncation=trunc_info,
                 redaction=redaction_summary,
@@ -1225,6 +2035,7 @@ class Orchestrator:
             e2e_ms = int((time.perf_counter() - start_time) * 1000)
             await self._fire_run_event(
                 consensus_request,
+                deadline=deadline,
                 request_id=request_id,
                 strategy=strategy_label,
                 responses=responses,
@@ -1243,6 +2054,7 @@ class Orchestrator:
             e2e_ms = int((time.perf_counter() - start_time) * 1000)
             await self._fire_run_event(
                 consensus_request,
+                deadline=deadline,
                 request_id=request_id,
                 strategy=strategy_label,
                 responses=responses,
@@ -1266,6 +2078,7 @@ class Orchestrator:
 
             await self._fire_run_event(
                 consensus_request,
+                deadline=deadline,
                 request_id=request_id,
                 strategy=strategy_label,
                 responses=responses,
@@ -1339,6 +2152,7 @@ class Orchestrator:
         include_scores: bool,
         score_stats: dict | None,
         prompt_text: str | None = None,
+        deadline: Deadline | None = None,
     ) -> None:
         event = build_run_event(
             request_id=request_id,
@@ -1363,12 +2177,21 @@ class Orchestrator:
         if self.run_event_callback is None:
             return
 
-        await self._safe_fire_callback(event)
+        if deadline is not None and deadline.expired:
+            # Budget spent: deliver the event without holding the response back.
+            task = asyncio.ensure_future(self._safe_fire_callback(event))
+            _BACKGROUND_CALLBACKS.add(task)
+            task.add_done_callback(_BACKGROUND_CALLBACKS.discard)
+            return
+        await self._safe_fire_callback(event, deadline)
 
-    async def _safe_fire_callback(self, event) -> None:
+    async def _safe_fire_callback(self, event, deadline: Deadline | None = None) -> None:
         outcome = "ok"
         start = time.perf_counter()
-        timeout_s = self.callback_timeout_ms / 1000 if self.callback_timeout_ms else None
+        timeout_ms = self.callback_timeout_ms
+        if deadline is not None:
+            timeout_ms = deadline.clamp_ms(timeout_ms)
+        timeout_s = timeout_ms / 1000 if timeout_ms else None
         with tracer.start_as_current_span(
             "run_event_callback",
             attributes={"event_id": event.event_id, "outcome": event.outcome},
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable
+
+from src.adapters.orchestration.models import ProviderResult
+from src.contracts.errors import ErrorEnvelope
+from src.policy.models import RetryConfig
+
+# Private RNG: seeded requests re-seed the global `random`, and jitter must not perturb it.
+_rng = random.Random()
+
+OnRetry = Callable[[int, ErrorEnvelope, int], None]
+OnGiveUp = Callable[[ErrorEnvelope, str], None]
+
+
+def backoff_delay_ms(
+    attempt: int,
+    config: RetryConfig,
+    rand: Callable[[], float] = _rng.random,
+) -> int:
+    """Full-jitter exponential backoff for the retry following `attempt` (1-based)."""
+    ceiling = min(config.max_delay_ms, config.base_delay_ms * (2 ** (attempt - 1)))
+    return int(rand() * ceiling)
+
+
+def should_retry(error: ErrorEnvelope | None, config: RetryConfig) -> bool:
+    return error is not None and bool(error.retryable) and error.type in config.retry_on
+
+
+async def call_with_retries(
+    call: Callable[[int | None], Awaitable[ProviderResult]],
+    config: RetryConfig,
+    *,
+    provider_timeout_ms: int | None,
+    deadline_at: float | None = None,
+    on_retry: OnRetry | None = None,
+    on_give_up: OnGiveUp | None = None,
+    clock: Callable[[], float] = time.perf_counter,
+    sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    rand: Callable[[], float] = _rng.random,
+) -> ProviderResult:
+    """
+    Invoke `call(timeout_ms)` until it succeeds, fails non-retryably or the budget runs out.
+
+    - Delay before each retry is full-jitter exponential backoff, raised to the provider's
+      `Retry-After` hint when one was returned.
+    - A retry only happens when, after sleeping, at least `min_attempt_ms` remain before
+      `deadline_at` (a `clock()` timestamp); each attempt's timeout is clamped to what remains.
+    """
+    attempt = 1
+    timeout_ms = provider_timeout_ms
+    while True:
+        result = await call(timeout_ms)
+        result.attempts = attempt
+        error = result.error
+        if not config.enabled or not should_retry(error, config):
+            return result
+        if attempt >= config.max_attempts:
+            if on_give_up:
+                on_give_up(error, "max_attempts")
+            return result
+
+        delay_ms = backoff_delay_ms(attempt, config, rand)
+        if error.retry_after_ms is not None:
+            delay_ms = max(delay_ms, error.retry_after_ms)
+
+        if deadline_at is not None:
+            remaining_ms = int((deadline_at - clock()) * 1000) - delay_ms
+            if remaining_ms < config.min_attempt_ms:
+                if on_give_up:
+                    on_give_up(error, "deadline")
+                return result
+            timeout_ms = min(provider_timeout_ms, remaining_ms) if provider_timeout_ms else remaining_ms
+
+        if on_retry:
+            on_retry(attempt, error, delay_ms)
+        if delay_ms > 0:
+            await sleep(delay_ms / 1000)
+        attempt += 1
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import AsyncIterator, Dict, List, Mapping, Tuple
+
+from src.adapters.observability.logging import get_logger
+from src.adapters.observability.metrics import scheduler_calls_in_flight, scheduler_wait_seconds
+from src.contracts.request import Priority
+
+logger = get_logger()
+
+PRIORITY_RANK: Dict[str, int] = {"high": 0, "normal": 1, "low": 2}
+
+# Priority of the request whose provider calls run in the current task; set by
+# `Orchestrator.run` so every call layer below picks it up without threading it through.
+request_priority: ContextVar[Priority] = ContextVar("request_priority", default="normal")
+
+
+class _PriorityGate:
+    """
+    Counting gate that hands freed slots to the highest-priority waiter (FIFO within a class).
+
+    `reserved` slots are only ever given to high priority, so a burst of normal/low work
+    cannot take the last slots an interactive request needs.
+    """
+
+    def __init__(self, limit: int, reserved: int = 0) -> None:
+        self.limit = limit
+        self.reserved = reserved
+        self.in_use = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+
+    def _available(self, rank: int) -> bool:
+        free = self.limit - self.in_use
+        return free > (0 if rank == 0 else self.reserved)
+
+    def _queued_at_or_above(self, rank: int) -> bool:
+        return any(r <= rank and not waiter.done() for r, _, waiter in self._waiters)
+
+    async def acquire(self, priority: Priority) -> None:
+        rank = PRIORITY_RANK[priority]
+        if self._available(rank) and not self._queued_at_or_above(rank):
+            self.in_use += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (rank, next(self._seq), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Granted just as the caller went away: hand the slot on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.in_use -= 1
+        while self._waiters:
+            rank, _, waiter = self._waiters[0]
+            if waiter.done():
+                heapq.heappop(self._waiters)
+                continue
+            # The head has the best rank; when it cannot start, lower classes cannot either.
+            if not self._available(rank):
+                break
+            heapq.heappop(self._waiters)
+            self.in_use += 1
+            waiter.set_result(None)
+
+
+class CallScheduler:
+    """
+    Bounded, priority-aware scheduler for provider calls shared by every request it serves.
+
+    A call holds one global slot and one slot of its provider for the duration of the
+    provider attempt. The provider slot is taken first so calls queued behind a saturated
+    provider do not hold global slots that other providers could use. Freed slots go to
+    queued high-priority calls before normal and low ones, and `reserved_high` global slots
+    are kept for high priority only.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        per_provider_limit: int | Mapping[str, int] | None = None,
+        reserved_high: int = 0,
+    ) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        if not 0 <= reserved_high < max_in_flight:
+            raise ValueError("reserved_high must be >= 0 and below max_in_flight")
+        self.max_in_flight = max_in_flight
+        self.per_provider_limit = per_provider_limit
+        self.reserved_high = reserved_high
+        self._global = _PriorityGate(max_in_flight, reserved_high)
+        self._providers: Dict[str, _PriorityGate | None] = {}
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def provider_limit(self, provider: str) -> int | None:
+        limit = self.per_provider_limit
+        if isinstance(limit, Mapping):
+            limit = limit.get(provider)
+        if limit is None:
+            return None
+        if limit < 1:
+            raise ValueError("per_provider_limit values must be >= 1")
+        return limit
+
+    def _provider_gate(self, provider: str) -> _PriorityGate | None:
+        if provider not in self._providers:
+            limit = self.provider_limit(provider)
+            self._providers[provider] = _PriorityGate(limit) if limit is not None else None
+        return self._providers[provider]
+
+    def _record(self, provider: str, waited_s: float | None = None) -> None:
+        try:
+            scheduler_calls_in_flight.set(self._in_flight)
+            if waited_s is not None:
+                scheduler_wait_seconds.labels(provider=provider).observe(waited_s)
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="scheduler_calls_in_flight", provider=provider)
+
+    @asynccontextmanager
+    async def slot(self, provider: str, priority: Priority | None = None) -> AsyncIterator[None]:
+        """Hold a provider and a global slot; `priority` defaults to the current request's."""
+        priority = priority or request_priority.get()
+        started = time.perf_counter()
+        provider_gate = self._provider_gate(provider)
+        if provider_gate is not None:
+            await provider_gate.acquire(priority)
+        try:
+            await self._global.acquire(priority)
+            try:
+                self._in_flight += 1
+                self._record(provider, time.perf_counter() - started)
+                try:
+                    yield
+                finally:
+                    self._in_flight -= 1
+                    self._record(provider)
+            finally:
+                self._global.release()
+        finally:
+            if provider_gate is not None:
+                provider_gate.release()
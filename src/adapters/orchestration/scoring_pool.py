@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import time
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor
+from typing import Any, Callable, List, Sequence, Tuple
+
+from src.adapters.observability.logging import get_logger
+from src.adapters.observability.metrics import (
+    scoring_analyzer_seconds,
+    scoring_execution_seconds,
+    scoring_pool_fallbacks_total,
+    scoring_queue_wait_seconds,
+    scoring_timeouts_total,
+)
+from src.contracts.response import ModelResponse, ScoreDetail, ScoreStats
+from src.core.scoring.engine import (
+    ANALYZERS,
+    assemble_detail,
+    run_analyzer,
+    scorable_code,
+    score_response,
+    summarize_scores,
+    unscorable_detail,
+)
+from src.policy.models import ScoringPoolConfig
+
+logger = get_logger()
+
+_WARMUP_SNIPPET = '''"""Warm-up module."""
+
+
+def add(a: int, b: int) -> int:
+    """Return the sum."""
+    return a + b
+
+
+def test_add():
+    assert add(1, 2) == 3
+'''
+
+
+def warm_analyzers() -> None:
+    """Run every analyzer once so imports and first-use caches are paid before real traffic."""
+    score_response(ModelResponse(model="warmup", content=_WARMUP_SNIPPET, latency_ms=1))
+
+
+def _ready() -> bool:
+    return True
+
+
+def _timed(fn: Callable[..., Any], *args: Any) -> Tuple[Any, float, float]:
+    # Wall-clock stamps: they are compared with the submitting process's clock.
+    started = time.time()
+    result = fn(*args)
+    return result, started, time.time()
+
+
+def _error_detail(response: ModelResponse, metadata: dict) -> ScoreDetail:
+    return ScoreDetail(
+        model=response.model,
+        performance=0.0,
+        complexity=0.0,
+        tests=0.0,
+        style=0.0,
+        documentation=0.0,
+        dead_code=0.0,
+        security=0.0,
+        score=0.0,
+        error=True,
+        metadata=metadata,
+    )
+
+
+def _timeout(response: ModelResponse, timeout_s: float) -> ScoreDetail:
+    _count(scoring_timeouts_total, "scoring_timeouts_total")
+    logger.warning("scoring_timeout", model=response.model, timeout_ms=int(timeout_s * 1000))
+    return _error_detail(response, {"scoring_timeout": True})
+
+
+def _observe(metric, value: float, name: str, **labels: str) -> None:
+    try:
+        (metric.labels(**labels) if labels else metric).observe(max(value, 0.0))
+    except Exception:
+        logger.warning("metrics_emit_failed", metric=name)
+
+
+def _count(metric, name: str, **labels: str) -> None:
+    try:
+        (metric.labels(**labels) if labels else metric).inc()
+    except Exception:
+        logger.warning("metrics_emit_failed", metric=name)
+
+
+class ScoringPool:
+    """
+    Process-wide pool of scoring workers.
+
+    Each response is scored in its own task, so one pathological response only costs its
+    own `timeout_ms` and the others of the request still finish. With `fan_out_analyzers`
+    the code is extracted in one task and every analyzer then runs as a task of its own,
+    so a response takes about as long as its slowest analyzer rather than their sum. Workers import and run the analyzers
+    once when they start. A response that times out is scored as an error; its workers
+    keep running it to completion, since a started task cannot be cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._shape: Tuple[int, str] | None = None
+
+    def _pool(self, config: ScoringPoolConfig) -> ProcessPoolExecutor:
+        shape = (config.workers, config.start_method)
+        if self._executor is None or self._shape != shape:
+            # First use or the policy changed; submitted tasks finish on the old pool.
+            self.reset()
+            self._executor = ProcessPoolExecutor(
+                max_workers=config.workers,
+                mp_context=multiprocessing.get_context(config.start_method),
+                initializer=warm_analyzers,
+            )
+            self._shape = shape
+        return self._executor
+
+    async def start(self, config: ScoringPoolConfig) -> int:
+        """Start and warm every worker up front; returns the number of workers."""
+        loop = asyncio.get_running_loop()
+        pool = self._pool(config)
+        # Submitted together so each lands on a freshly started worker.
+        await asyncio.gather(*(loop.run_in_executor(pool, _ready) for _ in range(config.workers)))
+        return config.workers
+
+    async def _submit(
+        self, config: ScoringPoolConfig, fn: Callable[..., Any], *args: Any
+    ) -> Tuple[Any, float, float]:
+        loop = asyncio.get_running_loop()
+        submitted = time.time()
+        result, started, finished = await loop.run_in_executor(self._pool(config), _timed, fn, *args)
+        _observe(scoring_queue_wait_seconds, started - submitted, "scoring_queue_wait_seconds")
+        return result, started, finished
+
+    async def _in_pool(self, response: ModelResponse, config: ScoringPoolConfig) -> ScoreDetail:
+        if not config.fan_out_analyzers:
+            detail, started, finished = await self._submit(config, score_response, response)
+        else:
+            # Extracting and parsing the code is itself CPU-bound; it runs in a worker too.
+            code, started, _ = await self._submit(config, scorable_code, response)
+            if code is None:
+                return unscorable_detail(response)
+            runs = await asyncio.gather(
+                *(self._submit(config, run_analyzer, name, code) for name in ANALYZERS)
+            )
+            for name, (_, analyzer_started, analyzer_finished) in zip(ANALYZERS, runs):
+                _observe(
+                    scoring_analyzer_seconds,
+                    analyzer_finished - analyzer_started,
+                    "scoring_analyzer_seconds",
+                    analyzer=name,
+                )
+            detail = assemble_detail(response, {name: run[0] for name, run in zip(ANALYZERS, runs)})
+            finished = max(run[2] for run in runs)
+        _observe(scoring_execution_seconds, finished - started, "scoring_execution_seconds", mode="pool")
+        return detail
+
+    async def _score_one(
+        self, response: ModelResponse, config: ScoringPoolConfig, timeout_s: float
+    ) -> ScoreDetail:
+        started = time.perf_counter()
+        try:
+            return await asyncio.wait_for(self._in_pool(response, config), timeout_s)
+        except asyncio.TimeoutError:
+            return _timeout(response, timeout_s)
+        except BrokenExecutor as exc:
+            # A worker died; the next call starts a fresh pool.
+            self.reset()
+            _count(scoring_pool_fallbacks_total, "scoring_pool_fallbacks_total", reason="broken")
+            logger.warning("scoring_pool_fallback", model=response.model, reason="broken", error=str(exc))
+        except Exception as exc:
+            # The analyzers themselves failed; running them again in-process would fail the same way.
+            logger.warning("scoring_failed", model=response.model, error=str(exc))
+            return _error_detail(response, {"scoring_error": type(exc).__name__})
+        inline_started = time.perf_counter()
+        try:
+            # Only the rest of the response's budget; a thread past it keeps running but is not awaited.
+            detail = await asyncio.wait_for(
+                asyncio.to_thread(score_response, response),
+                max(timeout_s - (inline_started - started), 0.0),
+            )
+        except asyncio.TimeoutError:
+            return _timeout(response, timeout_s)
+        _observe(
+            scoring_execution_seconds,
+            time.perf_counter() - inline_started,
+            "scoring_execution_seconds",
+            mode="inline",
+        )
+        return detail
+
+    async def score(
+        self,
+        responses: Sequence[ModelResponse],
+        config: ScoringPoolConfig,
+        timeout_ms: int | None = None,
+    ) -> Tuple[List[ScoreDetail], ScoreStats]:
+        """Pool counterpart of `compute_scores`; `timeout_ms` caps the configured per-response timeout."""
+        timeout_s = min(config.timeout_ms, timeout_ms or config.timeout_ms) / 1000
+        details = await asyncio.gather(
+            *(self._score_one(response, config, timeout_s) for response in responses)
+        )
+        return list(details), summarize_scores(details)
+
+    def reset(self) -> None:
+        """Let the workers exit once their submitted tasks are done; the next call starts a new pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+        self._executor = None
+        self._shape = None
+
+
+_SCORING_POOL = ScoringPool()
+
+
+def get_scoring_pool() -> ScoringPool:
+    return _SCORING_POOL
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Flight(Generic[T]):
+    task: asyncio.Future
+    waiters: int = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls onto one in-flight task.
+
+    Each caller awaits the shared task through `asyncio.shield`, so cancelling one caller
+    never cancels the work for the others; the shared task is cancelled only when its
+    last waiter goes away. Keys are forgotten as soon as the task finishes, so later calls
+    start fresh (caching completed results is the response cache's job).
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[str, _Flight] = {}
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def _forget(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    async def do(self, key: str, call: Callable[[], Awaitable[T]]) -> tuple[T, bool]:
+        """Run `call` or join an identical in-flight one; returns (result, shared)."""
+        flight = self._flights.get(key)
+        if flight is not None and flight.task.get_loop() is not asyncio.get_running_loop():
+            flight = None  # left behind by a closed event loop
+        shared = flight is not None
+        if flight is None:
+            flight = _Flight(task=asyncio.ensure_future(call()))
+            self._flights[key] = flight
+            flight.task.add_done_callback(lambda _task, f=flight: self._forget(key, f))
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), shared
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                self._forget(key, flight)
+                flight.task.cancel()
+
+
+_SINGLE_FLIGHT = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    return _SINGLE_FLIGHT
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Awaitable, TypeVar
+import time
+from math import ceil
+from typing import Awaitable, Callable, TypeVar
 
 T = TypeVar("T")
 
@@ -9,3 +11,52 @@ T = TypeVar("T")
 async def enforce_timeout(task: Awaitable[T], timeout_ms: int) -> T:
     timeout_seconds = timeout_ms / 1000
     return await asyncio.wait_for(task, timeout_seconds)
+
+
+class Deadline:
+    """
+    End-to-end budget of one request, fixed at request entry on the `perf_counter` clock.
+
+    Every stage asks the same object how much time is left instead of redoing
+    `e2e_timeout - elapsed` arithmetic; `reserve_ms` keeps part of the budget back for
+    the stages that still have to run afterwards (scoring, judging, validation).
+    """
+
+    def __init__(
+        self,
+        budget_ms: int,
+        *,
+        start: float | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.budget_ms = budget_ms
+        self._clock = clock
+        self.start = clock() if start is None else start
+        self.at = self.start + budget_ms / 1000
+
+    def elapsed_ms(self) -> int:
+        return int((self._clock() - self.start) * 1000)
+
+    def remaining_ms(self, reserve_ms: int = 0) -> int:
+        return max(ceil((self.at - self._clock()) * 1000) - reserve_ms, 0)
+
+    @property
+    def expired(self) -> bool:
+        return self._clock() >= self.at
+
+    def before(self, reserve_ms: int = 0) -> float:
+        """Absolute deadline (`perf_counter` timestamp) leaving `reserve_ms` for later stages."""
+        return self.at - reserve_ms / 1000
+
+    def clamp_ms(self, timeout_ms: int | None, reserve_ms: int = 0) -> int:
+        """`timeout_ms` cut to what is left of the budget (the budget alone when None)."""
+        remaining = self.remaining_ms(reserve_ms)
+        return min(timeout_ms, remaining) if timeout_ms else remaining
+
+
+def clamp_to_deadline(timeout_ms: int | None, deadline_at: float | None) -> int | None:
+    """Clamp a per-call timeout to an absolute `perf_counter` deadline; never below 1 ms."""
+    if deadline_at is None:
+        return timeout_ms
+    remaining_ms = max(ceil((deadline_at - time.perf_counter()) * 1000), 1)
+    return min(timeout_ms, remaining_ms) if timeout_ms else remaining_ms
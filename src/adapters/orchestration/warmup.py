@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Iterable, List
+
+from src.adapters.observability.logging import get_logger
+from src.adapters.observability.metrics import warmup_step_duration_seconds
+from src.policy.loader import PolicyStore
+
+logger = get_logger()
+
+@dataclass(frozen=True)
+class WarmupStep:
+    name: str
+    duration_ms: float
+    ok: bool = True
+    detail: str | None = None
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    """Per-step timings of `warm_up`; `ready` is False when any step failed."""
+
+    steps: List[WarmupStep] = field(default_factory=list)
+
+    @property
+    def ready(self) -> bool:
+        return all(step.ok for step in self.steps)
+
+    @property
+    def total_ms(self) -> float:
+        return sum(step.duration_ms for step in self.steps)
+
+
+async def _step(steps: List[WarmupStep], name: str, run: Callable[[], Awaitable[str | None]]) -> None:
+    started = time.perf_counter()
+    ok, detail = True, None
+    try:
+        detail = await run()
+    except Exception as exc:
+        ok, detail = False, f"{type(exc).__name__}: {exc}"
+    duration_ms = (time.perf_counter() - started) * 1000
+    steps.append(WarmupStep(name=name, duration_ms=duration_ms, ok=ok, detail=detail))
+    try:
+        warmup_step_duration_seconds.labels(step=name).set(duration_ms / 1000)
+    except Exception:
+        logger.warning("metrics_emit_failed", metric="warmup_step_duration_seconds", step=name)
+    log = logger.info if ok else logger.warning
+    log("warmup_step", step=name, duration_ms=round(duration_ms, 1), ok=ok, detail=detail)
+
+
+async def warm_up(
+    models: Iterable[str],
+    *,
+    policy_store: PolicyStore,
+    provider_overrides: dict[str, str] | None = None,
+    timeout_ms: int | None = None,
+    freeze_gc: bool = False,
+) -> WarmupReport:
+    """
+    Pay first-request costs up front: policy parsing, preamble catalogs, one pooled
+    connection per resolved provider and a first run of every scoring analyzer (in every
+    scoring worker too when the `scoring` pool is enabled).
+
+    With `freeze_gc` the warmed heap is moved to the permanent generation so later
+    collections skip it (and forked workers keep sharing its pages).
+    """
+    from src.adapters.providers.openrouter import (
+        get_preamble_catalog,
+        get_python_code_format_preamble,
+        register_default_openrouter,
+    )
+    from src.adapters.providers.routing import get_routing_table
+
+    steps: List[WarmupStep] = []
+    models = list(models)
+
+    async def policy() -> str:
+        return policy_store.current().policy_id
+
+    async def preambles() -> str:
+        get_python_code_format_preamble()
+        return f"{len(get_preamble_catalog())} catalog preambles"
+
+    async def connections() -> str | None:
+        register_default_openrouter()
+        routes = get_routing_table(provider_overrides)
+        providers = {}
+        for model in models:
+            route = routes.resolve(model)
+            providers.setdefault(route.provider_name, route.provider)
+        warmable = [p for p in providers.values() if callable(getattr(p, "warmup", None))]
+        results = await asyncio.gather(
+            *(provider.warmup(timeout_ms) for provider in warmable), return_exceptions=True
+        )
+        failed = [p.name for p, r in zip(warmable, results) if isinstance(r, BaseException)]
+        if failed:
+            raise RuntimeError(f"connection warm-up failed for {', '.join(failed)}")
+        return ", ".join(sorted(p.name for p in warmable)) or None
+
+    async def analyzers() -> str | None:
+        from src.adapters.orchestration.scoring_pool import get_scoring_pool, warm_analyzers
+
+        await asyncio.to_thread(warm_analyzers)
+        scoring = policy_store.current().scoring
+        if scoring.enabled:
+            return f"{await get_scoring_pool().start(scoring)} scoring workers"
+        return None
+
+    await _step(steps, "policy", policy)
+    await _step(steps, "preambles", preambles)
+    await _step(steps, "connections", connections)
+    await _step(steps, "analyzers", analyzers)
+    if freeze_gc:
+
+        async def freeze() -> str:
+            gc.collect()
+            gc.freeze()
+            return f"{gc.get_freeze_count()} objects frozen"
+
+        await _step(steps, "gc_freeze", freeze)
+    return WarmupReport(steps=steps)
@@ -20,5 +20,15 @@ class ProviderAdapter(Protocol):
         request_id: str,
         system_preamble: str | None = None,
         provider_timeout_ms: int | None = None,
+        stream: bool = False,
     ) -> ProviderResult:
-        """Execute the provider call and return a ProviderResult."""
+        """
+        Execute the provider call and return a ProviderResult.
+
+        With `stream=True` the adapter consumes the response incrementally and should
+        populate `ttft_ms`/`tokens_per_second` on the result. Callers only pass `stream`
+        when streaming is requested, so adapters without streaming support keep working.
+        """
+
+    # Optional: `async def warmup(self, timeout_ms: int | None = None) -> None` opens pooled
+    # connections ahead of the first call; `warm_up()` skips providers that lack it.
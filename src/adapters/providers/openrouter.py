@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import List, Tuple
 
 import httpx
@@ -8,7 +12,8 @@ import httpx
 from src.contracts.errors import ErrorEnvelope
 from src.adapters.providers.base import ProviderAdapter
 from src.adapters.providers.registry import register_provider
-from src.adapters.providers.transport import get_client
+from src.adapters.providers.sse import iter_sse_data
+from src.adapters.providers.transport import get_client, pooled_request, request_timeout
 
 import json
 from pathlib import Path
@@ -51,6 +56,31 @@ def get_python_code_format_preamble() -> str:
     return _PYTHON_PREAMBLE_CACHE
 
 
+_PREAMBLE_CATALOG_CACHE: dict[str, dict] | None = None
+
+
+def load_preamble_catalog() -> dict[str, dict]:
+    """Load the preamble catalog (`config/prompts/catalog.yaml`), keyed by preamble key."""
+    import yaml
+
+    catalog_path = Path(__file__).parent.parent.parent / "config" / "prompts" / "catalog.yaml"
+    with open(catalog_path, encoding="utf-8") as f:
+        catalog = yaml.safe_load(f) or {}
+    if not isinstance(catalog, dict):
+        raise RuntimeError("preamble catalog must be a mapping of key to entry")
+    return catalog
+
+
+def get_preamble_catalog() -> dict[str, dict]:
+    global _PREAMBLE_CATALOG_CACHE
+    if _PREAMBLE_CATALOG_CACHE is None:
+        try:
+            _PREAMBLE_CATALOG_CACHE = load_preamble_catalog()
+        except FileNotFoundError as exc:
+            raise RuntimeError("preamble catalog configuration missing") from exc
+    return _PREAMBLE_CATALOG_CACHE
+
+
 # Backward compatibility: expose a lazy attribute without eager file IO
 def __getattr__(name: str):
     if name == "PYTHON_CODE_FORMAT_PREAMBLE":
@@ -64,6 +94,12 @@ class OpenRouterProvider(ProviderAdapter):
     def supports(self, model: str) -> bool:
         return True
 
+    async def warmup(self, timeout_ms: int | None = None) -> None:
+        """Open a pooled (TLS) connection ahead of the first real call; the response is ignored."""
+        client = get_client()
+        async with pooled_request():
+            await client.get("/models", timeout=request_timeout(timeout_ms))
+
     async def call(
         self,
         prompt: str,
@@ -71,7 +107,29 @@ class OpenRouterProvider(ProviderAdapter):
         request_id: str,
         system_preamble: str | None = None,
         provider_timeout_ms: int | None = None,
+        stream: bool = False,
     ):
+        from src.adapters.orchestration.models import ProviderResult  # local import to avoid cycle
+
+        if stream:
+            content, latency_ms, error, stats = await stream_model(
+                prompt,
+                model,
+                request_id,
+                system_preamble=system_preamble,
+                provider_timeout_ms=provider_timeout_ms,
+            )
+            return ProviderResult(
+                model=model,
+                content=content,
+                latency_ms=latency_ms,
+                error=error,
+                provider=self.name,
+                ttft_ms=stats.ttft_ms,
+                completion_tokens=stats.completion_tokens,
+                tokens_per_second=stats.tokens_per_second,
+            )
+
         content, latency_ms, error = await call_model(
             prompt,
             model,
@@ -79,7 +137,6 @@ class OpenRouterProvider(ProviderAdapter):
             system_preamble=system_preamble,
             provider_timeout_ms=provider_timeout_ms,
         )
-        from src.adapters.orchestration.models import ProviderResult  # local import to avoid cycle
 
         return ProviderResult(
             model=model,
@@ -90,6 +147,15 @@ class OpenRouterProvider(ProviderAdapter):
         )
 
 
+@dataclass
+class StreamStats:
+    """Latency breakdown of a streamed generation."""
+
+    ttft_ms: int | None = None
+    completion_tokens: int | None = None
+    tokens_per_second: float | None = None
+
+
 def _build_messages(prompt: str, system_preamble: str | None) -> List[dict]:
     messages = []
     if system_preamble:
@@ -105,7 +171,7 @@ async def call_model(
     system_preamble: str | None = None,
     provider_timeout_ms: int | None = None,
 ) -> Tuple[str | None, int | None, ErrorEnvelope | None]:
-    client = get_client(timeout_ms=provider_timeout_ms)
+    client = get_client()
     payload = {
         "model": model,
         "messages": _build_messages(prompt, system_preamble),
@@ -115,7 +181,13 @@ async def call_model(
 
     start = time.perf_counter()
     try:
-        response = await client.post("/chat/completions", json=payload, headers=headers)
+        async with pooled_request():
+            response = await client.post(
+                "/chat/completions",
+                json=payload,
+                headers=headers,
+                timeout=request_timeout(provider_timeout_ms),
+            )
         latency_ms = int((time.perf_counter() - start) * 1000)
         response.raise_for_status()
         data = response.json()
@@ -142,19 +214,7 @@ async def call_model(
         )
     except httpx.HTTPStatusError as exc:
         latency_ms = int((time.perf_counter() - start) * 1000)
-        status_code = exc.response.status_code
-        error_type = "rate_limited" if status_code == 429 else "http_error"
-        retryable = status_code >= 500 or status_code == 429
-        return (
-            None,
-            latency_ms,
-            ErrorEnvelope(
-                type=error_type,
-                message=str(exc),
-                retryable=retryable,
-                status_code=status_code,
-            ),
-        )
+        return None, latency_ms, _status_error_envelope(exc)
     except (ValueError, httpx.RequestError) as exc:
         latency_ms = int((time.perf_counter() - start) * 1000)
         error_type = "invalid_response" if isinstance(exc, ValueError) else "http_error"
@@ -165,6 +225,154 @@ async def call_model(
         )
 
 
+def parse_retry_after_ms(value: str | None) -> int | None:
+    """Parse a Retry-After header (delta-seconds or HTTP-date) into milliseconds."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(int(float(value) * 1000), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(int((retry_at - datetime.now(timezone.utc)).total_seconds() * 1000), 0)
+
+
+def _status_error_envelope(exc: httpx.HTTPStatusError) -> ErrorEnvelope:
+    status_code = exc.response.status_code
+    error_type = "rate_limited" if status_code == 429 else "http_error"
+    retryable = status_code >= 500 or status_code == 429
+    return ErrorEnvelope(
+        type=error_type,
+        message=str(exc),
+        retryable=retryable,
+        status_code=status_code,
+        retry_after_ms=parse_retry_after_ms(exc.response.headers.get("retry-after")),
+    )
+
+
+def _generation_rate(tokens: int | None, ttft_ms: int | None, latency_ms: int) -> float | None:
+    if not tokens or ttft_ms is None:
+        return None
+    generation_ms = latency_ms - ttft_ms
+    if generation_ms <= 0:
+        return None
+    return tokens / (generation_ms / 1000)
+
+
+async def stream_model(
+    prompt: str,
+    model: str,
+    request_id: str,
+    system_preamble: str | None = None,
+    provider_timeout_ms: int | None = None,
+) -> Tuple[str | None, int | None, ErrorEnvelope | None, StreamStats]:
+    """
+    Streaming variant of `call_model` (server-sent events).
+
+    Content is assembled incrementally; time-to-first-token and the generation rate are
+    reported in `StreamStats`. `provider_timeout_ms` bounds the whole stream, not just
+    each read, so a trickling generation is cut off like a slow non-streaming call.
+    """
+    client = get_client()
+    payload = {
+        "model": model,
+        "messages": _build_messages(prompt, system_preamble),
+        "stream": True,
+        "stream_options": {"include_usage": True},
+    }
+    headers = {"x-request-id": request_id}
+    timeout = request_timeout(provider_timeout_ms)
+    stats = StreamStats()
+    parts: list[str] = []
+    chunk_count = 0
+
+    start = time.perf_counter()
+
+    async def _consume() -> ErrorEnvelope | None:
+        nonlocal chunk_count
+        async with client.stream(
+            "POST", "/chat/completions", json=payload, headers=headers, timeout=timeout
+        ) as response:
+            if response.status_code >= 400:
+                await response.aread()
+            response.raise_for_status()
+            async for data in iter_sse_data(response.aiter_lines()):
+                chunk = json.loads(data)
+                if not isinstance(chunk, dict):
+                    continue
+                if chunk.get("error"):
+                    return ErrorEnvelope(
+                        type="provider_error",
+                        message=str(chunk["error"]),
+                        retryable=False,
+                        status_code=response.status_code,
+                    )
+                usage = chunk.get("usage")
+                if isinstance(usage, dict) and usage.get("completion_tokens") is not None:
+                    stats.completion_tokens = int(usage["completion_tokens"])
+                for choice in chunk.get("choices") or []:
+                    delta = (choice or {}).get("delta") or {}
+                    text = delta.get("content")
+                    if text:
+                        if stats.ttft_ms is None:
+                            stats.ttft_ms = int((time.perf_counter() - start) * 1000)
+                        parts.append(text)
+                        chunk_count += 1
+        return None
+
+    async with pooled_request():
+        try:
+            error = await asyncio.wait_for(_consume(), timeout.read)
+        except (asyncio.TimeoutError, httpx.TimeoutException) as exc:
+            latency_ms = int((time.perf_counter() - start) * 1000)
+            message = str(exc) or "stream timed out"
+            return (
+                None,
+                latency_ms,
+                ErrorEnvelope(type="timeout", message=message, retryable=True, status_code=None),
+                stats,
+            )
+        except httpx.HTTPStatusError as exc:
+            latency_ms = int((time.perf_counter() - start) * 1000)
+            return None, latency_ms, _status_error_envelope(exc), stats
+        except (ValueError, httpx.RequestError) as exc:
+            latency_ms = int((time.perf_counter() - start) * 1000)
+            error_type = "invalid_response" if isinstance(exc, ValueError) else "http_error"
+            return (
+                None,
+                latency_ms,
+                ErrorEnvelope(type=error_type, message=str(exc), retryable=False, status_code=None),
+                stats,
+            )
+
+    latency_ms = int((time.perf_counter() - start) * 1000)
+    if error is not None:
+        return None, latency_ms, error, stats
+    if not parts:
+        return (
+            None,
+            latency_ms,
+            ErrorEnvelope(
+                type="invalid_response",
+                message="Stream ended without content",
+                retryable=False,
+                status_code=None,
+            ),
+            stats,
+        )
+    if stats.completion_tokens is None:
+        # Without a usage block, each content delta approximates one token.
+        stats.completion_tokens = chunk_count
+    stats.tokens_per_second = _generation_rate(stats.completion_tokens, stats.ttft_ms, latency_ms)
+    return "".join(parts), latency_ms, None, stats
+
+
 def register_default_openrouter() -> None:
     """Idempotently register OpenRouter as the default provider."""
     try:
@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from typing import Callable, Dict, Tuple
+
+from src.policy.models import RateLimitConfig, RateLimitRule
+
+# Error message for calls rejected locally; these never reached the provider.
+CLIENT_RATE_LIMITED = "client_rate_limited"
+
+
+def estimate_tokens(text: str | None) -> int:
+    """Rough token count (~4 characters per token) used to pre-charge token buckets."""
+    if not text:
+        return 0
+    return max(1, len(text) // 4)
+
+
+class TokenBucket:
+    """
+    Token bucket that hands out reservations and may go into debt.
+
+    The fill rate is cut multiplicatively when the provider pushes back (429/Retry-After)
+    and recovers linearly to the configured rate over `recovery_s`.
+    """
+
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = now
+
+    def _refill(self, now: float, recovery_s: float) -> None:
+        elapsed = max(now - self._updated, 0.0)
+        self._updated = now
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        if self.rate < self.base_rate:
+            self.rate = min(self.base_rate, self.rate + self.base_rate * elapsed / recovery_s)
+
+    def wait_s(self, amount: float, now: float, recovery_s: float) -> float:
+        self._refill(now, recovery_s)
+        deficit = min(amount, self.capacity) - self.tokens
+        return deficit / self.rate if deficit > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        self.tokens -= amount
+
+    def throttle(self, now: float, recovery_s: float, factor: float, min_fraction: float) -> None:
+        self._refill(now, recovery_s)
+        self.rate = max(self.rate * factor, self.base_rate * min_fraction)
+
+
+BucketKey = Tuple[str, str, str]
+
+
+class RateLimiter:
+    """
+    Process-wide client-side rate limiter keyed by provider and by model.
+
+    Each configured rule yields a requests/sec bucket and/or a tokens/min bucket; a call
+    must fit every bucket that applies to it. Reservations are all-or-nothing: a call that
+    would wait longer than allowed takes nothing and is rejected.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._buckets: Dict[BucketKey, tuple[RateLimitRule, TokenBucket]] = {}
+        # Retry-After pauses apply per provider even when no bucket is configured for it.
+        self._paused_until: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: BucketKey, rule: RateLimitRule, now: float) -> TokenBucket | None:
+        kind = key[2]
+        if kind == "requests":
+            if rule.requests_per_second is None:
+                return None
+            rate = rule.requests_per_second
+            capacity = float(rule.burst or max(1, math.ceil(rate)))
+        else:
+            if rule.tokens_per_minute is None:
+                return None
+            rate = rule.tokens_per_minute / 60
+            capacity = float(rule.tokens_per_minute)
+        entry = self._buckets.get(key)
+        if entry is None or entry[0] != rule:
+            # New key or the policy changed: start from a full bucket at the new rate.
+            entry = (rule, TokenBucket(rate, capacity, now))
+            self._buckets[key] = entry
+        return entry[1]
+
+    def _applicable(
+        self, provider: str, model: str, config: RateLimitConfig, now: float
+    ) -> list[tuple[TokenBucket, str]]:
+        buckets: list[tuple[TokenBucket, str]] = []
+        for scope, name, rule in (
+            ("provider", provider, config.providers.get(provider)),
+            ("model", model, config.models.get(model)),
+        ):
+            if rule is None:
+                continue
+            for kind in ("requests", "tokens"):
+                bucket = self._bucket((scope, name, kind), rule, now)
+                if bucket is not None:
+                    buckets.append((bucket, kind))
+        return buckets
+
+    def reserve(
+        self, provider: str, model: str, config: RateLimitConfig, tokens: int, max_wait_s: float
+    ) -> float | None:
+        """Reserve capacity for one call; returns the wait in seconds, or None when over `max_wait_s`."""
+        with self._lock:
+            now = self._clock()
+            buckets = self._applicable(provider, model, config, now)
+            amounts = [(bucket, 1.0 if kind == "requests" else float(tokens)) for bucket, kind in buckets]
+            wait = max(
+                (bucket.wait_s(amount, now, config.recovery_s) for bucket, amount in amounts), default=0.0
+            )
+            wait = max(wait, self._paused_until.get(provider, now) - now)
+            if wait > max_wait_s:
+                return None
+            for bucket, amount in amounts:
+                bucket.take(amount)
+            return wait
+
+    async def acquire(
+        self, provider: str, model: str, config: RateLimitConfig, tokens: int, max_wait_ms: int
+    ) -> float | None:
+        """Wait for a reservation; returns the time waited in ms, or None when rejected."""
+        wait = self.reserve(provider, model, config, tokens, max(max_wait_ms, 0) / 1000)
+        if wait is None:
+            return None
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait * 1000
+
+    def debit(self, provider: str, model: str, config: RateLimitConfig, tokens: int) -> None:
+        """Charge tokens only known after the call (completion output) to the token buckets."""
+        if tokens <= 0:
+            return
+        with self._lock:
+            now = self._clock()
+            for bucket, kind in self._applicable(provider, model, config, now):
+                if kind == "tokens":
+                    bucket.take(float(tokens))
+
+    def throttle(
+        self, provider: str, model: str, config: RateLimitConfig, retry_after_ms: int | None
+    ) -> None:
+        """Provider answered 429: pause the provider until Retry-After and cut bucket fill rates."""
+        pause_ms = config.default_retry_after_ms if retry_after_ms is None else retry_after_ms
+        with self._lock:
+            now = self._clock()
+            self._paused_until[provider] = max(self._paused_until.get(provider, now), now + pause_ms / 1000)
+            for bucket, _ in self._applicable(provider, model, config, now):
+                bucket.throttle(now, config.recovery_s, config.backoff_factor, config.min_rate_fraction)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._buckets.clear()
+            self._paused_until.clear()
+
+
+_LIMITER = RateLimiter()
+
+
+def get_rate_limiter() -> RateLimiter:
+    return _LIMITER
@@ -9,11 +9,17 @@ from src.errors import LcsError
 _providers: Dict[str, ProviderAdapter] = {}
 _default_provider_name: str | None = None
 _lock = threading.Lock()
+# Bumped on every registry change so compiled routing tables know when to rebuild.
+_version = 0
+
+
+def registry_version() -> int:
+    return _version
 
 
 def register_provider(provider: ProviderAdapter, *, default: bool = False) -> None:
     """Register a provider adapter. Default provider is unique."""
-    global _default_provider_name
+    global _default_provider_name, _version
     if not provider or not getattr(provider, "name", None):
         raise ValueError("provider must define a non-empty name")
     with _lock:
@@ -24,6 +30,7 @@ def register_provider(provider: ProviderAdapter, *, default: bool = False) -> No
                 raise ValueError("default provider already registered")
             _default_provider_name = provider.name
         _providers[provider.name] = provider
+        _version += 1
 
 
 def get_provider(name: str) -> ProviderAdapter:
@@ -72,7 +79,8 @@ def resolve_provider(model_name: str, override_name: str | None = None) -> Tuple
 
 def clear_registry() -> None:
     """Testing helper to reset registry."""
-    global _default_provider_name
+    global _default_provider_name, _version
     with _lock:
         _providers.clear()
         _default_provider_name = None
+        _version += 1
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, Mapping, Sequence, Tuple
+
+from src.adapters.providers import registry
+from src.adapters.providers.base import ProviderAdapter
+from src.errors import LcsError
+
+
+@dataclass(frozen=True)
+class Route:
+    model: str
+    provider: ProviderAdapter
+    provider_name: str
+    stripped_model: str
+
+
+class RoutingTable:
+    """
+    Compiled model -> provider routes for one (registry version, overrides, fallbacks) set.
+
+    Resolutions, including failures, are memoised so the `provider::model` syntax and the
+    provider's `supports()` check run once per model instead of on every call.
+    """
+
+    def __init__(
+        self,
+        version: int,
+        overrides: Mapping[str, str] | None = None,
+        fallbacks: Mapping[str, Sequence[str]] | None = None,
+    ) -> None:
+        self.version = version
+        self._overrides = dict(overrides or {})
+        self._fallbacks = {model: tuple(chain) for model, chain in (fallbacks or {}).items()}
+        self._routes: Dict[str, Route | LcsError] = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, model: str) -> Route:
+        """Route for `model`; raises the registry's `LcsError` when it cannot be resolved."""
+        with self._lock:
+            route = self._routes.get(model)
+        if route is None:
+            try:
+                provider, stripped_model = registry.resolve_provider(
+                    model, override_name=self._overrides.get(model)
+                )
+                route = Route(
+                    model=model,
+                    provider=provider,
+                    provider_name=getattr(provider, "name", None) or "unknown",
+                    stripped_model=stripped_model,
+                )
+            except LcsError as exc:
+                route = exc
+            with self._lock:
+                self._routes[model] = route
+        if isinstance(route, LcsError):
+            raise route
+        return route
+
+    def fallbacks(self, model: str) -> Tuple[str, ...]:
+        return self._fallbacks.get(model, ())
+
+
+_TABLES: "OrderedDict[tuple, RoutingTable]" = OrderedDict()
+_TABLES_LOCK = threading.Lock()
+_MAX_TABLES = 64
+
+
+def get_routing_table(
+    overrides: Mapping[str, str] | None = None,
+    fallbacks: Mapping[str, Sequence[str]] | None = None,
+) -> RoutingTable:
+    """Compiled table for these inputs, rebuilt whenever the provider registry changes."""
+    version = registry.registry_version()
+    key = (
+        version,
+        tuple(sorted((overrides or {}).items())),
+        tuple(sorted((model, tuple(chain)) for model, chain in (fallbacks or {}).items())),
+    )
+    with _TABLES_LOCK:
+        table = _TABLES.get(key)
+        if table is not None:
+            _TABLES.move_to_end(key)
+            return table
+        table = RoutingTable(version, overrides, fallbacks)
+        _TABLES[key] = table
+        while len(_TABLES) > _MAX_TABLES:
+            _TABLES.popitem(last=False)
+        return table
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import AsyncIterable, AsyncIterator
+
+DONE_SENTINEL = "[DONE]"
+
+
+async def iter_sse_data(lines: AsyncIterable[str]) -> AsyncIterator[str]:
+    """
+    Yield the `data` payload of each server-sent event from an async line iterator.
+
+    - Comment lines (starting with ":") are ignored (OpenRouter sends keep-alive comments).
+    - Multi-line `data:` fields are joined with newlines per the SSE spec.
+    - Iteration stops at the OpenAI-style `[DONE]` sentinel.
+    """
+    buffer: list[str] = []
+    async for raw in lines:
+        line = raw.rstrip("\r\n")
+        if not line:
+            if buffer:
+                data = "\n".join(buffer)
+                buffer = []
+                if data == DONE_SENTINEL:
+                    return
+                yield data
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if field != "data":
+            continue
+        buffer.append(value[1:] if value.startswith(" ") else value)
+    if buffer:
+        data = "\n".join(buffer)
+        if data != DONE_SENTINEL:
+            yield data
@@ -0,0 +1,243 @@
+"""
+Offline OpenRouter-compatible stand-in for load and resiliency experiments.
+
+`StandInProvider` answers `/chat/completions` (plain JSON and SSE streaming) with
+per-model latency distributions, error and 429 rates and canned or generated content.
+Use it in-process through `transport()` / `install()` (an `httpx.MockTransport` behind
+the pooled client) or out-of-process through `asgi_app()`:
+
+    uvicorn --factory src.adapters.providers.standin:create_app
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import math
+import os
+import random
+from collections import Counter
+from typing import AsyncIterator, Awaitable, Callable, Literal
+
+import httpx
+from pydantic import BaseModel, Field
+
+from src.adapters.providers import transport as transport_module
+
+
+class LatencyProfile(BaseModel):
+    """Total response time distribution (ms); `bimodal` mixes a fast and a slow lognormal mode."""
+
+    distribution: Literal["fixed", "lognormal", "bimodal"] = "lognormal"
+    median_ms: float = Field(default=200.0, ge=0.0)
+    sigma: float = Field(default=0.5, ge=0.0)
+    slow_median_ms: float = Field(default=2000.0, ge=0.0)
+    slow_fraction: float = Field(default=0.05, ge=0.0, le=1.0)
+    ttft_fraction: float = Field(default=0.3, ge=0.0, le=1.0)
+
+
+class StandInModelProfile(BaseModel):
+    latency: LatencyProfile = Field(default_factory=LatencyProfile)
+    error_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    rate_limit_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    retry_after_s: float | None = Field(default=1.0, ge=0.0)
+    content: str | None = None
+    content_template: str = "Stand-in answer from {model}: {prompt}"
+    chunk_chars: int = Field(default=16, ge=1)
+
+
+class StandInConfig(BaseModel):
+    models: dict[str, StandInModelProfile] = Field(default_factory=dict)
+    default: StandInModelProfile = Field(default_factory=StandInModelProfile)
+    seed: int | None = None
+    time_scale: float = Field(default=1.0, ge=0.0, description="Multiplier on every simulated delay.")
+
+
+Sleep = Callable[[float], Awaitable[None]]
+
+
+class StandInProvider:
+    """Simulated provider; one instance keeps its own RNG and per-model outcome counts."""
+
+    def __init__(self, config: StandInConfig | None = None, sleep: Sleep = asyncio.sleep) -> None:
+        self.config = config or StandInConfig()
+        self._rng = random.Random(self.config.seed)
+        self._sleep = sleep
+        self.outcomes: Counter[tuple[str, str]] = Counter()
+
+    def profile(self, model: str) -> StandInModelProfile:
+        return self.config.models.get(model, self.config.default)
+
+    def sample_latency_ms(self, model: str) -> float:
+        latency = self.profile(model).latency
+        median = latency.median_ms
+        if latency.distribution == "fixed":
+            return median
+        if latency.distribution == "bimodal" and self._rng.random() < latency.slow_fraction:
+            median = latency.slow_median_ms
+        if median <= 0:
+            return 0.0
+        return self._rng.lognormvariate(math.log(median), latency.sigma)
+
+    def _content(self, profile: StandInModelProfile, model: str, prompt: str) -> str:
+        if profile.content is not None:
+            return profile.content
+        return profile.content_template.format(
+            model=model,
+            prompt=prompt[:200],
+            digest=hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:8],
+        )
+
+    async def _delay(self, ms: float) -> None:
+        scaled = ms * self.config.time_scale / 1000
+        if scaled > 0:
+            await self._sleep(scaled)
+
+    def _outcome(self, profile: StandInModelProfile) -> str:
+        roll = self._rng.random()
+        if roll < profile.rate_limit_rate:
+            return "rate_limited"
+        if roll < profile.rate_limit_rate + profile.error_rate:
+            return "error"
+        return "ok"
+
+    async def respond(
+        self, path: str, body: bytes, read_timeout_s: float | None = None
+    ) -> tuple[int, dict[str, str], AsyncIterator[bytes] | bytes]:
+        """
+        Simulate one `/chat/completions` call: (status, headers, body or SSE chunk iterator).
+
+        Non-streaming calls raise `httpx.ReadTimeout` after `read_timeout_s` when the sampled
+        latency exceeds it, matching what the real transport would do.
+        """
+        if not path.rstrip("/").endswith("/chat/completions"):
+            return 404, {"content-type": "application/json"}, b'{"error": "not found"}'
+        try:
+            payload = json.loads(body or b"{}")
+        except ValueError:
+            return 400, {"content-type": "application/json"}, b'{"error": "invalid json"}'
+        model = str(payload.get("model", "unknown"))
+        messages = payload.get("messages") or [{}]
+        prompt = str(messages[-1].get("content", ""))
+        profile = self.profile(model)
+        latency_ms = self.sample_latency_ms(model)
+        outcome = self._outcome(profile)
+        self.outcomes[(model, outcome)] += 1
+
+        if outcome == "rate_limited":
+            await self._delay(min(latency_ms, 20.0))
+            headers = {"content-type": "application/json"}
+            if profile.retry_after_s is not None:
+                headers["retry-after"] = f"{profile.retry_after_s:g}"
+            return 429, headers, b'{"error": {"message": "rate limited (stand-in)"}}'
+        if outcome == "error":
+            await self._delay(latency_ms)
+            error_body = b'{"error": {"message": "upstream error (stand-in)"}}'
+            return 500, {"content-type": "application/json"}, error_body
+
+        content = self._content(profile, model, prompt)
+        completion_tokens = max(1, len(content) // 4)
+        if payload.get("stream"):
+            return 200, {"content-type": "text/event-stream"}, self._stream(
+                content, latency_ms, profile, completion_tokens
+            )
+
+        scaled_s = latency_ms * self.config.time_scale / 1000
+        if read_timeout_s is not None and scaled_s > read_timeout_s:
+            await self._sleep(read_timeout_s)
+            self.outcomes[(model, "timeout")] += 1
+            raise httpx.ReadTimeout("stand-in latency exceeded the read timeout")
+        await self._delay(latency_ms)
+        data = {
+            "id": f"standin-{self._rng.getrandbits(32):08x}",
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": max(1, len(prompt) // 4), "completion_tokens": completion_tokens},
+        }
+        return 200, {"content-type": "application/json"}, json.dumps(data).encode()
+
+    async def _stream(
+        self,
+        content: str,
+        latency_ms: float,
+        profile: StandInModelProfile,
+        completion_tokens: int,
+    ) -> AsyncIterator[bytes]:
+        chunks = [content[i : i + profile.chunk_chars] for i in range(0, len(content), profile.chunk_chars)]
+        ttft_ms = latency_ms * profile.latency.ttft_fraction
+        gap_ms = (latency_ms - ttft_ms) / max(len(chunks) - 1, 1)
+        await self._delay(ttft_ms)
+        for index, chunk in enumerate(chunks):
+            if index:
+                await self._delay(gap_ms)
+            event = {"choices": [{"index": 0, "delta": {"content": chunk}}]}
+            yield f"data: {json.dumps(event)}\n\n".encode()
+        usage = {"choices": [], "usage": {"completion_tokens": completion_tokens}}
+        yield f"data: {json.dumps(usage)}\n\n".encode()
+        yield b"data: [DONE]\n\n"
+
+    async def handle(self, request: httpx.Request) -> httpx.Response:
+        """`httpx.MockTransport` handler."""
+        timeout = request.extensions.get("timeout") or {}
+        try:
+            status, headers, body = await self.respond(
+                request.url.path, await request.aread(), timeout.get("read")
+            )
+        except httpx.ReadTimeout as exc:
+            raise httpx.ReadTimeout(str(exc), request=request) from None
+        return httpx.Response(status, headers=headers, content=body)
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    async def install(self) -> None:
+        """Route the pooled provider clients through this stand-in (see `uninstall`)."""
+        await transport_module.install_transport(self.transport())
+
+    @staticmethod
+    async def uninstall() -> None:
+        await transport_module.install_transport(None)
+
+    def asgi_app(self):
+        """Minimal ASGI app serving the same responses over real HTTP."""
+
+        async def app(scope, receive, send):
+            if scope["type"] == "lifespan":
+                while True:
+                    message = await receive()
+                    if message["type"] == "lifespan.startup":
+                        await send({"type": "lifespan.startup.complete"})
+                    elif message["type"] == "lifespan.shutdown":
+                        await send({"type": "lifespan.shutdown.complete"})
+                        return
+            if scope["type"] != "http":
+                return
+            body = b""
+            while True:
+                message = await receive()
+                body += message.get("body", b"")
+                if not message.get("more_body"):
+                    break
+            status, headers, payload = await self.respond(scope.get("path", ""), body)
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": status,
+                    "headers": [(k.encode(), v.encode()) for k, v in headers.items()],
+                }
+            )
+            if isinstance(payload, bytes):
+                await send({"type": "http.response.body", "body": payload})
+                return
+            async for chunk in payload:
+                await send({"type": "http.response.body", "body": chunk, "more_body": True})
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+
+        return app
+
+
+def create_app(config: StandInConfig | None = None):
+    """ASGI factory; reads `STANDIN_CONFIG` (a JSON `StandInConfig`) when no config is given."""
+    if config is None and os.environ.get("STANDIN_CONFIG"):
+        config = StandInConfig.model_validate_json(os.environ["STANDIN_CONFIG"])
+    return StandInProvider(config).asgi_app()
@@ -1,88 +1,162 @@
 from __future__ import annotations
 
-import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict
+from urllib.parse import urlparse
+
 import httpx
-from asyncio import runners
 
+from src.adapters.observability.logging import get_logger
+from src.adapters.observability.metrics import (
+    http_client_created_total,
+    http_pool_connections,
+    http_pool_max_connections,
+    http_pool_requests_in_flight,
+)
 from src.config import get_settings
 
-_client: httpx.AsyncClient | None = None
-_client_timeout_ms: int | None = None
+logger = get_logger()
 
+# One long-lived pooled client per base URL. Timeouts are applied per request so that
+# policy, re-ask and self-consistency timeouts never force a new client (and new TLS).
+_clients: Dict[str, httpx.AsyncClient] = {}
+_in_flight: Dict[str, int] = {}
+# Optional transport every pooled client is built with (offline stand-in, load tests).
+_transport_override: httpx.AsyncBaseTransport | None = None
+
+
+def _pool_label(base_url: str) -> str:
+    """Bounded metric label for a pool (host[:port] of the base URL)."""
+    return urlparse(base_url).netloc or base_url
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def pool_limits(settings=None) -> httpx.Limits:
+    """Connection-pool limits derived from settings (defaults match httpx)."""
+    settings = settings or get_settings()
+    return httpx.Limits(
+        max_connections=getattr(settings, "http_max_connections", 100),
+        max_keepalive_connections=getattr(settings, "http_max_keepalive_connections", 20),
+        keepalive_expiry=getattr(settings, "http_keepalive_expiry_s", 30.0),
+    )
+
+
+def request_timeout(timeout_ms: int | None = None) -> httpx.Timeout:
+    """Per-request timeout; falls back to the configured provider timeout."""
+    desired_timeout_ms = timeout_ms or get_settings().provider_timeout_ms
+    return httpx.Timeout(desired_timeout_ms / 1000)
+
+
+def _build_client(base_url: str) -> httpx.AsyncClient:
+    settings = get_settings()
+    headers = {}
+    if settings.openrouter_api_key:
+        headers["Authorization"] = f"Bearer {settings.openrouter_api_key}"
+    limits = pool_limits(settings)
+    http2 = bool(getattr(settings, "http2_enabled", False))
+    if http2 and not _http2_available():
+        logger.warning("http2_unavailable", reason="h2 package not installed", pool=_pool_label(base_url))
+        http2 = False
+    kwargs = {
+        "base_url": base_url,
+        "timeout": request_timeout(),
+        "headers": headers,
+        "limits": limits,
+    }
+    if http2:
+        kwargs["http2"] = True
+    if _transport_override is not None:
+        kwargs["transport"] = _transport_override
+    client = httpx.AsyncClient(**kwargs)
+    pool = _pool_label(base_url)
+    try:
+        http_client_created_total.labels(pool=pool).inc()
+        http_pool_max_connections.labels(pool=pool).set(limits.max_connections or 0)
+    except Exception:
+        logger.warning("metrics_emit_failed", metric="http_client_created_total", pool=pool)
+    return client
+
+
+def get_client(timeout_ms: int | None = None, base_url: str | None = None) -> httpx.AsyncClient:
+    """
+    Return the shared pooled AsyncClient for `base_url` (default: OpenRouter base URL).
+
+    The client is only rebuilt when it has been closed. `timeout_ms` is accepted for
+    backward compatibility; pass per-request timeouts with `request_timeout()` instead.
+    """
+    url = base_url or get_settings().openrouter_base_url
+    client = _clients.get(url)
+    if client is None or getattr(client, "is_closed", False):
+        client = _build_client(url)
+        _clients[url] = client
+    return client
 
-async def _close_client_if_needed() -> None:
-    """Close the globally held client, ignoring close errors."""
-    global _client
-    if _client is not None:
-        try:
-            await _client.aclose()
-        except Exception:
-            pass
-        finally:
-            _client = None
 
+def _connection_counts(client: httpx.AsyncClient) -> tuple[int, int] | None:
+    """Best-effort (active, idle) connection counts from the underlying httpcore pool."""
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return None
+    idle = sum(1 for conn in connections if getattr(conn, "is_idle", lambda: False)())
+    return len(connections) - idle, idle
 
-async def _close_client_instance(client: httpx.AsyncClient) -> None:
-    """Close a specific client instance without touching global state."""
+
+def record_pool_stats(base_url: str | None = None) -> None:
+    """Export current connection-pool utilization for `base_url`."""
+    url = base_url or get_settings().openrouter_base_url
+    pool = _pool_label(url)
+    client = _clients.get(url)
     try:
-        await client.aclose()
+        http_pool_requests_in_flight.labels(pool=pool).set(_in_flight.get(url, 0))
+        counts = _connection_counts(client) if client is not None else None
+        if counts is not None:
+            active, idle = counts
+            http_pool_connections.labels(pool=pool, state="active").set(active)
+            http_pool_connections.labels(pool=pool, state="idle").set(idle)
     except Exception:
-        pass
+        logger.warning("metrics_emit_failed", metric="http_pool_connections", pool=pool)
 
 
-def _schedule_client_close(client: httpx.AsyncClient) -> None:
-    """Close a client using an async-safe path regardless of loop state."""
+@asynccontextmanager
+async def pooled_request(base_url: str | None = None) -> AsyncIterator[None]:
+    """Track one in-flight request against the pool for utilization metrics."""
+    url = base_url or get_settings().openrouter_base_url
+    _in_flight[url] = _in_flight.get(url, 0) + 1
+    record_pool_stats(url)
     try:
-        loop = asyncio.get_running_loop()
-    except RuntimeError:
-        # No running loop (sync context); close immediately to avoid leaks.
-        run_fn = asyncio.run
-        try:
-            # Avoid recursion when callers monkeypatch asyncio.run (tests do this).
-            asyncio.run = runners.run  # type: ignore[assignment]
-            run_fn(_close_client_instance(client))
-        finally:
-            asyncio.run = run_fn  # type: ignore[assignment]
-    else:
-        loop.create_task(_close_client_instance(client))
-
-
-def get_client(timeout_ms: int | None = None) -> httpx.AsyncClient:
-    """Return a shared AsyncClient, recreating it if timeout differs."""
-    global _client, _client_timeout_ms
-    settings = get_settings()
-    desired_timeout_ms = timeout_ms or settings.provider_timeout_ms
-
-    if (
-        _client is None
-        or getattr(_client, "is_closed", False)
-        or _client_timeout_ms != desired_timeout_ms
-    ):
-        prior_client = _client
-        _client = None
-        _client_timeout_ms = None
-        if prior_client is not None:
-            _schedule_client_close(prior_client)
-        timeout = desired_timeout_ms / 1000
-        headers = {}
-        if settings.openrouter_api_key:
-            headers["Authorization"] = f"Bearer {settings.openrouter_api_key}"
-        _client = httpx.AsyncClient(
-            base_url=settings.openrouter_base_url,
-            timeout=timeout,
-            headers=headers,
-        )
-        _client_timeout_ms = desired_timeout_ms
-    return _client
+        yield
+    finally:
+        _in_flight[url] = max(_in_flight.get(url, 1) - 1, 0)
+        record_pool_stats(url)
 
 
 async def close_client() -> None:
-    global _client
-    if _client is not None:
+    """Close every pooled client (safe to call from test teardown)."""
+    clients = list(_clients.values())
+    _clients.clear()
+    _in_flight.clear()
+    for client in clients:
         try:
-            await _client.aclose()
+            await client.aclose()
         except RuntimeError:
             # Ignore loop-closed or already-closed errors in test teardown.
             pass
-        finally:
-            _client = None
+
+
+async def install_transport(transport: httpx.AsyncBaseTransport | None) -> None:
+    """
+    Build pooled clients on `transport` from now on (None restores the network transport).
+
+    Existing clients are closed so the next `get_client()` picks up the change.
+    """
+    global _transport_override
+    await close_client()
+    _transport_override = transport
@@ -1,10 +1,26 @@
 from __future__ import annotations
 
-from typing import Optional
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import AsyncIterator, Iterable, Mapping, Optional
 from uuid import uuid4
 
+from src.adapters.observability.logging import get_logger
+from src.adapters.observability.metrics import (
+    admission_queue_depth,
+    admission_running,
+    admission_shed_total,
+    admission_wait_seconds,
+)
+from src.adapters.orchestration.admission import get_admission_controller
+from src.adapters.orchestration.breaker import BreakerManager
 from src.adapters.orchestration.orchestrator import OrchestrationError, Orchestrator
 from src.adapters.orchestration.models import fetch_provider_result
+from src.adapters.orchestration.scheduler import CallScheduler
+from src.adapters.orchestration.timeouts import Deadline
+from src.adapters.orchestration.warmup import WarmupReport
+from src.contracts.errors import ErrorEnvelope
 from src.contracts.request import ConsensusRequest
 from src.contracts.response import ConsensusResult
 from src.contracts.self_consistency import SelfConsistencyConfig, SelfConsistencyResult
@@ -12,6 +28,19 @@ from src.core.consensus.registry import DEFAULT_STRATEGY, get_strategy, list_str
 from src.core.self_consistency import run_self_consistency as run_self_consistency_core
 from src.config import get_settings
 from src.errors import LcsError, from_envelope
+from src.policy.loader import PolicyStore, load_policy
+
+logger = get_logger()
+
+
+@dataclass(frozen=True)
+class BatchItem:
+    """One finished request of `LcsClient.run_many`: `result` on success, `error` otherwise."""
+
+    index: int
+    request_id: str
+    result: ConsensusResult | None = None
+    error: LcsError | None = None
 
 
 class LcsClient:
@@ -24,34 +53,137 @@ class LcsClient:
         callback_timeout_ms: int | None = 250,
         calibrator=None,
         output_validator=None,
+        scheduler: CallScheduler | None = None,
     ) -> None:
+        """
+        `scheduler` makes every provider call of this client, from `run` and `run_many`, share
+        one priority-aware `CallScheduler`, so high-priority requests overtake queued batch work.
+        """
         self.default_strategy = default_strategy
         self.run_event_callback = run_event_callback
         self.callback_timeout_ms = callback_timeout_ms
         self.calibrator = calibrator
         self.output_validator = output_validator
+        self.scheduler = scheduler
 
     async def run(
         self, request: ConsensusRequest, strategy: Optional[str] = None
     ) -> ConsensusResult:
         strategy_name = strategy or request.strategy or self.default_strategy
         judge = get_strategy(strategy_name)
+        shared = {"scheduler": self.scheduler} if self.scheduler is not None else {}
+        return await self._run_with(self._build_orchestrator(judge, **shared), request, judge.method)
+
+    async def warmup(
+        self,
+        models: Iterable[str] | None = None,
+        *,
+        provider_overrides: dict[str, str] | None = None,
+        freeze_gc: bool = False,
+    ) -> WarmupReport:
+        """
+        Pay first-request costs before serving traffic and report per-step timings.
+
+        Flip readiness only once `report.ready` is True.
+        """
+        orchestrator = self._build_orchestrator(get_strategy(self.default_strategy))
+        return await orchestrator.warmup(
+            models, provider_overrides=provider_overrides, freeze_gc=freeze_gc
+        )
+
+    def _build_orchestrator(self, judge, **shared) -> Orchestrator:
         try:
-            orchestrator = Orchestrator(
+            return Orchestrator(
                 judge=judge,
                 run_event_callback=self.run_event_callback,
                 callback_timeout_ms=self.callback_timeout_ms,
                 calibrator=self.calibrator,
                 output_validator=self.output_validator,
+                **shared,
             )
         except TypeError:
             # Backward compatibility for patched/dummy orchestrators in tests
-            orchestrator = Orchestrator(judge=judge)
+            return Orchestrator(judge=judge)
+
+    @staticmethod
+    async def _run_with(
+        orchestrator: Orchestrator, request: ConsensusRequest, strategy_label: str
+    ) -> ConsensusResult:
+        policy_store = getattr(orchestrator, "policy_store", None)
+        policy = policy_store.current() if policy_store is not None else None
+        admission = getattr(policy, "admission", None)
         try:
-            return await orchestrator.run(request, request.request_id, strategy_label=judge.method)
+            if admission is None or not admission.enabled:
+                return await orchestrator.run(request, request.request_id, strategy_label=strategy_label)
+            return await _run_admitted(orchestrator, policy, request, strategy_label)
         except OrchestrationError as exc:
             raise from_envelope(exc.envelope)
 
+    async def run_many(
+        self,
+        requests: Iterable[ConsensusRequest],
+        *,
+        max_in_flight: int = 32,
+        per_provider_limit: int | Mapping[str, int] | None = None,
+        strategy: Optional[str] = None,
+    ) -> AsyncIterator[BatchItem]:
+        """
+        Run a batch of requests, yielding each `BatchItem` as soon as it finishes.
+
+        Every provider call of the batch goes through one `CallScheduler` bounded by
+        `max_in_flight` (and `per_provider_limit`, either one limit for every provider or a
+        mapping by provider name). Breakers and the policy snapshot are shared by the whole
+        batch. At most `max_in_flight` requests are started at once, so large batches do not
+        build up unbounded pending work. Request failures are reported as items; they do
+        not stop the batch. When the client has its own `scheduler`, provider calls go
+        through it instead, competing with the client's other requests by priority.
+        """
+        scheduler = self.scheduler or CallScheduler(max_in_flight, per_provider_limit)
+        policy_store = PolicyStore(loader=load_policy)
+        breakers = BreakerManager(policy_store.current().breaker)
+        orchestrators: dict[str, tuple[Orchestrator, str]] = {}
+
+        def orchestrator_for(request: ConsensusRequest) -> tuple[Orchestrator, str]:
+            name = strategy or request.strategy or self.default_strategy
+            if name not in orchestrators:
+                judge = get_strategy(name)
+                orchestrator = self._build_orchestrator(
+                    judge, policy_store=policy_store, breakers=breakers, scheduler=scheduler
+                )
+                orchestrators[name] = (orchestrator, judge.method)
+            return orchestrators[name]
+
+        async def run_one(index: int, request: ConsensusRequest) -> BatchItem:
+            try:
+                orchestrator, strategy_label = orchestrator_for(request)
+                result = await self._run_with(orchestrator, request, strategy_label)
+            except LcsError as exc:
+                return BatchItem(index=index, request_id=request.request_id, error=exc)
+            except Exception as exc:  # one broken request must not abort the batch
+                error = LcsError(code="internal_error", message=str(exc))
+                return BatchItem(index=index, request_id=request.request_id, error=error)
+            return BatchItem(index=index, request_id=request.request_id, result=result)
+
+        pending_requests = iter(enumerate(requests))
+        running: set[asyncio.Task] = set()
+        try:
+            while True:
+                while len(running) < max_in_flight:
+                    nxt = next(pending_requests, None)
+                    if nxt is None:
+                        break
+                    running.add(asyncio.ensure_future(run_one(*nxt)))
+                if not running:
+                    return
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
     async def run_self_consistency(
         self,
         *,
@@ -73,8 +205,8 @@ class LcsClient:
                 model_val,
                 request_id_val,
                 normalize_output,
-                include_scores,
-                timeout_ms,
+                include_scores=include_scores,
+                provider_timeout_ms=timeout_ms,
             )
 
         return await run_self_consistency_core(
@@ -86,9 +218,66 @@ class LcsClient:
         )
 
 
+def _record_admission(controller) -> None:
+    try:
+        admission_queue_depth.set(controller.queue_depth)
+        admission_running.set(controller.running)
+    except Exception:
+        logger.warning("metrics_emit_failed", metric="admission_queue_depth")
+
+
+async def _run_admitted(
+    orchestrator: Orchestrator, policy, request: ConsensusRequest, strategy_label: str
+) -> ConsensusResult:
+    """Run `request` once the admission controller lets it start; shed it as `rate_limited` otherwise."""
+    config = policy.admission
+    controller = get_admission_controller()
+    queued_at = time.perf_counter()
+    budget_ms = orchestrator.settings.e2e_timeout_ms
+    if policy.timeouts and policy.timeouts.e2e_timeout_ms:
+        budget_ms = policy.timeouts.e2e_timeout_ms
+    deadline = Deadline(budget_ms, start=queued_at)
+    cost = len(request.prompt) * len(request.models)
+
+    reason = await controller.acquire(config, cost, deadline.at)
+    _record_admission(controller)
+    if reason is not None:
+        try:
+            admission_shed_total.labels(reason=reason).inc()
+        except Exception:
+            logger.warning("metrics_emit_failed", metric="admission_shed_total", reason=reason)
+        logger.info(
+            "request_shed",
+            request_id=request.request_id,
+            reason=reason,
+            queue_depth=controller.queue_depth,
+            waited_ms=deadline.elapsed_ms(),
+        )
+        envelope = ErrorEnvelope(
+            type="rate_limited",
+            message=f"request shed by admission control ({reason})",
+            retryable=True,
+            status_code=429,
+        )
+        raise OrchestrationError(envelope)
+
+    started = time.perf_counter()
+    try:
+        admission_wait_seconds.observe(started - queued_at)
+    except Exception:
+        logger.warning("metrics_emit_failed", metric="admission_wait_seconds")
+    try:
+        return await orchestrator.run(
+            request, request.request_id, strategy_label=strategy_label, started_at=queued_at
+        )
+    finally:
+        controller.release(config, cost, time.perf_counter() - started)
+        _record_admission(controller)
+
+
 async def consensus(request: ConsensusRequest, strategy: Optional[str] = None) -> ConsensusResult:
     client = LcsClient()
     return await client.run(request, strategy=strategy)
 
 
-__all__ = ["LcsClient", "consensus", "list_strategies"]
+__all__ = ["BatchItem", "LcsClient", "consensus", "list_strategies"]
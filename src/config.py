@@ -37,6 +37,10 @@ class Settings(BaseSettings):
     e2e_timeout_ms: int = Field(default=10000, alias="E2E_TIMEOUT_MS")
     max_prompt_chars: int = Field(default=8000, alias="MAX_PROMPT_CHARS")
     max_models: int = Field(default=5, alias="MAX_MODELS")
+    http_max_connections: int = Field(default=100, alias="HTTP_MAX_CONNECTIONS")
+    http_max_keepalive_connections: int = Field(default=20, alias="HTTP_MAX_KEEPALIVE_CONNECTIONS")
+    http_keepalive_expiry_s: float = Field(default=30.0, alias="HTTP_KEEPALIVE_EXPIRY_S")
+    http2_enabled: bool = Field(default=False, alias="HTTP2_ENABLED")
     log_level: str = Field(default="INFO", alias="LOG_LEVEL")
     otel_exporter_otlp_endpoint: str = Field(
         default="http://otel-collector:4318", alias="OTEL_EXPORTER_OTLP_ENDPOINT"
@@ -55,7 +59,14 @@ class Settings(BaseSettings):
             raise ValueError("DEFAULT_MODELS must contain at least one model")
         return models
 
-    @field_validator("provider_timeout_ms", "e2e_timeout_ms", "max_prompt_chars", "max_models")
+    @field_validator(
+        "provider_timeout_ms",
+        "e2e_timeout_ms",
+        "max_prompt_chars",
+        "max_models",
+        "http_max_connections",
+        "http_max_keepalive_connections",
+    )
     @classmethod
     def ensure_positive(cls, value: int, info: ValidationInfo) -> int:
         if value <= 0:
@@ -11,6 +11,9 @@ class EarlyStopConfig(BaseModel):
     max_samples: int | None = Field(default=None, ge=1)
     confidence_threshold: float = Field(default=0.7, ge=0.0, le=1.0)
     tie_break_required: bool = True
+    # Calls dispatched in parallel per wave: `first_wave` (default `min_samples`), then `wave_size`.
+    first_wave: int | None = Field(default=None, ge=1)
+    wave_size: int = Field(default=1, ge=1)
 
 
 class EarlyStopReport(BaseModel):
@@ -18,4 +21,5 @@ class EarlyStopReport(BaseModel):
     stop_reason: Literal["confidence_reached", "max_samples", "guardrail_fail"]
     current_confidence: float = Field(ge=0.0, le=1.0)
     winner: str | None = None
+    waves: int | None = Field(default=None, ge=0)
 
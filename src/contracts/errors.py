@@ -18,3 +18,4 @@ class ErrorEnvelope(BaseModel):
     message: str
     retryable: bool = False
     status_code: int | None = None
+    retry_after_ms: int | None = None
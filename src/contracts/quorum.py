@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+
+class QuorumConfig(BaseModel):
+    enabled: bool = False
+    k: int = Field(default=2, ge=1)
+    similarity_threshold: float = Field(default=0.8, ge=0.0, le=1.0)
+    confidence_threshold: float | None = Field(default=None, ge=0.0, le=1.0)
+
+
+class QuorumReport(BaseModel):
+    reached: bool
+    agreeing: list[str] = Field(default_factory=list)
+    cancelled: list[str] = Field(default_factory=list)
+    elapsed_ms: int = Field(ge=0)
+    time_saved_ms: int | None = Field(default=None, ge=0)
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+from typing import Literal
 from uuid import uuid4
 
 from pydantic import BaseModel, Field, field_validator, FieldValidationInfo
 
 from src.config import get_settings
 from src.contracts.early_stop import EarlyStopConfig
+from src.contracts.quorum import QuorumConfig
 from src.contracts.safety import PromptSafetyConfig
 
+# Scheduling class of a request: "high" for interactive callers, "low" for bulk/batch work.
+Priority = Literal["high", "normal", "low"]
+
 
 class ConsensusRequest(BaseModel):
     request_id: str = Field(default_factory=lambda: str(uuid4()))
@@ -21,9 +26,15 @@ class ConsensusRequest(BaseModel):
     normalize_output: bool = False
     preamble_key: str | None = None
     include_scores: bool = False
+    stream: bool = False
+    cache_bypass: bool = False
     seed: int | None = Field(default=None, ge=0)
     early_stop: EarlyStopConfig | None = None
+    quorum: QuorumConfig | None = None
     prompt_safety: PromptSafetyConfig | None = None
+    priority: Priority = "normal"
+    # Caller/team key for fair sharing of provider concurrency (policy `tenants` block).
+    tenant: str | None = Field(default=None, min_length=1, max_length=128)
 
     @field_validator("models")
     @classmethod
@@ -98,6 +109,16 @@ class ConsensusRequest(BaseModel):
             raise ValueError("early_stop.min_samples cannot exceed number of models")
         return value
 
+    @field_validator("quorum")
+    @classmethod
+    def validate_quorum(cls, value: QuorumConfig | None, info):
+        if value is None or not value.enabled:
+            return value
+        models = info.data.get("models") or []
+        if value.k > len(models):
+            raise ValueError("quorum.k cannot exceed number of models")
+        return value
+
     @field_validator("prompt_safety")
     @classmethod
     def validate_prompt_safety(cls, value: PromptSafetyConfig | None):
@@ -4,6 +4,7 @@ from pydantic import BaseModel, Field, field_validator
 
 from src.contracts.errors import ErrorEnvelope
 from src.contracts.early_stop import EarlyStopReport
+from src.contracts.quorum import QuorumReport
 from src.contracts.safety import PromptSafetyDecision, PromptTruncationInfo
 
 
@@ -15,10 +16,18 @@ class ModelResponse(BaseModel):
     error: ErrorEnvelope | None = None
     breaker_state: str | None = None
     estimated_cost: float = Field(default=0.0, ge=0.0)
+    ttft_ms: int | None = Field(default=None, ge=0)
+    completion_tokens: int | None = Field(default=None, ge=0)
+    tokens_per_second: float | None = Field(default=None, ge=0.0)
+    hedged: bool = False
+    attempts: int = Field(default=1, ge=1)
+    cached: bool = False
+    fallback_for: str | None = None
 
 
 class Timing(BaseModel):
     e2e_ms: int
+    skipped_stages: list[str] | None = None
 
     @field_validator("e2e_ms")
     @classmethod
@@ -96,6 +105,7 @@ class ConsensusResult(BaseModel):
     cost_summary: CostSummary | None = None
     latency_summary: LatencySummary | None = None
     early_stop: EarlyStopReport | None = None
+    quorum: QuorumReport | None = None
     redaction: RedactionSummary | None = None
     prompt_safety: PromptSafetyDecision | None = None
     prompt_truncation: PromptTruncationInfo | None = None
@@ -13,6 +13,7 @@ class SelfConsistencyConfig(BaseModel):
     threshold: float = Field(default=0.66, ge=0.0, le=1.0)
     loop_timeout_ms: int | None = Field(default=None, ge=1)
     per_sample_timeout_ms: int | None = Field(default=None, ge=1)
+    parallelism: int = Field(default=1, ge=1)
 
     @field_validator("max_samples")
     @classmethod
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List
+
+from src.contracts.quorum import QuorumConfig
+from src.contracts.response import ModelResponse
+from src.core.analysis.embeddings import embed_text
+from src.core.analysis.similarity import cosine_similarity
+
+
+@dataclass
+class QuorumDecision:
+    reached: bool
+    agreeing: List[str] = field(default_factory=list)
+
+
+def quorum_decision(
+    responses: List[ModelResponse],
+    config: QuorumConfig,
+    confidence: float | None = None,
+) -> QuorumDecision:
+    """
+    Quorum is reached once `k` successful responses agree: one response plus every other
+    response whose cosine similarity to it is at least `similarity_threshold`. When
+    `confidence_threshold` is set the current judgement must also be that confident.
+    """
+    if not config.enabled:
+        return QuorumDecision(reached=False)
+    successful = [
+        (response.model, embed_text(response.content or ""))
+        for response in responses
+        if response.error is None and response.content is not None
+    ]
+    if len(successful) < config.k:
+        return QuorumDecision(reached=False)
+    if config.confidence_threshold is not None and (confidence or 0.0) < config.confidence_threshold:
+        return QuorumDecision(reached=False)
+
+    best: List[str] = []
+    for model, vector in successful:
+        group = [model] + [
+            other
+            for other, other_vector in successful
+            if other != model and cosine_similarity(vector, other_vector) >= config.similarity_threshold
+        ]
+        if len(group) > len(best):
+            best = group
+    if len(best) >= config.k:
+        return QuorumDecision(reached=True, agreeing=best)
+    return QuorumDecision(reached=False, agreeing=best)
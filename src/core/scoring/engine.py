@@ -4,7 +4,8 @@ import ast
 import json
 import math
 import re
-from typing import List, Sequence, Tuple
+from functools import lru_cache
+from typing import Callable, List, Sequence, Tuple
 
 try:
     from radon.complexity import cc_visit
@@ -311,97 +312,105 @@ def _compute_statistics(values: Sequence[float], count: int) -> ScoreStats:
     )
 
 
-def compute_scores(responses: List[ModelResponse]) -> Tuple[List[ScoreDetail], ScoreStats]:
-    details: list[ScoreDetail] = []
-    scored_values: list[float] = []
-
-    for response in responses:
-        content = (response.content or "").strip()
-        metadata: dict = {}
-
-        if response.error is not None or not content:
-            detail = ScoreDetail(
-                model=response.model,
-                performance=_performance_score(response.latency_ms),
-                complexity=0.0,
-                tests=0.0,
-                style=0.0,
-                documentation=0.0,
-                dead_code=0.0,
-                security=0.0,
-                score=0.0,
-                error=True,
-                metadata=metadata,
-            )
-            details.append(detail)
-            continue
+@lru_cache(maxsize=4)
+def _syntax_tree(code: str) -> ast.AST:
+    # Cached so a scoring worker that extracted a response's code, or ran one of the
+    # tree analyzers on it, does not parse it again. The trees are only ever read.
+    return ast.parse(code)
 
-        code = _extract_code(content)
 
-        try:
-            tree = ast.parse(code)
-        except SyntaxError:
-            detail = ScoreDetail(
-                model=response.model,
-                performance=_performance_score(response.latency_ms),
-                complexity=0.0,
-                tests=0.0,
-                style=0.0,
-                documentation=0.0,
-                dead_code=0.0,
-                security=0.0,
-                score=0.0,
-                error=True,
-                metadata=metadata,
-            )
-            details.append(detail)
-            continue
-
-        performance = _performance_score(response.latency_ms)
-        complexity, complexity_meta = _complexity_score(code)
-        tests_score, tests_meta = _tests_score(tree, len(code.splitlines()))
-        style_score, style_meta = _style_score(code)
-        doc_score, doc_meta = _documentation_score(tree, code)
-        dead_code_score, dead_meta = _dead_code_score(code)
-        security_score, sec_meta = _security_score(code)
-
-        scores = {
-            "performance": performance,
-            "complexity": complexity,
-            "tests": tests_score,
-            "style": style_score,
-            "documentation": doc_score,
-            "dead_code": dead_code_score,
-            "security": security_score,
-        }
-        overall = _clamp(
-            sum(scores[metric] * weight for metric, weight in WEIGHTS.items())
-        )
+def _analyze_tests(code: str, tree: ast.AST | None) -> tuple[float, dict]:
+    return _tests_score(tree or _syntax_tree(code), len(code.splitlines()))
 
-        metadata.update(
-            complexity_meta
-            | tests_meta
-            | style_meta
-            | doc_meta
-            | dead_meta
-            | sec_meta
-        )
 
-        detail = ScoreDetail(
-            model=response.model,
-            performance=performance,
-            complexity=complexity,
-            tests=tests_score,
-            style=style_score,
-            documentation=doc_score,
-            dead_code=dead_code_score,
-            security=security_score,
-            score=overall,
-            error=False,
-            metadata=metadata or None,
-        )
-        details.append(detail)
-        scored_values.append(overall)
+def _analyze_documentation(code: str, tree: ast.AST | None) -> tuple[float, dict]:
+    return _documentation_score(tree or _syntax_tree(code), code)
+
+
+# Code analyzers in metadata merge order. They are independent of each other, so each
+# can run on its own (see `run_analyzer`); performance only needs the latency.
+_ANALYZERS: dict[str, Callable[[str, ast.AST | None], tuple[float, dict]]] = {
+    "complexity": lambda code, tree: _complexity_score(code),
+    "tests": _analyze_tests,
+    "style": lambda code, tree: _style_score(code),
+    "documentation": _analyze_documentation,
+    "dead_code": lambda code, tree: _dead_code_score(code),
+    "security": lambda code, tree: _security_score(code),
+}
+ANALYZERS = tuple(_ANALYZERS)
+
 
-    stats = _compute_statistics(scored_values, len(scored_values))
-    return details, stats
+def _parse(response: ModelResponse) -> tuple[str, ast.AST] | None:
+    content = (response.content or "").strip()
+    if response.error is not None or not content:
+        return None
+    code = _extract_code(content)
+    try:
+        return code, _syntax_tree(code)
+    except SyntaxError:
+        return None
+
+
+def scorable_code(response: ModelResponse) -> str | None:
+    """Extracted code of a response, or None when it failed, is empty or does not parse."""
+    parsed = _parse(response)
+    return parsed[0] if parsed else None
+
+
+def run_analyzer(name: str, code: str, tree: ast.AST | None = None) -> tuple[float, dict]:
+    """Run one analyzer of `ANALYZERS` on code returned by `scorable_code`."""
+    return _ANALYZERS[name](code, tree)
+
+
+def unscorable_detail(response: ModelResponse) -> ScoreDetail:
+    return ScoreDetail(
+        model=response.model,
+        performance=_performance_score(response.latency_ms),
+        complexity=0.0,
+        tests=0.0,
+        style=0.0,
+        documentation=0.0,
+        dead_code=0.0,
+        security=0.0,
+        score=0.0,
+        error=True,
+        metadata={},
+    )
+
+
+def assemble_detail(response: ModelResponse, results: dict[str, tuple[float, dict]]) -> ScoreDetail:
+    """Reduce the `run_analyzer` results of every analyzer into one `ScoreDetail`."""
+    scores = {"performance": _performance_score(response.latency_ms)}
+    metadata: dict = {}
+    for name in ANALYZERS:
+        scores[name], meta = results[name]
+        metadata.update(meta)
+    overall = _clamp(
+        sum(scores[metric] * weight for metric, weight in WEIGHTS.items())
+    )
+    return ScoreDetail(
+        model=response.model,
+        **scores,
+        score=overall,
+        error=False,
+        metadata=metadata or None,
+    )
+
+
+def score_response(response: ModelResponse) -> ScoreDetail:
+    """Score one response; failed or unparsable responses get an `error=True` detail."""
+    parsed = _parse(response)
+    if parsed is None:
+        return unscorable_detail(response)
+    code, tree = parsed
+    return assemble_detail(response, {name: run_analyzer(name, code, tree) for name in ANALYZERS})
+
+
+def summarize_scores(details: Sequence[ScoreDetail]) -> ScoreStats:
+    scored_values = [detail.score for detail in details if not detail.error]
+    return _compute_statistics(scored_values, len(scored_values))
+
+
+def compute_scores(responses: List[ModelResponse]) -> Tuple[List[ScoreDetail], ScoreStats]:
+    details = [score_response(response) for response in responses]
+    return details, summarize_scores(details)
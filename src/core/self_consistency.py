@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Awaitable, Callable
 
@@ -31,9 +32,10 @@ async def run_self_consistency(
     """
     Sample a single model multiple times and stop early once confidence crosses threshold.
 
-    Deterministic ordering, defensive metric/log emission, no new deps.
+    Up to `config.parallelism` samples run concurrently; outstanding samples are cancelled
+    once the threshold is met or `loop_timeout_ms` runs out. Deterministic ordering,
+    defensive metric/log emission, no new deps.
     """
-    samples: list[ModelResponse] = []
     start = time.perf_counter()
     stop_reason = "max_samples"
     confidence = 0.0
@@ -43,14 +45,10 @@ async def run_self_consistency(
         start + (config.loop_timeout_ms / 1000) if config.loop_timeout_ms is not None else None
     )
 
-    for idx in range(1, config.max_samples + 1):
-        if loop_deadline and time.perf_counter() >= loop_deadline:
-            stop_reason = "timeout"
-            break
-
+    async def sample() -> ProviderResult:
         # Each sample call; include_scores/normalize_output both False for speed.
         try:
-            result = await fetch_fn(
+            return await fetch_fn(
                 prompt,
                 model,
                 request_id,
@@ -60,39 +58,70 @@ async def run_self_consistency(
             )
         except Exception as exc:  # defensive: convert to envelope
             logger.warning("self_consistency_fetch_failed", request_id=request_id, error=str(exc))
-            result = ProviderResult(
+            return ProviderResult(
                 model=model,
                 content=None,
                 latency_ms=None,
                 error=ErrorEnvelope(type="internal", message=str(exc), retryable=False),
             )
 
-        samples.append(result.to_contract())
-
-        successes = [r for r in samples if r.error is None and r.content is not None]
-        with tracer.start_as_current_span(
-            "self_consistency.sample",
-            attributes={
-                "request_id": request_id,
-                "model": model,
-                "sample_idx": idx,
-                "latency_ms": result.latency_ms,
-                "error": getattr(result.error, "type", None),
-            },
-        ):
-            winner, confidence = _aggregate_confidence(successes, model)
-
-        if (
-            idx >= config.min_samples
-            and len(successes) >= 2
-            and winner
-            and confidence >= config.threshold
-        ):
-            stop_reason = "threshold"
-            break
-
-    if stop_reason == "max_samples" and loop_deadline and time.perf_counter() >= loop_deadline:
-        stop_reason = "timeout"
+    # Up to `parallelism` samples stay in flight; completed samples are kept by launch index
+    # so the returned responses are ordered the same way whatever the completion order.
+    finished: dict[int, ModelResponse] = {}
+    in_flight: dict[asyncio.Task, int] = {}
+    launched = 0
+    try:
+        while True:
+            remaining_s = None
+            if loop_deadline:
+                remaining_s = loop_deadline - time.perf_counter()
+                if remaining_s <= 0:
+                    stop_reason = "timeout"
+                    break
+            while launched < config.max_samples and len(in_flight) < config.parallelism:
+                launched += 1
+                in_flight[asyncio.ensure_future(sample())] = launched
+            if not in_flight:
+                break
+
+            done, _ = await asyncio.wait(in_flight, timeout=remaining_s, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                stop_reason = "timeout"
+                break
+            for task in sorted(done, key=in_flight.__getitem__):
+                idx = in_flight.pop(task)
+                result = task.result()
+                finished[idx] = result.to_contract()
+                with tracer.start_as_current_span(
+                    "self_consistency.sample",
+                    attributes={
+                        "request_id": request_id,
+                        "model": model,
+                        "sample_idx": idx,
+                        "latency_ms": result.latency_ms,
+                        "error": getattr(result.error, "type", None),
+                    },
+                ):
+                    # Sample order, not completion order, so ties resolve the same way every run.
+                    ordered = (finished[i] for i in sorted(finished))
+                    successes = [r for r in ordered if r.error is None and r.content is not None]
+                    winner, confidence = _aggregate_confidence(successes, model)
+
+            if (
+                len(finished) >= config.min_samples
+                and len(successes) >= 2
+                and winner
+                and confidence >= config.threshold
+            ):
+                stop_reason = "threshold"
+                break
+    finally:
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+
+    samples = [finished[idx] for idx in sorted(finished)]
 
     elapsed_ms = int((time.perf_counter() - start) * 1000)
     _emit_metrics(confidence, len(samples), stop_reason)
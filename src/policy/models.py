@@ -4,8 +4,9 @@ from functools import lru_cache
 from typing import Literal
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, model_validator
 
+from src.contracts.quorum import QuorumConfig
 from src.contracts.safety import PromptSafetyConfig
 
 
@@ -64,9 +65,181 @@ class Guardrails(BaseModel):
     providers: ProviderGuard | None = None
 
 
+class AdaptiveTimeoutConfig(BaseModel):
+    """Per-model provider timeouts learned from live latency (same formula as the offline tuner)."""
+
+    enabled: bool = False
+    percentile: float = Field(default=0.95, gt=0.0, le=1.0)
+    safety_margin: float = Field(default=1.2, ge=1.0)
+    overhead_ms: int = Field(default=200, ge=0)
+    min_ms: int = Field(default=500, ge=1)
+    max_ms: int = Field(default=20000, ge=1)
+    min_samples: int = Field(default=30, ge=1)
+
+
 class Timeouts(BaseModel):
+    """
+    Request budgets. `reserve_ms` is kept back from provider calls for scoring, judging and
+    validation; with `skip_late_stages` optional stages (scoring, output validation) are
+    skipped once the end-to-end budget is spent.
+    """
+
     provider_timeout_ms: int | None = Field(default=None, ge=1)
     e2e_timeout_ms: int | None = Field(default=None, ge=1)
+    reserve_ms: int = Field(default=0, ge=0)
+    skip_late_stages: bool = False
+    adaptive: AdaptiveTimeoutConfig = Field(default_factory=AdaptiveTimeoutConfig)
+
+
+class HedgingConfig(BaseModel):
+    """Fire one duplicate provider call once a model exceeds its observed latency percentile."""
+
+    enabled: bool = False
+    percentile: float = Field(default=0.95, gt=0.0, le=1.0)
+    min_samples: int = Field(default=20, ge=1)
+    min_delay_ms: int = Field(default=50, ge=0)
+    max_delay_ms: int | None = Field(default=None, ge=1)
+
+
+class RetryConfig(BaseModel):
+    """Bounded, deadline-aware retries of retryable provider errors (exponential backoff, full jitter)."""
+
+    enabled: bool = False
+    max_attempts: int = Field(default=3, ge=1)
+    base_delay_ms: int = Field(default=100, ge=0)
+    max_delay_ms: int = Field(default=2000, ge=0)
+    min_attempt_ms: int = Field(default=250, ge=1)
+    retry_on: list[str] = Field(
+        default_factory=lambda: ["timeout", "rate_limited", "http_error", "provider_error"]
+    )
+
+
+class RateLimitRule(BaseModel):
+    requests_per_second: float | None = Field(default=None, gt=0.0)
+    tokens_per_minute: int | None = Field(default=None, ge=1)
+    burst: int | None = Field(default=None, ge=1)
+
+
+class RateLimitConfig(BaseModel):
+    """Client-side token buckets per provider and per model, tightened on 429/Retry-After."""
+
+    enabled: bool = False
+    max_wait_ms: int = Field(default=1000, ge=0)
+    providers: dict[str, RateLimitRule] = Field(default_factory=dict)
+    models: dict[str, RateLimitRule] = Field(default_factory=dict)
+    backoff_factor: float = Field(default=0.5, gt=0.0, lt=1.0)
+    min_rate_fraction: float = Field(default=0.1, gt=0.0, le=1.0)
+    recovery_s: float = Field(default=30.0, gt=0.0)
+    default_retry_after_ms: int = Field(default=1000, ge=0)
+
+
+class TenantFairnessConfig(BaseModel):
+    """Deficit-round-robin sharing of provider-call slots between tenants (`ConsensusRequest.tenant`)."""
+
+    enabled: bool = False
+    max_in_flight: int = Field(default=64, ge=1)
+    weights: dict[str, int] = Field(default_factory=dict)
+    default_weight: int = Field(default=1, ge=1)
+    tenant_max_in_flight: dict[str, int] = Field(default_factory=dict)
+    default_tenant_max_in_flight: int | None = Field(default=None, ge=1)
+
+    @field_validator("weights", "tenant_max_in_flight")
+    @classmethod
+    def _positive(cls, value: dict[str, int]) -> dict[str, int]:
+        if any(v < 1 for v in value.values()):
+            raise ValueError("tenant weights and limits must be >= 1")
+        return value
+
+
+class AdmissionConfig(BaseModel):
+    """Bounded admission queue in front of the orchestrator; sheds requests that cannot start in time."""
+
+    enabled: bool = False
+    max_concurrent: int = Field(default=64, ge=1)
+    max_queue: int = Field(default=128, ge=0)
+    # A request needs at least this much budget left when it starts, or it is shed.
+    min_start_ms: int = Field(default=250, ge=0)
+    # Prompt characters x models across running and queued requests.
+    max_inflight_prompt_chars: int | None = Field(default=None, ge=1)
+
+
+class BulkheadRule(BaseModel):
+    max_in_flight: int = Field(ge=1)
+    max_queue: int = Field(default=0, ge=0)
+    # Queue wait cap; the (deadline-clamped) provider timeout bounds it either way.
+    max_wait_ms: int | None = Field(default=None, ge=0)
+
+
+class BulkheadConfig(BaseModel):
+    """Per-provider in-flight/queue bounds; calls over them are rejected fast as retryable provider errors."""
+
+    enabled: bool = False
+    providers: dict[str, BulkheadRule] = Field(default_factory=dict)
+    default: BulkheadRule | None = None
+
+
+class ConcurrencyLimitConfig(BaseModel):
+    """Process-wide AIMD concurrency limit per model, learned from latency, timeouts and 429s."""
+
+    enabled: bool = False
+    initial_limit: int = Field(default=8, ge=1)
+    min_limit: int = Field(default=1, ge=1)
+    max_limit: int = Field(default=128, ge=1)
+    backoff_ratio: float = Field(default=0.75, gt=0.0, lt=1.0)
+    # A success slower than latency_tolerance x the model's observed median is an overload signal.
+    latency_tolerance: float = Field(default=2.0, gt=1.0)
+    min_latency_samples: int = Field(default=20, ge=1)
+    max_wait_ms: int = Field(default=1000, ge=0)
+
+
+class ScoringPoolConfig(BaseModel):
+    """Run response scoring in a pool of worker processes instead of on the event loop."""
+
+    enabled: bool = False
+    workers: int = Field(default=2, ge=1)
+    start_method: Literal["spawn", "forkserver", "fork"] = "spawn"
+    # Run each analyzer of a response as its own task; worth it with workers >= 6.
+    fan_out_analyzers: bool = False
+    # Per response, counted from submission; a response past it is scored as an error.
+    timeout_ms: int = Field(default=2000, ge=1)
+
+
+class CacheConfig(BaseModel):
+    """In-memory LRU+TTL cache of successful provider responses, bounded by bytes."""
+
+    enabled: bool = False
+    ttl_s: float = Field(default=300.0, gt=0.0)
+    max_bytes: int = Field(default=32 * 1024 * 1024, ge=1024)
+
+
+class SingleFlightConfig(BaseModel):
+    """Share one in-flight provider call between concurrent identical calls."""
+
+    enabled: bool = False
+
+
+class RoutingConfig(BaseModel):
+    """Per-model fallback chains used when the primary is breaker-open or rate-limited."""
+
+    fallbacks: dict[str, list[str]] = Field(default_factory=dict)
+    fallback_on: list[Literal["breaker_open", "rate_limited"]] = Field(
+        default_factory=lambda: ["breaker_open", "rate_limited"]
+    )
+
+
+class SlowCallConfig(BaseModel):
+    """Open the breaker when too many recent calls were slow, not only when they failed."""
+
+    enabled: bool = False
+    # Fixed slowness threshold; when None it is `percentile_multiplier` x the model's observed
+    # `percentile` latency (once `min_latency_samples` were observed).
+    threshold_ms: int | None = Field(default=None, ge=1)
+    percentile: float = Field(default=0.95, gt=0.0, lt=1.0)
+    percentile_multiplier: float = Field(default=2.0, ge=1.0)
+    min_latency_samples: int = Field(default=50, ge=1)
+    window_size: int = Field(default=20, ge=1)
+    min_calls: int = Field(default=10, ge=1)
+    rate_threshold: float = Field(default=0.5, gt=0.0, le=1.0)
 
 
 class BreakerConfig(BaseModel):
@@ -74,6 +247,15 @@ class BreakerConfig(BaseModel):
     failure_threshold: int = Field(default=3, ge=1)
     open_ms: int = Field(default=15000, ge=1)
     failure_decay_ms: int = Field(default=60000, ge=1)
+    backend: Literal["memory", "sqlite"] = "memory"
+    state_path: str | None = None
+    slow_call: SlowCallConfig = Field(default_factory=SlowCallConfig)
+
+    @model_validator(mode="after")
+    def _require_state_path(self) -> "BreakerConfig":
+        if self.backend == "sqlite" and not self.state_path:
+            raise ValueError("breaker.state_path is required for the sqlite backend")
+        return self
 
 
 class PreambleConfig(BaseModel):
@@ -105,6 +287,18 @@ class Policy(BaseModel):
     consensus: ConsensusConfig = Field(default_factory=ConsensusConfig)
     guardrails: Guardrails = Field(default_factory=Guardrails)
     timeouts: Timeouts | None = None
+    hedging: HedgingConfig = Field(default_factory=HedgingConfig)
+    retries: RetryConfig = Field(default_factory=RetryConfig)
+    rate_limits: RateLimitConfig = Field(default_factory=RateLimitConfig)
+    concurrency: ConcurrencyLimitConfig = Field(default_factory=ConcurrencyLimitConfig)
+    bulkheads: BulkheadConfig = Field(default_factory=BulkheadConfig)
+    admission: AdmissionConfig = Field(default_factory=AdmissionConfig)
+    tenants: TenantFairnessConfig = Field(default_factory=TenantFairnessConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    scoring: ScoringPoolConfig = Field(default_factory=ScoringPoolConfig)
+    single_flight: SingleFlightConfig = Field(default_factory=SingleFlightConfig)
+    routing: RoutingConfig = Field(default_factory=RoutingConfig)
+    quorum: QuorumConfig = Field(default_factory=QuorumConfig)
     breaker: BreakerConfig = Field(default_factory=BreakerConfig)
     preambles: PreambleConfig = Field(default_factory=PreambleConfig)
     prefilter: PrefilterConfig = Field(default_factory=PrefilterConfig)
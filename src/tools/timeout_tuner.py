@@ -47,6 +47,19 @@ def _percentile(values: List[float], percentile: float) -> float:
     return float(sorted_vals[idx])
 
 
+def provider_timeout_from_percentile(
+    percentile_value_ms: float,
+    *,
+    safety_margin: float = 1.2,
+    overhead_ms: int = 200,
+    provider_min_ms: int = 500,
+    provider_max_ms: int = 20000,
+) -> int:
+    """Provider timeout for an observed latency percentile; shared with the online tuner."""
+    provider_raw = percentile_value_ms * safety_margin + overhead_ms
+    return int(max(provider_min_ms, min(provider_raw, provider_max_ms)))
+
+
 def suggest_timeouts(
     latencies_ms: Iterable[float],
     *,
@@ -68,8 +81,13 @@ def suggest_timeouts(
         warnings.append(f"low_sample_count:{len(values)}")
 
     p_val = _percentile(values, percentile)
-    provider_raw = p_val * safety_margin + overhead_ms
-    provider_timeout = int(max(provider_min_ms, min(provider_raw, provider_max_ms)))
+    provider_timeout = provider_timeout_from_percentile(
+        p_val,
+        safety_margin=safety_margin,
+        overhead_ms=overhead_ms,
+        provider_min_ms=provider_min_ms,
+        provider_max_ms=provider_max_ms,
+    )
 
     e2e_raw = provider_timeout * e2e_multiplier
     e2e_timeout = int(max(provider_min_ms, min(e2e_raw, e2e_max_ms)))
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from src.adapters.orchestration.latency import get_latency_tracker
+from src.adapters.orchestration.limiter import AdaptiveLimiter, get_adaptive_limiter
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.adapters.providers.ratelimit import CLIENT_RATE_LIMITED
+from src.contracts.errors import ErrorEnvelope
+from src.contracts.request import ConsensusRequest
+from src.policy.loader import PolicyStore
+from src.policy.models import ConcurrencyLimitConfig, Policy
+
+
+class DummySettings:
+    def __init__(self):
+        self.max_prompt_chars = 1000
+        self.max_models = 5
+        self.e2e_timeout_ms = 5000
+        self.provider_timeout_ms = 5000
+        self.default_models = ["m1"]
+
+
+@pytest.fixture(autouse=True)
+def reset_state():
+    get_adaptive_limiter().reset()
+    get_latency_tracker().reset()
+    yield
+    get_adaptive_limiter().reset()
+    get_latency_tracker().reset()
+
+
+@pytest.mark.asyncio
+async def test_aimd_grows_when_used_and_backs_off_on_overload():
+    cfg = ConcurrencyLimitConfig(enabled=True, initial_limit=4, min_limit=1, max_limit=6, backoff_ratio=0.5)
+    limiter = AdaptiveLimiter()
+
+    for _ in range(4):
+        assert await limiter.acquire("m1", cfg, 0) == 0.0
+    assert await limiter.acquire("m1", cfg, 0) is None  # limit reached, no queueing allowed
+
+    for _ in range(4):
+        limiter.release("m1", overloaded=False)
+    assert limiter.get("m1", cfg).limit > 4
+
+    await limiter.acquire("m1", cfg, 0)
+    state = limiter.release("m1", overloaded=True)
+    assert state.capacity == 2
+    for _ in range(5):
+        await limiter.acquire("m1", cfg, 0)
+        state = limiter.release("m1", overloaded=True)
+    assert state.capacity == 1
+
+
+@pytest.mark.asyncio
+async def test_waiters_queue_fifo_until_a_slot_frees():
+    cfg = ConcurrencyLimitConfig(enabled=True, initial_limit=1)
+    limiter = AdaptiveLimiter()
+    order = []
+
+    await limiter.acquire("m1", cfg, 0)
+
+    async def waiter(name):
+        await limiter.acquire("m1", cfg, 1)
+        order.append(name)
+        limiter.release("m1", None)
+
+    tasks = [asyncio.create_task(waiter("a")), asyncio.create_task(waiter("b"))]
+    await asyncio.sleep(0.01)
+    assert order == []
+    limiter.release("m1", None)
+    await asyncio.gather(*tasks)
+    assert order == ["a", "b"]
+    assert limiter.get("m1", cfg).in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_limits_calls_across_requests(monkeypatch):
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    in_flight = 0
+    peak = 0
+
+    async def fake_fetch(prompt, model, *args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.02)
+        in_flight -= 1
+        return ProviderResult(
+            model=model,
+            content=None,
+            latency_ms=20,
+            error=ErrorEnvelope(type="timeout", message="t", retryable=True),
+        )
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    policy = Policy.model_validate(
+        {
+            "policy_id": "p",
+            "breaker": {"enabled": False},
+            "concurrency": {"enabled": True, "initial_limit": 2, "max_wait_ms": 0},
+        }
+    )
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+
+    results = await asyncio.gather(
+        *(orch.run(ConsensusRequest(prompt="hi", models=["m1"]), f"req-{i}") for i in range(4))
+    )
+
+    assert peak == 2
+    rejected = [r for r in results if r.responses[0].error.message == CLIENT_RATE_LIMITED]
+    assert len(rejected) == 2
+    # Both admitted calls timed out: the limit backed off from 2.
+    assert get_adaptive_limiter().get("m1", policy.concurrency).capacity == 1
@@ -0,0 +1,83 @@
+import pytest
+
+from src.adapters.orchestration.latency import QuantileSketch, get_latency_tracker
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.contracts.errors import ErrorEnvelope
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy
+from src.tools.timeout_tuner import provider_timeout_from_percentile
+
+
+@pytest.fixture(autouse=True)
+def reset_tracker():
+    get_latency_tracker().reset()
+    yield
+    get_latency_tracker().reset()
+
+
+def test_sketch_quantile_within_relative_accuracy():
+    sketch = QuantileSketch(window=10_000, relative_accuracy=0.01)
+    for value in range(1, 1001):
+        sketch.add(float(value))
+
+    assert sketch.count() == 1000
+    assert sketch.quantile(0.5) == pytest.approx(500, rel=0.02)
+    assert sketch.quantile(0.95) == pytest.approx(950, rel=0.02)
+
+
+def test_sketch_follows_recent_latency():
+    sketch = QuantileSketch(window=200)
+    for _ in range(2000):
+        sketch.add(100.0)
+    for _ in range(2000):
+        sketch.add(1000.0)
+
+    assert sketch.count() <= 200 + sketch.buffer_size
+    assert sketch.quantile(0.5) == pytest.approx(1000, rel=0.02)
+
+
+def test_provider_timeout_formula_matches_offline_tuner():
+    assert provider_timeout_from_percentile(1000, safety_margin=1.5, overhead_ms=100) == 1600
+    assert provider_timeout_from_percentile(10, provider_min_ms=500) == 500
+    assert provider_timeout_from_percentile(1e6, provider_max_ms=20000) == 20000
+
+
+def _orchestrator(adaptive: dict) -> Orchestrator:
+    policy = Policy.model_validate({"policy_id": "p", "timeouts": {"adaptive": adaptive}})
+    return Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+
+
+@pytest.mark.asyncio
+async def test_adaptive_timeout_applied_per_model(monkeypatch):
+    seen = {}
+
+    async def fake_fetch(prompt, model, request_id, normalize_output, provider_timeout_ms=None, *args, **kwargs):
+        seen[model] = provider_timeout_ms
+        return ProviderResult(model=model, content="ok", latency_ms=10, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    tracker = get_latency_tracker()
+    for _ in range(40):
+        tracker.observe("fast", 100)
+    orch = _orchestrator({"enabled": True, "min_samples": 30, "overhead_ms": 0, "min_ms": 50})
+
+    await orch._call_single_model("hi", "fast", "req-1", False, provider_timeout_ms=5000)
+    await orch._call_single_model("hi", "new", "req-2", False, provider_timeout_ms=5000)
+
+    assert seen["fast"] == 120
+    assert seen["new"] == 5000
+
+
+@pytest.mark.asyncio
+async def test_timeouts_recorded_at_the_timeout(monkeypatch):
+    async def fake_fetch(*args, **kwargs):
+        error = ErrorEnvelope(type="timeout", message="timed out", retryable=True, status_code=504)
+        return ProviderResult(model="slow", content=None, latency_ms=800, error=error)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    orch = _orchestrator({"enabled": True})
+
+    await orch._call_single_model("hi", "slow", "req-1", False, provider_timeout_ms=800)
+
+    assert get_latency_tracker().quantile("slow", 1.0) == 800
@@ -0,0 +1,105 @@
+import asyncio
+
+import pytest
+
+from src.adapters.orchestration.admission import AdmissionController, get_admission_controller
+from src.client import LcsClient
+from src.contracts.request import ConsensusRequest
+from src.contracts.response import ConsensusResult, Timing
+from src.errors import LcsError
+from src.policy.models import AdmissionConfig, Policy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def reset_controller():
+    get_admission_controller().reset()
+    yield
+    get_admission_controller().reset()
+
+
+@pytest.mark.asyncio
+async def test_sheds_when_queue_full_or_memory_exceeded():
+    cfg = AdmissionConfig(enabled=True, max_concurrent=1, max_queue=1, min_start_ms=0, max_inflight_prompt_chars=100)
+    controller = AdmissionController()
+
+    assert await controller.acquire(cfg, 10, deadline_at=1e12) is None
+    queued = asyncio.create_task(controller.acquire(cfg, 10, deadline_at=1e12))
+    await asyncio.sleep(0)
+    assert controller.queue_depth == 1
+    assert await controller.acquire(cfg, 10, deadline_at=1e12) == "queue_full"
+
+    controller.release(cfg, 10, service_s=0.01)
+    assert await queued is None
+    assert controller.running == 1 and controller.queue_depth == 0
+    assert await controller.acquire(cfg, 95, deadline_at=1e12) == "memory"
+
+
+@pytest.mark.asyncio
+async def test_sheds_requests_that_cannot_start_in_time():
+    cfg = AdmissionConfig(enabled=True, max_concurrent=1, max_queue=10, min_start_ms=100)
+    clock = FakeClock()
+    controller = AdmissionController(clock)
+
+    assert await controller.acquire(cfg, 1, deadline_at=clock.now + 5) is None
+    controller.release(cfg, 1, service_s=2.0)
+    assert await controller.acquire(cfg, 1, deadline_at=clock.now + 5) is None
+
+    # One request ahead takes ~2s: a 1s budget cannot start in time, a 5s one can queue.
+    assert await controller.acquire(cfg, 1, deadline_at=clock.now + 1) == "deadline"
+    waiter = asyncio.create_task(controller.acquire(cfg, 1, deadline_at=clock.now + 2.11))
+    await asyncio.sleep(0)
+    assert controller.queue_depth == 1
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+    assert controller.queue_depth == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_request_expires_before_running():
+    cfg = AdmissionConfig(enabled=True, max_concurrent=1, max_queue=10, min_start_ms=0)
+    controller = AdmissionController()
+    now = controller._clock()
+
+    assert await controller.acquire(cfg, 1, deadline_at=now + 10) is None
+    assert await controller.acquire(cfg, 1, deadline_at=now + 0.02) == "expired"
+    assert controller.queue_depth == 0 and controller.queued_cost == 0
+
+
+@pytest.mark.asyncio
+async def test_client_sheds_overload_as_retryable(monkeypatch):
+    policy = Policy.model_validate(
+        {"policy_id": "p", "admission": {"enabled": True, "max_concurrent": 1, "max_queue": 1}}
+    )
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.load_policy", lambda path=None: policy)
+    started = []
+
+    async def fake_run(self, request, request_id, strategy_label=None, *, started_at=None):
+        started.append(request_id)
+        await asyncio.sleep(0.02)
+        return ConsensusResult(
+            request_id=request_id,
+            winner=None,
+            confidence=0.0,
+            responses=[],
+            method=strategy_label or "unknown",
+            timing=Timing(e2e_ms=1),
+        )
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.Orchestrator.run", fake_run)
+    client = LcsClient()
+    requests = [ConsensusRequest(prompt="hi", models=["m1"], request_id=f"r{i}") for i in range(3)]
+
+    results = await asyncio.gather(*(client.run(r) for r in requests), return_exceptions=True)
+
+    assert started == ["r0", "r1"]
+    shed = results[2]
+    assert isinstance(shed, LcsError) and shed.retryable
+    assert shed.details == {"status_code": 429}
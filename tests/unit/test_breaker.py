@@ -1,6 +1,11 @@
 import pytest
 
-from src.adapters.orchestration.breaker import CircuitBreaker
+from src.adapters.orchestration.breaker import (
+    BreakerManager,
+    CircuitBreaker,
+    MemoryBreakerStore,
+    SqliteBreakerStore,
+)
 from src.policy.models import BreakerConfig
 
 
@@ -89,3 +94,120 @@ async def test_failure_decay_resets_counter():
     opened, state = await breaker.record_failure()
     assert opened is False
     assert state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_lease_lapses():
+    clock = FakeClock()
+    config = BreakerConfig(failure_threshold=1, open_ms=100, failure_decay_ms=1000)
+    breaker = CircuitBreaker(config, clock)
+
+    await breaker.record_failure()
+    clock.advance_ms(100)
+    assert (await breaker.should_allow()) == (True, "half_open")
+    assert (await breaker.should_allow()) == (False, "half_open")
+
+    clock.advance_ms(100)  # probe owner never reported back
+    assert (await breaker.should_allow()) == (True, "half_open")
+
+
+def test_sqlite_backend_requires_state_path():
+    with pytest.raises(ValueError):
+        BreakerConfig(backend="sqlite")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_shares_state_between_workers(tmp_path):
+    clock = FakeClock()
+    config = BreakerConfig(failure_threshold=3, open_ms=1000, backend="sqlite", state_path=str(tmp_path / "b.db"))
+    # Separate connections on one file stand in for separate worker processes.
+    stores = [SqliteBreakerStore(config.state_path), SqliteBreakerStore(config.state_path)]
+    workers = [BreakerManager(config, clock, store=store) for store in stores]
+    try:
+        assert (await workers[0].record_failure("m1")) == (False, "closed")
+        assert (await workers[1].record_failure("m1")) == (False, "closed")
+        assert (await workers[0].record_failure("m1")) == (True, "open")
+        assert (await workers[1].should_allow("m1")) == (False, "open")
+        assert (await workers[1].should_allow("m2")) == (True, "closed")
+
+        clock.advance_ms(1000)
+        assert (await workers[1].should_allow("m1")) == (True, "half_open")
+        assert (await workers[0].should_allow("m1")) == (False, "half_open")
+        assert (await workers[1].record_success("m1")) == "closed"
+        assert (await workers[0].state("m1")) == "closed"
+    finally:
+        for store in stores:
+            store.close()
+
+
+@pytest.mark.asyncio
+async def test_unopenable_state_path_falls_back_to_process_local_state(tmp_path):
+    config = BreakerConfig(
+        failure_threshold=1, backend="sqlite", state_path=str(tmp_path / "missing" / "b.db")
+    )
+    manager = BreakerManager(config, FakeClock())
+
+    assert isinstance(manager.store, MemoryBreakerStore)
+    assert BreakerManager(config).store is manager.store
+    assert (await manager.record_failure("m1")) == (True, "open")
+    assert (await manager.should_allow("m1")) == (False, "open")
+
+
+@pytest.mark.asyncio
+async def test_sqlite_store_only_writes_changes(tmp_path, monkeypatch):
+    clock = FakeClock()
+    config = BreakerConfig(failure_threshold=3, open_ms=1000, backend="sqlite", state_path=str(tmp_path / "b.db"))
+    store = SqliteBreakerStore(config.state_path)
+    manager = BreakerManager(config, clock, store=store)
+    try:
+        assert (await manager.record_failure("m1")) == (False, "closed")
+        changes = store._conn.total_changes
+
+        def no_write_lock(key, apply):
+            raise AssertionError("unchanged records must not take the write lock")
+
+        monkeypatch.setattr(store, "_update_sync", no_write_lock)
+        for _ in range(3):
+            assert (await manager.should_allow("m1")) == (True, "closed")
+            assert (await manager.release("m1")) == "closed"
+            assert (await manager.state("m1")) == "closed"
+            assert (await manager.state("m2")) == "closed"
+        assert store._conn.total_changes == changes
+
+        monkeypatch.undo()
+        assert (await manager.record_success("m1")) == "closed"
+        assert store._conn.total_changes == changes + 1
+    finally:
+        store.close()
+
+
+@pytest.mark.asyncio
+async def test_slow_call_ratio_opens_breaker():
+    clock = FakeClock()
+    config = BreakerConfig(
+        failure_threshold=5,
+        open_ms=100,
+        slow_call={"enabled": True, "threshold_ms": 1000, "window_size": 4, "min_calls": 4, "rate_threshold": 0.5},
+    )
+    breaker = CircuitBreaker(config, clock)
+
+    assert await breaker.record_success(slow=True) == "closed"
+    assert await breaker.record_success(slow=False) == "closed"
+    assert await breaker.record_success(slow=False) == "closed"
+    assert await breaker.record_success(slow=True) == "open"  # 2 of the last 4 calls were slow
+    assert (await breaker.should_allow()) == (False, "open")
+
+    clock.advance_ms(100)
+    assert (await breaker.should_allow()) == (True, "half_open")
+    assert await breaker.record_success(slow=True) == "open"  # a slow probe re-opens
+
+    clock.advance_ms(100)
+    await breaker.should_allow()
+    assert await breaker.record_success(slow=False) == "closed"
+
+
+@pytest.mark.asyncio
+async def test_slow_flag_ignored_when_mode_disabled():
+    breaker = CircuitBreaker(BreakerConfig(failure_threshold=5), FakeClock())
+    for _ in range(30):
+        assert await breaker.record_success(slow=True) == "closed"
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from src.adapters.orchestration.bulkhead import BULKHEAD_FULL, Bulkhead, get_bulkheads
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.contracts.request import ConsensusRequest
+from src.policy.loader import PolicyStore
+from src.policy.models import BulkheadConfig, BulkheadRule, Policy
+
+
+class DummySettings:
+    def __init__(self):
+        self.max_prompt_chars = 1000
+        self.max_models = 5
+        self.e2e_timeout_ms = 5000
+        self.provider_timeout_ms = 5000
+        self.default_models = ["m1"]
+
+
+@pytest.fixture(autouse=True)
+def reset_bulkheads():
+    get_bulkheads().reset()
+    yield
+    get_bulkheads().reset()
+
+
+@pytest.mark.asyncio
+async def test_bulkhead_queues_then_rejects():
+    bulkhead = Bulkhead(BulkheadRule(max_in_flight=1, max_queue=1))
+    assert await bulkhead.acquire(None) is None
+
+    waiter = asyncio.create_task(bulkhead.acquire(1))
+    await asyncio.sleep(0)
+    assert bulkhead.queued == 1
+    assert await bulkhead.acquire(1) == "full"
+
+    bulkhead.release()
+    assert await waiter is None
+    assert bulkhead.in_flight == 1 and bulkhead.saturation == 1.0
+    assert await bulkhead.acquire(0.01) == "queue_timeout"
+
+
+def test_registry_uses_provider_rule_or_default():
+    cfg = BulkheadConfig(enabled=True, providers={"slow": BulkheadRule(max_in_flight=2)})
+    assert get_bulkheads().get("slow", cfg).rule.max_in_flight == 2
+    assert get_bulkheads().get("other", cfg) is None
+    cfg = BulkheadConfig(enabled=True, default=BulkheadRule(max_in_flight=3))
+    assert get_bulkheads().get("other", cfg).rule.max_in_flight == 3
+
+
+@pytest.mark.asyncio
+async def test_full_bulkhead_fails_fast_without_tripping_breaker(monkeypatch):
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    calls = []
+
+    async def slow_fetch(prompt, model, *args, **kwargs):
+        calls.append(model)
+        await asyncio.sleep(0.05)
+        return ProviderResult(model=model, content="ok", latency_ms=50, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", slow_fetch)
+    policy = Policy.model_validate(
+        {
+            "policy_id": "p",
+            "breaker": {"failure_threshold": 1},
+            "bulkheads": {"enabled": True, "providers": {"openrouter": {"max_in_flight": 1}}},
+        }
+    )
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+
+    first, second = await asyncio.gather(
+        orch.run(ConsensusRequest(prompt="hi", models=["m1"]), "req-1"),
+        orch.run(ConsensusRequest(prompt="hi", models=["m1"]), "req-2"),
+    )
+
+    assert first.responses[0].content == "ok"
+    error = second.responses[0].error
+    assert error.type == "provider_error" and error.message == BULKHEAD_FULL and error.retryable
+    assert len(calls) == 1
+    assert await orch.breakers.state("m1") == "closed"
@@ -0,0 +1,152 @@
+import asyncio
+
+import pytest
+
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.scheduler import CallScheduler
+from src.client import LcsClient
+from src.contracts.request import ConsensusRequest
+
+
+class _Concurrency:
+    def __init__(self):
+        self.current = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def fetch(self, *args, **kwargs):
+        model = kwargs.get("model", args[1] if len(args) > 1 else None)
+        self.calls += 1
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            self.current -= 1
+        return ProviderResult(model=model, content="same answer", latency_ms=10)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_bounds_global_and_per_provider_slots():
+    scheduler = CallScheduler(max_in_flight=3, per_provider_limit={"slow": 1})
+    tracker = _Concurrency()
+    slow = _Concurrency()
+
+    async def call(provider: str, counter: _Concurrency):
+        async with scheduler.slot(provider):
+            await counter.fetch("p", "m")
+
+    await asyncio.gather(*(call("fast", tracker) for _ in range(6)), *(call("slow", slow) for _ in range(3)))
+
+    assert tracker.peak <= 3
+    assert slow.peak == 1
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_run_many_streams_every_result_within_the_global_limit(monkeypatch):
+    counter = _Concurrency()
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", counter.fetch)
+
+    client = LcsClient()
+    requests = [ConsensusRequest(prompt=f"prompt {i}", models=["m1", "m2"]) for i in range(8)]
+
+    items = [item async for item in client.run_many(requests, max_in_flight=3)]
+
+    assert sorted(item.index for item in items) == list(range(8))
+    assert all(item.error is None and item.result is not None for item in items)
+    assert {item.request_id for item in items} == {r.request_id for r in requests}
+    assert counter.calls == 16
+    assert counter.peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_run_many_reports_failures_without_stopping_the_batch(monkeypatch):
+    counter = _Concurrency()
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", counter.fetch)
+
+    client = LcsClient()
+    requests = [
+        ConsensusRequest(prompt="ok", models=["m1"]),
+        ConsensusRequest(prompt="bad", models=["m1"], strategy="does-not-exist"),
+    ]
+
+    items = {item.index: item async for item in client.run_many(requests, per_provider_limit=1)}
+
+    assert items[0].result is not None
+    assert items[1].error.code == "validation_error"
+
+
+@pytest.mark.asyncio
+async def test_scheduler_serves_queued_calls_by_priority():
+    scheduler = CallScheduler(max_in_flight=1)
+    order = []
+    release = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot("p", "low"):
+            await release.wait()
+
+    async def call(priority):
+        async with scheduler.slot("p", priority):
+            order.append(priority)
+
+    first = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    waiting = [asyncio.create_task(call(p)) for p in ("low", "normal", "low", "high")]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *waiting)
+
+    assert order == ["high", "normal", "low", "low"]
+
+
+@pytest.mark.asyncio
+async def test_reserved_slots_only_go_to_high_priority():
+    scheduler = CallScheduler(max_in_flight=2, reserved_high=1)
+    entered = []
+
+    async def call(priority, hold):
+        async with scheduler.slot("p", priority):
+            entered.append(priority)
+            await hold.wait()
+
+    hold = asyncio.Event()
+    tasks = [asyncio.create_task(call("low", hold)), asyncio.create_task(call("normal", hold))]
+    await asyncio.sleep(0)
+    assert entered == ["low"]  # the second slot is reserved
+
+    tasks.append(asyncio.create_task(call("high", hold)))
+    await asyncio.sleep(0)
+    assert entered == ["low", "high"]
+    hold.set()
+    await asyncio.gather(*tasks)
+    assert scheduler.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_client_scheduler_lets_interactive_requests_overtake_batch(monkeypatch):
+    started = []
+
+    async def fetch(*args, **kwargs):
+        prompt = kwargs.get("prompt", args[0] if args else None)
+        model = kwargs.get("model", args[1] if len(args) > 1 else None)
+        started.append(prompt)
+        await asyncio.sleep(0.01)
+        return ProviderResult(model=model, content="same answer", latency_ms=10)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fetch)
+    client = LcsClient(scheduler=CallScheduler(max_in_flight=1))
+    batch = [ConsensusRequest(prompt=f"batch {i}", models=["m1"], priority="low") for i in range(5)]
+
+    async def drain():
+        return [item async for item in client.run_many(batch, max_in_flight=5)]
+
+    batch_task = asyncio.create_task(drain())
+    await asyncio.sleep(0.005)
+    interactive = await client.run(ConsensusRequest(prompt="interactive", models=["m1"], priority="high"))
+    items = await batch_task
+
+    assert interactive.winner == "m1"
+    assert all(item.error is None for item in items)
+    assert started.index("interactive") <= 2
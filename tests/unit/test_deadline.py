@@ -0,0 +1,133 @@
+import asyncio
+import time
+
+import pytest
+
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import OrchestrationError, Orchestrator
+from src.adapters.orchestration.timeouts import Deadline
+from src.contracts.early_stop import EarlyStopConfig
+from src.contracts.request import ConsensusRequest, OutputValidationConfig
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy
+
+
+class DummySettings:
+    def __init__(self):
+        self.max_prompt_chars = 1000
+        self.max_models = 5
+        self.e2e_timeout_ms = 1000
+        self.provider_timeout_ms = 5000
+        self.default_models = ["m1"]
+
+
+def test_deadline_budget_accounting():
+    now = [10.0]
+    deadline = Deadline(1000, clock=lambda: now[0])
+
+    now[0] = 10.3
+    assert deadline.elapsed_ms() == 300
+    assert deadline.remaining_ms() == 700
+    assert deadline.remaining_ms(reserve_ms=200) == 500
+    assert deadline.clamp_ms(5000, reserve_ms=200) == 500
+    assert deadline.clamp_ms(100) == 100
+    assert not deadline.expired
+
+    now[0] = 11.5
+    assert deadline.remaining_ms() == 0
+    assert deadline.expired
+
+
+def _orchestrator(monkeypatch, timeouts: dict, callback=None) -> Orchestrator:
+    policy = Policy.model_validate({"policy_id": "p", "timeouts": timeouts})
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    return Orchestrator(
+        policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy),
+        run_event_callback=callback,
+    )
+
+
+@pytest.mark.asyncio
+async def test_provider_timeout_leaves_reserve_for_later_stages(monkeypatch):
+    captured = {}
+
+    async def fake_fetch(prompt, model, request_id, normalize_output, provider_timeout_ms=None, **kwargs):
+        captured["provider_timeout_ms"] = provider_timeout_ms
+        return ProviderResult(model=model, content="ok", latency_ms=1, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    orch = _orchestrator(monkeypatch, {"e2e_timeout_ms": 1000, "reserve_ms": 400})
+
+    await orch.run(ConsensusRequest(prompt="hi", models=["m1"]), "req-1")
+
+    assert 0 < captured["provider_timeout_ms"] <= 600
+
+
+@pytest.mark.asyncio
+async def test_scoring_skipped_once_budget_is_spent(monkeypatch):
+    events = []
+
+    async def callback(event):
+        events.append(event)
+
+    async def fake_fetch(*args, **kwargs):
+        return ProviderResult(model="m1", content="ok", latency_ms=1, error=None)
+
+    async def slow_gather(coro, timeout_ms):
+        results = await coro
+        await asyncio.sleep(timeout_ms / 1000 + 0.01)
+        return results
+
+    def fail_scoring(responses):
+        raise AssertionError("scoring must be skipped past the deadline")
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.enforce_timeout", slow_gather)
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.compute_scores", fail_scoring)
+    orch = _orchestrator(monkeypatch, {"e2e_timeout_ms": 50, "skip_late_stages": True}, callback)
+
+    result = await orch.run(ConsensusRequest(prompt="hi", models=["m1"], include_scores=True), "req-1")
+
+    assert result.winner == "m1"
+    assert result.scores is None
+    assert result.timing.skipped_stages == ["scoring"]
+    await asyncio.sleep(0.01)
+    assert len(events) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("early_stop", [None, EarlyStopConfig(enabled=True, min_samples=1)])
+async def test_request_past_its_budget_fails_before_preflight(monkeypatch, early_stop):
+    def fail_preflight(*args, **kwargs):
+        raise AssertionError("preflight must not start past the deadline")
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.apply_preflight_gating", fail_preflight)
+    orch = _orchestrator(monkeypatch, {"e2e_timeout_ms": 50})
+    request = ConsensusRequest(prompt="hi", models=["m1"], early_stop=early_stop)
+
+    with pytest.raises(OrchestrationError) as exc_info:
+        await orch.run(request, "req-1", started_at=time.perf_counter() - 1)
+
+    assert exc_info.value.envelope.status_code == 504
+
+
+@pytest.mark.asyncio
+async def test_output_validation_skipped_once_budget_is_spent(monkeypatch):
+    async def fake_fetch(*args, **kwargs):
+        return ProviderResult(model="m1", content="not json", latency_ms=1, error=None)
+
+    async def slow_gather(coro, timeout_ms):
+        results = await coro
+        await asyncio.sleep(timeout_ms / 1000 + 0.01)
+        return results
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.enforce_timeout", slow_gather)
+    orch = _orchestrator(monkeypatch, {"e2e_timeout_ms": 50, "skip_late_stages": True})
+    request = ConsensusRequest(prompt="hi", models=["m1"], output_validation=OutputValidationConfig(enabled=True))
+
+    result = await orch.run(request, "req-1")
+
+    assert result.winner == "m1"
+    assert result.method != "validation_failed"
+    assert result.timing.skipped_stages == ["output_validation"]
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from src.adapters.observability.metrics import tenant_calls_total
+from src.adapters.orchestration.fairqueue import FairQueue, get_fair_queue, request_tenant, tenant_label
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.contracts.request import ConsensusRequest
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy, TenantFairnessConfig
+
+
+class DummySettings:
+    def __init__(self):
+        self.max_prompt_chars = 1000
+        self.max_models = 5
+        self.e2e_timeout_ms = 5000
+        self.provider_timeout_ms = 5000
+        self.default_models = ["m1"]
+
+
+@pytest.fixture(autouse=True)
+def reset_queue():
+    get_fair_queue().reset()
+    yield
+    get_fair_queue().reset()
+
+
+@pytest.mark.asyncio
+async def test_slots_are_shared_by_weight_while_contended():
+    cfg = TenantFairnessConfig(enabled=True, max_in_flight=1, weights={"ide": 2})
+    queue = FairQueue()
+    order = []
+    release = asyncio.Event()
+
+    async def holder():
+        async with queue.slot(cfg, "warm"):
+            await release.wait()
+
+    async def call(tenant):
+        async with queue.slot(cfg, tenant):
+            order.append(tenant)
+
+    first = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    calls = [asyncio.create_task(call("batch")) for _ in range(6)]
+    calls += [asyncio.create_task(call("ide")) for _ in range(6)]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(first, *calls)
+
+    assert order[:9] == ["batch", "ide", "ide"] * 3
+    assert queue.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_tenant_in_flight_cap_leaves_slots_to_others():
+    cfg = TenantFairnessConfig(enabled=True, max_in_flight=4, tenant_max_in_flight={"batch": 1})
+    queue = FairQueue()
+    peak = {"batch": 0, "ide": 0}
+    current = {"batch": 0, "ide": 0}
+
+    async def call(tenant):
+        async with queue.slot(cfg, tenant):
+            current[tenant] += 1
+            peak[tenant] = max(peak[tenant], current[tenant])
+            await asyncio.sleep(0.01)
+            current[tenant] -= 1
+
+    await asyncio.gather(*(call("batch") for _ in range(4)), *(call("ide") for _ in range(4)))
+
+    assert peak["batch"] == 1
+    assert peak["ide"] == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelled_queued_call_forgets_its_tenant():
+    cfg = TenantFairnessConfig(enabled=True, max_in_flight=1)
+    queue = FairQueue()
+    release = asyncio.Event()
+
+    async def holder():
+        async with queue.slot(cfg, "warm"):
+            await release.wait()
+
+    async def call(tenant):
+        async with queue.slot(cfg, tenant):
+            pass
+
+    first = asyncio.create_task(holder())
+    await asyncio.sleep(0)
+    queued = [asyncio.create_task(call(f"team-{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    for task in queued:
+        task.cancel()
+    await asyncio.gather(*queued, return_exceptions=True)
+    release.set()
+    await first
+
+    assert queue._tenants == {}
+    assert not queue._active
+    assert queue.in_flight == 0
+
+
+def test_unknown_tenants_share_one_metric_label():
+    cfg = TenantFairnessConfig(enabled=True, weights={"ide": 2}, tenant_max_in_flight={"batch": 1})
+    assert [tenant_label(t, cfg) for t in ("ide", "batch", "default", "team-42")] == [
+        "ide",
+        "batch",
+        "default",
+        "other",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_queues_calls_under_request_tenant(monkeypatch):
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    seen = []
+
+    async def fake_fetch(prompt, model, *args, **kwargs):
+        seen.append((request_tenant.get(), get_fair_queue().in_flight_of("ide")))
+        return ProviderResult(model=model, content="ok", latency_ms=1, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    policy = Policy.model_validate({"policy_id": "p", "tenants": {"enabled": True, "weights": {"ide": 3}}})
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+    before = tenant_calls_total.labels(tenant="ide")._value.get()
+
+    await orch.run(ConsensusRequest(prompt="hi", models=["m1"], tenant="ide"), "req-1")
+
+    assert seen == [("ide", 1)]
+    assert tenant_calls_total.labels(tenant="ide")._value.get() == before + 1
+    assert request_tenant.get() is None
@@ -0,0 +1,186 @@
+import asyncio
+
+import pytest
+
+from src.adapters.orchestration.hedging import hedged_call
+from src.adapters.orchestration.latency import LatencyTracker, get_latency_tracker
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.adapters.providers.ratelimit import get_rate_limiter
+from src.contracts.errors import ErrorEnvelope
+from src.contracts.request import ConsensusRequest
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy
+
+
+def _ok(content: str = "ok", latency_ms: int = 1) -> ProviderResult:
+    return ProviderResult(model="m1", content=content, latency_ms=latency_ms, error=None)
+
+
+def _err() -> ProviderResult:
+    return ProviderResult(
+        model="m1", content=None, latency_ms=1, error=ErrorEnvelope(type="http_error", message="x")
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_tracker():
+    get_latency_tracker().reset()
+    yield
+    get_latency_tracker().reset()
+
+
+def test_latency_tracker_quantile_requires_min_samples():
+    tracker = LatencyTracker(window=10)
+    for value in [10, 20, 30, 40]:
+        tracker.observe("m1", value)
+
+    assert tracker.quantile("m1", 0.95, min_samples=5) is None
+    assert tracker.quantile("m1", 0.5) == 30
+    assert tracker.quantile("m1", 1.0) == 40
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_skips_hedge_when_primary_is_fast():
+    calls = []
+
+    async def call():
+        calls.append(1)
+        return _ok()
+
+    result, winner = await hedged_call(call, delay_ms=50)
+
+    assert result.content == "ok"
+    assert winner is None
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_hedge_wins_and_primary_is_cancelled():
+    cancelled = asyncio.Event()
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        if len(attempts) == 1:
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return _ok("slow")
+        return _ok("fast")
+
+    result, winner = await hedged_call(call, delay_ms=10)
+
+    assert winner == "hedge"
+    assert result.content == "fast"
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_hedged_call_waits_for_success_after_first_failure():
+    attempts = []
+
+    async def call():
+        attempts.append(1)
+        if len(attempts) == 1:
+            await asyncio.sleep(0.05)
+            return _ok("primary")
+        return _err()
+
+    result, winner = await hedged_call(call, delay_ms=10)
+
+    assert winner == "primary"
+    assert result.content == "primary"
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_hedges_and_records_one_breaker_call(monkeypatch):
+    policy = Policy.model_validate(
+        {
+            "policy_id": "p",
+            "hedging": {"enabled": True, "percentile": 0.9, "min_samples": 3, "min_delay_ms": 10},
+            "breaker": {"enabled": True, "failure_threshold": 1},
+        }
+    )
+    for _ in range(3):
+        get_latency_tracker().observe("m1", 20)
+
+    attempts = []
+
+    async def fake_fetch(*args, **kwargs):
+        attempts.append(1)
+        if len(attempts) == 1:
+            await asyncio.sleep(1)
+        return ProviderResult(model="m1", content="ok", latency_ms=5, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+
+    store = PolicyStore(loader=lambda path=None: policy, policy=policy)
+    orch = Orchestrator(policy_store=store)
+    failures = []
+    original = orch.breakers.record_failure
+
+    async def tracking_failure(model):
+        failures.append(model)
+        return await original(model)
+
+    orch.breakers.record_failure = tracking_failure
+
+    result = await orch._call_single_model("hi", "m1", "req-1", False)
+
+    assert len(attempts) == 2
+    assert result.hedged is True
+    assert result.breaker_state == "closed"
+    assert failures == []
+    assert result.to_contract().hedged is True
+
+
+@pytest.mark.asyncio
+async def test_hedge_takes_its_own_rate_limit_token_or_is_skipped(monkeypatch):
+    def policy(burst: int) -> Policy:
+        return Policy.model_validate(
+            {
+                "policy_id": "p",
+                "hedging": {"enabled": True, "percentile": 0.9, "min_samples": 3, "min_delay_ms": 10},
+                "rate_limits": {
+                    "enabled": True,
+                    "max_wait_ms": 1000,
+                    "models": {"m1": {"requests_per_second": 0.001, "burst": burst}},
+                },
+            }
+        )
+
+    for _ in range(3):
+        get_latency_tracker().observe("m1", 20)
+    attempts = []
+
+    async def fake_fetch(*args, **kwargs):
+        attempts.append(1)
+        if len(attempts) == 1:
+            await asyncio.sleep(0.2)
+        return ProviderResult(model="m1", content="ok", latency_ms=5, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+
+    get_rate_limiter().reset()
+    try:
+        only_one = policy(burst=1)
+        orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: only_one, policy=only_one))
+        skipped = await orch._call_single_model("hi", "m1", "req-1", False)
+        assert len(attempts) == 1
+        assert skipped.error is None and skipped.hedged is False
+
+        get_rate_limiter().reset()
+        attempts.clear()
+        two = policy(burst=2)
+        orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: two, policy=two))
+        hedged = await orch._call_single_model("hi", "m1", "req-2", False)
+        assert len(attempts) == 2
+        assert hedged.hedged is True
+        # Both calls were charged: nothing is left for a third.
+        blocked = await orch._call_single_model("hi", "m1", "req-3", False)
+        assert blocked.error is not None and blocked.error.type == "rate_limited"
+    finally:
+        get_rate_limiter().reset()
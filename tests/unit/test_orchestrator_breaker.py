@@ -59,3 +59,38 @@ async def test_orchestrator_short_circuits_when_open(monkeypatch):
     assert call_count["value"] == 1  # short-circuited
     assert result2.responses[0].error.type == "provider_error"
     assert result2.responses[0].breaker_state == "open"
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_opens_on_slow_calls(monkeypatch):
+    from src.adapters.observability.metrics import provider_breaker_state
+    from src.policy.loader import PolicyStore
+
+    policy = Policy.model_validate(
+        {
+            "policy_id": "p",
+            "breaker": {
+                "failure_threshold": 5,
+                "slow_call": {"enabled": True, "threshold_ms": 100, "window_size": 2, "min_calls": 2},
+            },
+        }
+    )
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    calls = []
+
+    async def slow_fetch(prompt, model, *args, **kwargs):
+        calls.append(model)
+        return ProviderResult(model=model, content="ok", latency_ms=400, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", slow_fetch)
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+
+    first = await orch.run(ConsensusRequest(prompt="hi", models=["m1"]), "req-1")
+    second = await orch.run(ConsensusRequest(prompt="hi", models=["m1"]), "req-2")
+    third = await orch.run(ConsensusRequest(prompt="hi", models=["m1"]), "req-3")
+
+    assert first.responses[0].content == "ok" and second.responses[0].content == "ok"
+    assert second.responses[0].breaker_state == "open"
+    assert third.responses[0].error.message == "provider_circuit_open"
+    assert len(calls) == 2
+    assert provider_breaker_state.labels(model="m1")._value.get() == 1.0
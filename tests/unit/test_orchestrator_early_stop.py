@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from src.adapters.orchestration.models import ProviderResult
@@ -71,3 +73,35 @@ async def test_early_stop_hits_max_samples(monkeypatch):
     assert result.early_stop.samples_used == 3
     assert result.early_stop.stop_reason == "max_samples"
     assert result.winner == "m3"
+
+
+@pytest.mark.asyncio
+async def test_early_stop_dispatches_in_parallel_waves(monkeypatch):
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    in_flight = {"now": 0, "peak": 0}
+    calls = []
+
+    async def fake_fetch(prompt, model, request_id, normalize_output, include_scores, provider_timeout_ms=None):
+        calls.append(model)
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        await asyncio.sleep(0.01)
+        in_flight["now"] -= 1
+        return ProviderResult(model=model, content="ok", latency_ms=10, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+
+    judge = FakeJudge(confidence_fn=lambda count: 0.9 if count >= 4 else 0.2)
+    early_stop_cfg = EarlyStopConfig(
+        enabled=True, min_samples=3, max_samples=4, confidence_threshold=0.8, wave_size=2
+    )
+    req = ConsensusRequest(prompt="hi", models=["m1", "m2", "m3", "m4"], early_stop=early_stop_cfg)
+
+    result = await Orchestrator(judge=judge).run(req, "req-es3")
+
+    assert in_flight["peak"] == 3
+    assert calls == ["m1", "m2", "m3", "m4"]
+    assert result.early_stop.samples_used == 4
+    assert result.early_stop.waves == 2
+    assert result.early_stop.stop_reason == "confidence_reached"
@@ -46,7 +46,8 @@ async def test_policy_e2e_timeout_overrides_settings(monkeypatch):
 
     await orch.run(req, "req-timeout")
 
-    assert captured["timeout"] == 123
+    # Provider calls get what is left of the 123 ms budget after preflight.
+    assert 0 < captured["timeout"] <= 123
 
 
 @pytest.mark.asyncio
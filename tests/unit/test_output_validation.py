@@ -3,6 +3,9 @@ import pytest
 from src.adapters.orchestration.orchestrator import Orchestrator
 from src.adapters.orchestration.models import ProviderResult
 from src.contracts.request import ConsensusRequest, OutputValidationConfig
+from src.adapters.providers.ratelimit import CLIENT_RATE_LIMITED, get_rate_limiter
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy
 
 
 class DummySettings:
@@ -88,3 +91,39 @@ async def test_validation_failure_gates(monkeypatch):
     assert result.gate_reason.startswith("validation_failed")
     assert result.winner is None
     assert result.confidence == 0.0
+
+
+@pytest.mark.asyncio
+async def test_reask_goes_through_the_rate_limiter(monkeypatch):
+    calls = {"count": 0}
+
+    async def fetch(prompt, model, request_id, normalize_output, include_scores, provider_timeout_ms=None, provider_overrides=None):
+        calls["count"] += 1
+        return ProviderResult(model=model, content="not json", latency_ms=5, provider="openrouter", error=None)
+
+    policy = Policy.model_validate(
+        {
+            "policy_id": "p",
+            "rate_limits": {"enabled": True, "max_wait_ms": 0, "models": {"m1": {"requests_per_second": 0.001, "burst": 1}}},
+        }
+    )
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fetch)
+    orch = Orchestrator(
+        policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy),
+        output_validator=lambda content: (False, "invalid"),
+    )
+    req = ConsensusRequest(
+        prompt="hi",
+        models=["m1"],
+        output_validation=OutputValidationConfig(enabled=True, kind="json", max_reask=1),
+    )
+
+    get_rate_limiter().reset()
+    try:
+        result = await orch.run(req, "req-reask-limited")
+    finally:
+        get_rate_limiter().reset()
+
+    assert calls["count"] == 1
+    assert result.responses[0].error.message == CLIENT_RATE_LIMITED
@@ -0,0 +1,139 @@
+import httpx
+import json
+import pytest
+import respx
+
+from src.adapters.orchestration.models import fetch_provider_result
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.adapters.providers import openrouter
+from src.adapters.providers.openrouter import stream_model
+from src.adapters.providers.sse import iter_sse_data
+from src.contracts.request import ConsensusRequest
+
+
+class DummySettings:
+    def __init__(self):
+        self.max_prompt_chars = 1000
+        self.max_models = 5
+        self.e2e_timeout_ms = 5000
+        self.provider_timeout_ms = 1000
+        self.default_models = ["m1", "m2"]
+
+
+def _sse(*events: str) -> bytes:
+    return "".join(f"data: {event}\n\n" for event in events).encode()
+
+
+def _delta(text: str) -> str:
+    return json.dumps({"choices": [{"delta": {"content": text}}]})
+
+
+@pytest.fixture
+async def live_client(monkeypatch):
+    client = httpx.AsyncClient(base_url="https://openrouter.ai/api/v1")
+    monkeypatch.setattr("src.adapters.providers.openrouter.get_client", lambda timeout_ms=None: client)
+    yield
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_iter_sse_data_skips_comments_and_stops_at_done():
+    async def lines():
+        for line in [": OPENROUTER PROCESSING", "", "data: a", "data: b", "", "data: [DONE]", "", "data: late", ""]:
+            yield line
+
+    assert [data async for data in iter_sse_data(lines())] == ["a\nb"]
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_model_assembles_content_and_reports_telemetry(live_client):
+    usage = json.dumps({"choices": [], "usage": {"completion_tokens": 3}})
+    route = respx.post("https://openrouter.ai/api/v1/chat/completions").mock(
+        return_value=httpx.Response(
+            200,
+            content=_sse(_delta("hel"), _delta("lo"), usage, "[DONE]"),
+            headers={"content-type": "text/event-stream"},
+        )
+    )
+
+    content, latency_ms, error, stats = await stream_model("hi", "gpt", "req-1")
+
+    assert json.loads(route.calls[0].request.content)["stream"] is True
+    assert error is None
+    assert content == "hello"
+    assert stats.ttft_ms is not None and stats.ttft_ms <= latency_ms
+    assert stats.completion_tokens == 3
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_model_maps_rate_limit(live_client):
+    respx.post("https://openrouter.ai/api/v1/chat/completions").mock(
+        return_value=httpx.Response(429, json={"error": "rate"})
+    )
+
+    content, _, error, stats = await stream_model("hi", "gpt", "req-1")
+
+    assert content is None
+    assert error.type == "rate_limited"
+    assert stats.ttft_ms is None
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_stream_model_without_content_is_invalid(live_client):
+    respx.post("https://openrouter.ai/api/v1/chat/completions").mock(
+        return_value=httpx.Response(200, content=_sse("[DONE]"))
+    )
+
+    content, _, error, _ = await stream_model("hi", "gpt", "req-1")
+
+    assert content is None
+    assert error.type == "invalid_response"
+
+
+@pytest.mark.asyncio
+async def test_fetch_provider_result_streams_when_requested(monkeypatch):
+    captured = {}
+
+    async def fake_stream_model(prompt, model, request_id, system_preamble=None, provider_timeout_ms=None):
+        captured["streamed"] = True
+        return "out", 40, None, openrouter.StreamStats(ttft_ms=10, completion_tokens=6, tokens_per_second=200.0)
+
+    monkeypatch.setattr("src.adapters.providers.openrouter.stream_model", fake_stream_model)
+    openrouter.register_default_openrouter()
+
+    result = await fetch_provider_result(
+        "prompt", "model-x", "req-1", normalize_output=False, preamble_key=None, stream=True
+    )
+
+    assert captured["streamed"] is True
+    contract = result.to_contract()
+    assert contract.ttft_ms == 10
+    assert contract.completion_tokens == 6
+    assert contract.tokens_per_second == 200.0
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_streams_when_the_request_asks(monkeypatch):
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    monkeypatch.setattr("src.contracts.request.get_settings", lambda: DummySettings())
+    calls = []
+
+    async def fake_stream_model(prompt, model, request_id, **kwargs):
+        calls.append(("stream", model))
+        return "out", 40, None, openrouter.StreamStats(ttft_ms=10, completion_tokens=6, tokens_per_second=200.0)
+
+    async def fake_call_model(prompt, model, request_id, **kwargs):
+        calls.append(("plain", model))
+        return "out", 40, None
+
+    monkeypatch.setattr("src.adapters.providers.openrouter.stream_model", fake_stream_model)
+    monkeypatch.setattr("src.adapters.providers.openrouter.call_model", fake_call_model)
+    openrouter.register_default_openrouter()
+
+    result = await Orchestrator().run(ConsensusRequest(prompt="hi", models=["m1", "m2"], stream=True), "req-1")
+
+    assert sorted(calls) == [("stream", "m1"), ("stream", "m2")]
+    assert [r.ttft_ms for r in result.responses] == [10, 10]
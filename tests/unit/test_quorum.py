@@ -0,0 +1,110 @@
+import asyncio
+
+import pytest
+
+from src.adapters.orchestration.latency import get_latency_tracker
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.contracts.quorum import QuorumConfig
+from src.contracts.request import ConsensusRequest
+from src.contracts.response import ModelResponse
+from src.core.consensus.quorum import quorum_decision
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy
+
+
+class DummySettings:
+    def __init__(self):
+        self.max_prompt_chars = 1000
+        self.max_models = 5
+        self.e2e_timeout_ms = 5000
+        self.provider_timeout_ms = 5000
+        self.default_models = ["m1", "m2", "m3"]
+
+
+@pytest.fixture(autouse=True)
+def reset_tracker():
+    get_latency_tracker().reset()
+    yield
+    get_latency_tracker().reset()
+
+
+def test_quorum_decision_requires_k_agreeing_successes():
+    cfg = QuorumConfig(enabled=True, k=2, similarity_threshold=0.9)
+    same = "the answer is forty two"
+    responses = [
+        ModelResponse(model="m1", content=same),
+        ModelResponse(model="m2", content="something entirely unrelated about cats"),
+    ]
+    assert not quorum_decision(responses, cfg).reached
+
+    responses.append(ModelResponse(model="m3", content=same))
+    decision = quorum_decision(responses, cfg)
+    assert decision.reached
+    assert sorted(decision.agreeing) == ["m1", "m3"]
+
+    assert quorum_decision(responses, cfg, confidence=0.1).reached
+    strict = QuorumConfig(enabled=True, k=2, similarity_threshold=0.9, confidence_threshold=0.5)
+    assert not quorum_decision(responses, strict, confidence=0.1).reached
+
+
+def test_request_rejects_quorum_larger_than_models(monkeypatch):
+    monkeypatch.setattr("src.contracts.request.get_settings", lambda: DummySettings())
+    with pytest.raises(ValueError):
+        ConsensusRequest(prompt="hi", models=["m1"], quorum={"enabled": True, "k": 2})
+
+
+@pytest.mark.asyncio
+async def test_run_returns_on_quorum_and_cancels_stragglers(monkeypatch):
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    monkeypatch.setattr("src.contracts.request.get_settings", lambda: DummySettings())
+    cancelled = []
+
+    async def fake_fetch(prompt, model, *args, **kwargs):
+        if model == "slow":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(model)
+                raise
+        return ProviderResult(model=model, content="the answer is forty two", latency_ms=1, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    for _ in range(5):
+        get_latency_tracker().observe("slow", 2000)
+    policy = Policy.model_validate({"policy_id": "p"})
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+    request = ConsensusRequest(prompt="hi", models=["m1", "slow", "m2"], quorum={"enabled": True, "k": 2})
+
+    result = await asyncio.wait_for(orch.run(request, "req-1"), timeout=2)
+
+    assert cancelled == ["slow"]
+    assert [r.model for r in result.responses] == ["m1", "m2"]
+    assert result.quorum.reached
+    assert result.quorum.cancelled == ["slow"]
+    assert result.quorum.time_saved_ms is not None and result.quorum.time_saved_ms > 1000
+
+
+@pytest.mark.asyncio
+async def test_cancelled_provider_task_is_recorded_as_timeout(monkeypatch):
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    monkeypatch.setattr("src.contracts.request.get_settings", lambda: DummySettings())
+
+    async def fake_fetch(prompt, model, *args, **kwargs):
+        if model == "gone":
+            # Something outside the orchestrator cancels this provider call.
+            asyncio.current_task().cancel()
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+        return ProviderResult(model=model, content="the answer is forty two", latency_ms=1, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    policy = Policy.model_validate({"policy_id": "p"})
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+    request = ConsensusRequest(prompt="hi", models=["m1", "gone", "m2"], quorum={"enabled": True, "k": 2})
+
+    result = await asyncio.wait_for(orch.run(request, "req-1"), timeout=2)
+
+    gone = next(r for r in result.responses if r.model == "gone")
+    assert gone.error is not None and gone.error.type == "timeout"
+    assert result.quorum.reached
@@ -0,0 +1,124 @@
+import pytest
+
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.adapters.providers.ratelimit import CLIENT_RATE_LIMITED, RateLimiter, get_rate_limiter
+from src.contracts.errors import ErrorEnvelope
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy, RateLimitConfig
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def reset_limiter():
+    get_rate_limiter().reset()
+    yield
+    get_rate_limiter().reset()
+
+
+def _config(**overrides) -> RateLimitConfig:
+    data = {"enabled": True, "providers": {"openrouter": {"requests_per_second": 2, "burst": 2}}}
+    data.update(overrides)
+    return RateLimitConfig.model_validate(data)
+
+
+def test_requests_bucket_queues_then_rejects_beyond_max_wait():
+    clock = _Clock()
+    limiter = RateLimiter(clock=clock)
+    cfg = _config()
+
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=0, max_wait_s=1) == 0
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=0, max_wait_s=1) == 0
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=0, max_wait_s=1) == pytest.approx(0.5)
+    # The rejected reservation takes nothing.
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=0, max_wait_s=0.5) is None
+    clock.now = 1.0
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=0, max_wait_s=0) == 0
+    # Unconfigured providers are not limited.
+    assert limiter.reserve("other", "m1", cfg, tokens=0, max_wait_s=0) == 0
+
+
+def test_tokens_bucket_is_per_model_and_charged_after_the_call():
+    clock = _Clock()
+    limiter = RateLimiter(clock=clock)
+    cfg = _config(providers={}, models={"m1": {"tokens_per_minute": 600}})
+
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=400, max_wait_s=0) == 0
+    limiter.debit("openrouter", "m1", cfg, tokens=200)
+    # 600 spent, refill is 10 tokens/s.
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=100, max_wait_s=60) == pytest.approx(10)
+    assert limiter.reserve("openrouter", "m2", cfg, tokens=10_000, max_wait_s=0) == 0
+
+
+def test_throttle_pauses_provider_and_cuts_rate_until_recovery():
+    clock = _Clock()
+    limiter = RateLimiter(clock=clock)
+    cfg = _config(providers={"openrouter": {"requests_per_second": 10, "burst": 1}}, recovery_s=10)
+
+    limiter.throttle("openrouter", "m1", cfg, retry_after_ms=2000)
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=0, max_wait_s=1) is None
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=0, max_wait_s=2) == pytest.approx(2)
+    clock.now = 2.0
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=0, max_wait_s=5) == 0
+    # Rate was halved to 5/s and has recovered to 7/s, still below the configured 10/s.
+    assert limiter.reserve("openrouter", "m1", cfg, tokens=0, max_wait_s=5) == pytest.approx(1 / 7)
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_rejects_locally_without_breaker_failure(monkeypatch):
+    policy = Policy.model_validate(
+        {
+            "policy_id": "p",
+            "rate_limits": {
+                "enabled": True,
+                "max_wait_ms": 0,
+                "models": {"m1": {"requests_per_second": 0.001, "burst": 1}},
+            },
+            "breaker": {"enabled": True, "failure_threshold": 1},
+        }
+    )
+    calls = []
+
+    async def fake_fetch(*args, **kwargs):
+        calls.append(1)
+        return ProviderResult(model="m1", content="ok", latency_ms=1, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+
+    first = await orch._call_single_model("hi", "m1", "req-1", False)
+    second = await orch._call_single_model("hi", "m1", "req-2", False)
+
+    assert first.error is None
+    assert len(calls) == 1
+    assert second.error.type == "rate_limited"
+    assert second.error.message == CLIENT_RATE_LIMITED
+    assert second.breaker_state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_throttles_on_provider_429(monkeypatch):
+    policy = Policy.model_validate({"policy_id": "p", "rate_limits": {"enabled": True, "max_wait_ms": 0}})
+
+    async def fake_fetch(*args, **kwargs):
+        return ProviderResult(
+            model="m1",
+            content=None,
+            latency_ms=1,
+            error=ErrorEnvelope(type="rate_limited", message="429", retryable=True, retry_after_ms=5000),
+        )
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+
+    await orch._call_single_model("hi", "m1", "req-1", False)
+    blocked = await orch._call_single_model("hi", "m1", "req-2", False)
+
+    assert blocked.error.message == CLIENT_RATE_LIMITED
@@ -0,0 +1,94 @@
+import pytest
+
+from src.adapters.orchestration.cache import ResponseCache, cache_key, get_response_cache
+from src.adapters.orchestration.models import ProviderResult, build_model_responses
+from src.adapters.orchestration.orchestrator import Orchestrator, _compute_latency_summary
+from src.contracts.errors import ErrorEnvelope
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _ok(content: str = "ok", latency_ms: int = 40) -> ProviderResult:
+    return ProviderResult(model="m1", content=content, latency_ms=latency_ms, error=None)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    get_response_cache().clear()
+    yield
+    get_response_cache().clear()
+
+
+def test_cache_key_covers_call_fingerprint():
+    base = cache_key("openrouter", "m1", "pre", "prompt", {"seed": 1})
+
+    assert base == cache_key("openrouter", "m1", "pre", "prompt", {"seed": 1})
+    assert base != cache_key("other", "m1", "pre", "prompt", {"seed": 1})
+    assert base != cache_key("openrouter", "m1", None, "prompt", {"seed": 1})
+    assert base != cache_key("openrouter", "m1", "pre", "prompt", {"seed": 2})
+
+
+def test_cache_expires_and_evicts_least_recently_used():
+    clock = _Clock()
+    cache = ResponseCache(max_bytes=700, clock=clock)
+
+    assert cache.put("a", _ok("a" * 10), ttl_s=10)
+    assert cache.put("b", _ok("b" * 10), ttl_s=10)
+    assert cache.get("a").cached is True
+    assert cache.put("c", _ok("c" * 10), ttl_s=10)
+
+    assert cache.get("b") is None  # least recently used
+    assert cache.get("a") is not None
+    assert cache.size_bytes <= 700
+
+    clock.now = 11
+    assert cache.get("a") is None
+    failed = ProviderResult(
+        model="m1", content=None, latency_ms=1, error=ErrorEnvelope(type="timeout", message="x")
+    )
+    assert not cache.put("err", failed, ttl_s=10)
+
+
+def test_cached_responses_are_left_out_of_latency_stats():
+    fresh = _ok(latency_ms=100)
+    hit = _ok(latency_ms=0)
+    hit.cached = True
+
+    summary = _compute_latency_summary(build_model_responses(["m1", "m2"], [fresh, hit]))
+
+    assert summary.min_ms == 100
+    assert summary.avg_ms == 100
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_serves_repeat_calls_from_cache(monkeypatch):
+    policy = Policy.model_validate({"policy_id": "p", "cache": {"enabled": True, "ttl_s": 60}})
+    calls = []
+
+    async def fake_fetch(*args, **kwargs):
+        calls.append(kwargs.get("prompt", args[0] if args else None))
+        return _ok("answer")
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+
+    first = await orch._call_single_model("hi", "m1", "req-1", False, seed=3)
+    second = await orch._call_single_model("hi", "m1", "req-2", False, seed=3)
+    bypassed = await orch._call_single_model("hi", "m1", "req-3", False, seed=3, cache_bypass=True)
+    other_seed = await orch._call_single_model("hi", "m1", "req-4", False, seed=4)
+
+    assert len(calls) == 3
+    assert first.cached is False
+    assert second.cached is True
+    assert second.content == "answer"
+    assert second.to_contract().cached is True
+    assert bypassed.cached is False
+    assert other_seed.cached is False
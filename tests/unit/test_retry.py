@@ -0,0 +1,149 @@
+import pytest
+
+from src.adapters.orchestration.latency import get_latency_tracker
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.adapters.orchestration.retry import backoff_delay_ms, call_with_retries
+from src.adapters.providers.openrouter import parse_retry_after_ms
+from src.contracts.errors import ErrorEnvelope
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy, RetryConfig
+
+
+def _ok() -> ProviderResult:
+    return ProviderResult(model="m1", content="ok", latency_ms=1, error=None)
+
+
+def _err(error_type: str = "http_error", retryable: bool = True, retry_after_ms: int | None = None):
+    return ProviderResult(
+        model="m1",
+        content=None,
+        latency_ms=1,
+        error=ErrorEnvelope(
+            type=error_type, message="x", retryable=retryable, retry_after_ms=retry_after_ms
+        ),
+    )
+
+
+class _Sequence:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.timeouts = []
+
+    async def __call__(self, timeout_ms):
+        self.timeouts.append(timeout_ms)
+        return self.results.pop(0)
+
+
+async def _no_sleep(seconds):
+    _no_sleep.slept.append(seconds)
+
+
+@pytest.fixture(autouse=True)
+def reset_sleeps():
+    _no_sleep.slept = []
+    get_latency_tracker().reset()
+
+
+def test_backoff_is_full_jitter_capped_exponential():
+    cfg = RetryConfig(enabled=True, base_delay_ms=100, max_delay_ms=300)
+
+    assert backoff_delay_ms(1, cfg, rand=lambda: 0.999) == 99
+    assert backoff_delay_ms(2, cfg, rand=lambda: 0.5) == 100
+    assert backoff_delay_ms(5, cfg, rand=lambda: 0.999) == 299
+    assert backoff_delay_ms(3, cfg, rand=lambda: 0.0) == 0
+
+
+def test_parse_retry_after_ms_accepts_seconds_and_dates():
+    assert parse_retry_after_ms("2") == 2000
+    assert parse_retry_after_ms("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after_ms("soon") is None
+    assert parse_retry_after_ms(None) is None
+
+
+@pytest.mark.asyncio
+async def test_retries_until_success_and_counts_attempts():
+    call = _Sequence(_err(), _err("timeout"), _ok())
+    cfg = RetryConfig(enabled=True, max_attempts=3)
+
+    result = await call_with_retries(
+        call, cfg, provider_timeout_ms=1000, sleep=_no_sleep, rand=lambda: 0.5
+    )
+
+    assert result.content == "ok"
+    assert result.attempts == 3
+    assert len(_no_sleep.slept) == 2
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_or_unlisted_errors_are_not_retried():
+    cfg = RetryConfig(enabled=True, retry_on=["timeout"])
+
+    for failure in (_err(retryable=False), _err("http_error")):
+        call = _Sequence(failure, _ok())
+        result = await call_with_retries(call, cfg, provider_timeout_ms=1000, sleep=_no_sleep)
+        assert result.error is not None
+        assert result.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_after_raises_delay_and_deadline_stops_retries():
+    give_ups = []
+    cfg = RetryConfig(enabled=True, max_attempts=5, min_attempt_ms=250)
+    call = _Sequence(_err("rate_limited", retry_after_ms=400), _err("rate_limited", retry_after_ms=400))
+    now = iter([0.0, 0.5])
+
+    result = await call_with_retries(
+        call,
+        cfg,
+        provider_timeout_ms=10_000,
+        deadline_at=1.0,
+        on_give_up=lambda error, reason: give_ups.append(reason),
+        clock=lambda: next(now),
+        sleep=_no_sleep,
+        rand=lambda: 0.0,
+    )
+
+    # 1000ms budget - 400ms Retry-After leaves 600ms: one retry, clamped to the remaining budget.
+    # After 500ms only 100ms would remain past the next Retry-After, below min_attempt_ms.
+    assert call.timeouts == [10_000, 600]
+    assert _no_sleep.slept == [0.4]
+    assert result.attempts == 2
+    assert give_ups == ["deadline"]
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_retries_and_records_breaker_once(monkeypatch):
+    policy = Policy.model_validate(
+        {
+            "policy_id": "p",
+            "retries": {"enabled": True, "max_attempts": 2, "base_delay_ms": 0},
+            "breaker": {"enabled": True, "failure_threshold": 1},
+        }
+    )
+    attempts = []
+
+    async def fake_fetch(*args, **kwargs):
+        attempts.append(1)
+        if len(attempts) == 1:
+            return _err()
+        return _ok()
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+    failures = []
+    original = orch.breakers.record_failure
+
+    async def tracking_failure(model):
+        failures.append(model)
+        return await original(model)
+
+    orch.breakers.record_failure = tracking_failure
+
+    result = await orch._call_single_model("hi", "m1", "req-1", False)
+
+    assert len(attempts) == 2
+    assert failures == []
+    assert result.breaker_state == "closed"
+    assert result.to_contract().attempts == 2
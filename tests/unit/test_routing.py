@@ -0,0 +1,149 @@
+import pytest
+
+from src.adapters.orchestration.breaker import BreakerManager
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.adapters.providers import registry
+from src.adapters.providers.openrouter import register_default_openrouter
+from src.adapters.providers.routing import get_routing_table
+from src.contracts.request import ConsensusRequest
+from src.contracts.errors import ErrorEnvelope
+from src.errors import LcsError
+from src.policy.loader import PolicyStore
+from src.policy.models import BreakerConfig, Policy
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    registry.clear_registry()
+    register_default_openrouter()
+    yield
+    registry.clear_registry()
+    register_default_openrouter()
+
+
+class EchoProvider:
+    name = "echo"
+
+    def __init__(self):
+        self.supports_calls = 0
+
+    def supports(self, model: str) -> bool:
+        self.supports_calls += 1
+        return True
+
+    async def call(self, *args, **kwargs):
+        return ProviderResult(model="m", content=None, latency_ms=0, error=None)
+
+
+def test_routing_table_memoises_resolution():
+    provider = EchoProvider()
+    registry.register_provider(provider)
+    table = get_routing_table({"m1": "echo"})
+
+    first = table.resolve("m1")
+    second = table.resolve("m1")
+
+    assert first is second
+    assert first.provider_name == "echo"
+    assert first.stripped_model == "m1"
+    assert provider.supports_calls == 1
+    assert get_routing_table({"m1": "echo"}) is table
+
+
+def test_routing_table_rebuilt_when_registry_changes():
+    table = get_routing_table()
+    with pytest.raises(LcsError):
+        table.resolve("echo::m1")
+
+    registry.register_provider(EchoProvider())
+    rebuilt = get_routing_table()
+
+    assert rebuilt is not table
+    assert rebuilt.resolve("echo::m1").stripped_model == "m1"
+
+
+class DummySettings:
+    def __init__(self):
+        self.max_prompt_chars = 1000
+        self.max_models = 5
+        self.e2e_timeout_ms = 5000
+        self.provider_timeout_ms = 1000
+        self.default_models = ["m1", "m2", "m3"]
+
+
+def _orchestrator(policy: Policy, breakers: BreakerManager | None = None) -> Orchestrator:
+    return Orchestrator(
+        policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy), breakers=breakers
+    )
+
+
+@pytest.mark.asyncio
+async def test_breaker_open_primary_falls_back(monkeypatch):
+    policy = Policy.model_validate({"policy_id": "p", "routing": {"fallbacks": {"m1": ["m2", "m3"]}}})
+    calls = []
+
+    async def fake_fetch(prompt, model, *args, **kwargs):
+        calls.append(model)
+        return ProviderResult(model=model, content=f"from {model}", latency_ms=5, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    breakers = BreakerManager(BreakerConfig(failure_threshold=1, open_ms=60000))
+    await breakers.record_failure("m1")
+    orch = _orchestrator(policy, breakers)
+
+    result = await orch._call_single_model("hi", "m1", "req-1", False, request_models=["m1", "m2"])
+
+    assert calls == ["m3"]
+    assert result.model == "m3"
+    assert result.fallback_for == "m1"
+    assert result.to_contract().fallback_for == "m1"
+
+
+@pytest.mark.asyncio
+async def test_primaries_sharing_a_chain_never_take_the_same_fallback(monkeypatch):
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    monkeypatch.setattr("src.contracts.request.get_settings", lambda: DummySettings())
+    chain = ["devstral", "m4"]
+    policy = Policy.model_validate(
+        {
+            "policy_id": "p",
+            "routing": {"fallbacks": {"m1": chain, "m2": chain}},
+            "breaker": {"failure_threshold": 1, "open_ms": 60000},
+        }
+    )
+
+    async def fake_fetch(prompt, model, *args, **kwargs):
+        return ProviderResult(model=model, content=f"from {model}", latency_ms=5, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    breakers = BreakerManager(policy.breaker)
+    await breakers.record_failure("m1")
+    await breakers.record_failure("m2")
+    orch = _orchestrator(policy, breakers)
+
+    result = await orch.run(ConsensusRequest(prompt="hi", models=["m1", "m2", "m3"]), "req-1")
+
+    fallbacks = {r.fallback_for: r.model for r in result.responses if r.fallback_for}
+    assert set(fallbacks) == {"m1", "m2"}
+    assert sorted(fallbacks.values()) == ["devstral", "m4"]
+
+
+@pytest.mark.asyncio
+async def test_other_errors_do_not_fall_back(monkeypatch):
+    policy = Policy.model_validate({"policy_id": "p", "routing": {"fallbacks": {"m1": ["m2"]}}})
+    calls = []
+
+    async def fake_fetch(prompt, model, *args, **kwargs):
+        calls.append(model)
+        error = ErrorEnvelope(type="http_error", message="bad request", retryable=False, status_code=400)
+        return ProviderResult(model=model, content=None, latency_ms=5, error=error)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    orch = _orchestrator(policy)
+
+    result = await orch._call_single_model("hi", "m1", "req-1", False)
+
+    assert calls == ["m1"]
+    assert result.error is not None
+    assert result.fallback_for is None
@@ -95,3 +95,15 @@ def test_extract_code_from_json_decodes_escapes():
     assert scores[0].error is False
     assert stats.count == 1
     assert scores[0].score > 0.0
+
+
+def test_analyzers_run_separately_reduce_to_the_same_detail():
+    from src.core.scoring.engine import ANALYZERS, assemble_detail, run_analyzer, scorable_code, score_response
+
+    response = ModelResponse(model="m1", content="def add(a, b):\n    return a + b\n", latency_ms=10)
+    code = scorable_code(response)
+
+    detail = assemble_detail(response, {name: run_analyzer(name, code) for name in ANALYZERS})
+
+    assert detail == score_response(response)
+    assert scorable_code(ModelResponse(model="m2", content="def broken(:", latency_ms=10)) is None
@@ -0,0 +1,172 @@
+import time
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from src.adapters.observability.metrics import (
+    scoring_analyzer_seconds,
+    scoring_pool_fallbacks_total,
+    scoring_queue_wait_seconds,
+)
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.adapters.orchestration.scoring_pool import ScoringPool, get_scoring_pool
+from src.contracts.request import ConsensusRequest
+from src.contracts.response import ModelResponse
+from src.core.scoring import compute_scores
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy, ScoringPoolConfig
+
+CODE = '''"""Module."""
+
+
+def add(a: int, b: int) -> int:
+    """Return the sum."""
+    return a + b
+'''
+
+
+class DummySettings:
+    def __init__(self):
+        self.max_prompt_chars = 1000
+        self.max_models = 5
+        self.e2e_timeout_ms = 30000
+        self.provider_timeout_ms = 5000
+        self.default_models = ["m1", "m2"]
+
+
+@pytest.fixture(autouse=True)
+def reset_pool():
+    get_scoring_pool().reset()
+    yield
+    get_scoring_pool().reset()
+
+
+def _sample(metric, name, **labels):
+    value = metric.collect()[0]
+    for sample in value.samples:
+        if sample.name == name and all(sample.labels.get(k) == v for k, v in labels.items()):
+            return sample.value
+    return 0.0
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_scores_in_worker_processes(monkeypatch):
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.get_settings", lambda: DummySettings())
+    monkeypatch.setattr("src.contracts.request.get_settings", lambda: DummySettings())
+
+    async def fake_fetch(prompt, model, *args, **kwargs):
+        return ProviderResult(model=model, content=CODE if model == "m1" else "not python (", latency_ms=5, error=None)
+
+    def fail_inline(responses):
+        raise AssertionError("scoring must not run on the event loop")
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.compute_scores", fail_inline)
+    policy = Policy.model_validate({"policy_id": "p", "scoring": {"enabled": True, "workers": 1, "timeout_ms": 20000}})
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+    waits_before = _sample(scoring_queue_wait_seconds, "scoring_queue_wait_seconds_count")
+
+    result = await orch.run(ConsensusRequest(prompt="hi", models=["m1", "m2"], include_scores=True), "req-1")
+
+    expected, _ = compute_scores(result.responses)
+    assert [s.model_dump() for s in result.scores] == [s.model_dump() for s in expected]
+    assert result.scores[1].error
+    assert _sample(scoring_queue_wait_seconds, "scoring_queue_wait_seconds_count") == waits_before + 2
+
+
+@pytest.mark.asyncio
+async def test_response_past_timeout_is_scored_as_error():
+    # A cold pool cannot start a worker, import the analyzers and score within 1 ms.
+    pool = ScoringPool()
+    config = ScoringPoolConfig(enabled=True, workers=1, timeout_ms=1)
+    try:
+        scores, stats = await pool.score([ModelResponse(model="m1", content=CODE, latency_ms=5)], config)
+    finally:
+        pool.reset()
+
+    assert scores[0].error and scores[0].metadata == {"scoring_timeout": True}
+    assert stats.count == 0
+
+
+@pytest.mark.asyncio
+async def test_broken_pool_falls_back_to_in_process_scoring(monkeypatch):
+    pool = ScoringPool()
+
+    def broken(config):
+        raise BrokenProcessPool("worker died")
+
+    monkeypatch.setattr(pool, "_pool", broken)
+    responses = [ModelResponse(model="m1", content=CODE, latency_ms=5)]
+    before = _sample(scoring_pool_fallbacks_total, "scoring_pool_fallbacks_total", reason="broken")
+
+    scores, stats = await pool.score(responses, ScoringPoolConfig(enabled=True))
+
+    assert scores == compute_scores(responses)[0]
+    assert stats.count == 1
+    assert _sample(scoring_pool_fallbacks_total, "scoring_pool_fallbacks_total", reason="broken") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_analyzer_error_is_scored_as_error_without_inline_rerun(monkeypatch):
+    pool = ScoringPool()
+
+    async def failing(response, config):
+        raise ValueError("analyzer blew up")
+
+    def fail_inline(response):
+        raise AssertionError("analyzer errors must not be re-run in-process")
+
+    monkeypatch.setattr(pool, "_in_pool", failing)
+    monkeypatch.setattr("src.adapters.orchestration.scoring_pool.score_response", fail_inline)
+
+    responses = [ModelResponse(model="m1", content=CODE, latency_ms=5)]
+
+    scores, _ = await pool.score(responses, ScoringPoolConfig(enabled=True))
+
+    assert scores[0].error and scores[0].metadata == {"scoring_error": "ValueError"}
+
+
+@pytest.mark.asyncio
+async def test_inline_fallback_is_bounded_by_the_timeout(monkeypatch):
+    pool = ScoringPool()
+
+    def broken(config):
+        raise BrokenProcessPool("worker died")
+
+    def slow_inline(response):
+        time.sleep(0.5)
+        raise AssertionError("should have timed out")
+
+    monkeypatch.setattr(pool, "_pool", broken)
+    monkeypatch.setattr("src.adapters.orchestration.scoring_pool.score_response", slow_inline)
+    config = ScoringPoolConfig(enabled=True, timeout_ms=50)
+
+    scores, _ = await pool.score([ModelResponse(model="m1", content=CODE, latency_ms=5)], config)
+
+    assert scores[0].error and scores[0].metadata == {"scoring_timeout": True}
+
+
+@pytest.mark.asyncio
+async def test_fanned_out_analyzers_reduce_to_one_detail_per_response(monkeypatch):
+    pool = ScoringPool()
+    config = ScoringPoolConfig(enabled=True, workers=2, fan_out_analyzers=True, timeout_ms=20000)
+    responses = [
+        ModelResponse(model="m1", content=CODE, latency_ms=5),
+        ModelResponse(model="m2", content="not python (", latency_ms=5),
+    ]
+    before = _sample(scoring_analyzer_seconds, "scoring_analyzer_seconds_count", analyzer="security")
+    expected, expected_stats = compute_scores(responses)
+
+    def parse_on_loop(response):
+        raise AssertionError("code must be extracted and parsed in a worker")
+
+    monkeypatch.setattr("src.core.scoring.engine._parse", parse_on_loop)
+    try:
+        scores, stats = await pool.score(responses, config)
+    finally:
+        pool.reset()
+
+    assert [s.model_dump() for s in scores] == [s.model_dump() for s in expected]
+    assert stats == expected_stats
+    assert _sample(scoring_analyzer_seconds, "scoring_analyzer_seconds_count", analyzer="security") == before + 1
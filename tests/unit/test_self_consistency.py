@@ -88,3 +88,63 @@ async def test_provider_exception_records_error():
     assert result.responses[0].error is not None
     assert result.stop_reason in {"max_samples", "no_winner"}
 
+
+
+@pytest.mark.asyncio
+async def test_parallel_window_caps_in_flight_samples():
+    in_flight = 0
+    peak = 0
+    contents = iter(range(100))
+
+    async def fetch(*args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return _make_provider_result(content=f"answer-{next(contents)}")
+
+    config = SelfConsistencyConfig(min_samples=1, max_samples=7, threshold=0.99, parallelism=3)
+    result = await run_self_consistency(
+        prompt="hello",
+        model="m1",
+        request_id="req-5",
+        fetch_fn=fetch,
+        config=config,
+    )
+
+    assert peak == 3
+    assert result.samples_used == 7
+
+
+@pytest.mark.asyncio
+async def test_threshold_cancels_outstanding_samples():
+    calls = 0
+    cancelled = 0
+
+    async def fetch(*args, **kwargs):
+        nonlocal calls, cancelled
+        calls += 1
+        if calls > 2:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled += 1
+                raise
+        return _make_provider_result(content="same")
+
+    config = SelfConsistencyConfig(min_samples=2, max_samples=6, threshold=0.6, parallelism=4)
+    result = await asyncio.wait_for(
+        run_self_consistency(
+            prompt="hello",
+            model="m1",
+            request_id="req-6",
+            fetch_fn=fetch,
+            config=config,
+        ),
+        timeout=2,
+    )
+
+    assert result.stop_reason == "threshold"
+    assert result.samples_used == 2
+    assert cancelled == 2
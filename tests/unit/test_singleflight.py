@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from src.adapters.orchestration.models import ProviderResult
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.adapters.orchestration.singleflight import SingleFlight
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_flight():
+    flight = SingleFlight()
+    calls = []
+
+    async def call():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(flight.do("k", call) for _ in range(3)))
+
+    assert len(calls) == 1
+    assert [value for value, _ in results] == ["value"] * 3
+    assert sorted(shared for _, shared in results) == [False, True, True]
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_shared_call_survives_until_last_waiter_is_cancelled():
+    flight = SingleFlight()
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def call():
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    first = asyncio.ensure_future(flight.do("k", call))
+    second = asyncio.ensure_future(flight.do("k", call))
+    await started.wait()
+
+    first.cancel()
+    await asyncio.gather(first, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert not cancelled.is_set()
+
+    second.cancel()
+    await asyncio.gather(second, return_exceptions=True)
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+    assert flight.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_coalesces_identical_calls(monkeypatch):
+    policy = Policy.model_validate({"policy_id": "p", "single_flight": {"enabled": True}})
+    calls = []
+
+    async def fake_fetch(*args, **kwargs):
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return ProviderResult(model="m1", content="ok", latency_ms=10, error=None)
+
+    monkeypatch.setattr("src.adapters.orchestration.orchestrator.fetch_provider_result", fake_fetch)
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+
+    first, second, other = await asyncio.gather(
+        orch._call_single_model("hi", "m1", "req-1", False),
+        orch._call_single_model("hi", "m1", "req-2", False),
+        orch._call_single_model("other prompt", "m1", "req-3", False),
+    )
+
+    assert len(calls) == 2
+    assert first.content == second.content == "ok"
+    assert first is not second
+    assert other.content == "ok"
@@ -0,0 +1,124 @@
+import json
+
+import httpx
+import pytest
+
+from src.adapters.orchestration.orchestrator import Orchestrator
+from src.adapters.providers import openrouter
+from src.adapters.providers.openrouter import call_model, stream_model
+from src.adapters.providers.standin import StandInConfig, StandInProvider
+from src.contracts.request import ConsensusRequest
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy
+
+
+def _config(**models) -> StandInConfig:
+    return StandInConfig.model_validate({"seed": 7, "models": models})
+
+
+@pytest.fixture
+async def installed():
+    providers = []
+
+    async def install(config: StandInConfig) -> StandInProvider:
+        provider = StandInProvider(config)
+        await provider.install()
+        providers.append(provider)
+        return provider
+
+    yield install
+    await StandInProvider.uninstall()
+
+
+def test_latency_distributions_are_seeded_and_shaped():
+    config = _config(
+        fast={"latency": {"distribution": "fixed", "median_ms": 40}},
+        tail={
+            "latency": {
+                "distribution": "bimodal",
+                "median_ms": 50,
+                "sigma": 0.0,
+                "slow_median_ms": 900,
+                "slow_fraction": 0.5,
+            }
+        },
+    )
+    a, b = StandInProvider(config), StandInProvider(config)
+
+    samples = [a.sample_latency_ms("tail") for _ in range(200)]
+
+    assert samples == [b.sample_latency_ms("tail") for _ in range(200)]
+    assert set(round(s) for s in samples) == {50, 900}
+    assert a.sample_latency_ms("fast") == 40
+
+
+@pytest.mark.asyncio
+async def test_call_model_against_standin_maps_success_429_and_timeouts(installed):
+    await installed(
+        _config(
+            ok={"latency": {"distribution": "fixed", "median_ms": 1}, "content": "canned"},
+            limited={"rate_limit_rate": 1.0, "retry_after_s": 2},
+            slow={"latency": {"distribution": "fixed", "median_ms": 5000}},
+        )
+    )
+
+    content, _, error = await call_model("hi", "ok", "req-1")
+    assert (content, error) == ("canned", None)
+
+    _, _, error = await call_model("hi", "limited", "req-2")
+    assert error.type == "rate_limited"
+    assert error.retry_after_ms == 2000
+
+    _, _, error = await call_model("hi", "slow", "req-3", provider_timeout_ms=20)
+    assert error.type == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_stream_model_against_standin_reports_ttft(installed):
+    await installed(_config(m={"latency": {"distribution": "fixed", "median_ms": 30}, "content": "x" * 40}))
+
+    content, latency_ms, error, stats = await stream_model("hi", "m", "req-1")
+
+    assert error is None
+    assert content == "x" * 40
+    assert stats.ttft_ms is not None and stats.ttft_ms < latency_ms
+    assert stats.completion_tokens == 10
+
+
+@pytest.mark.asyncio
+async def test_orchestrator_run_offline_with_failing_model(installed):
+    provider = await installed(
+        _config(
+            good={"latency": {"distribution": "fixed", "median_ms": 1}},
+            bad={"latency": {"distribution": "fixed", "median_ms": 1}, "error_rate": 1.0},
+        )
+    )
+    openrouter.register_default_openrouter()
+    policy = Policy.model_validate({"policy_id": "p"})
+    orch = Orchestrator(policy_store=PolicyStore(loader=lambda path=None: policy, policy=policy))
+
+    result = await orch.run(ConsensusRequest(prompt="2+2?", models=["good", "bad"]), "req-1")
+
+    by_model = {r.model: r for r in result.responses}
+    assert by_model["good"].content == "Stand-in answer from good: 2+2?"
+    assert by_model["bad"].error.type == "http_error"
+    assert provider.outcomes[("bad", "error")] == 1
+
+
+@pytest.mark.asyncio
+async def test_asgi_app_serves_chat_completions():
+    config = _config(m={"latency": {"distribution": "fixed", "median_ms": 0}, "content": "hello"})
+    app = StandInProvider(config).asgi_app()
+    messages = [{"role": "user", "content": "hi"}]
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://standin") as client:
+        response = await client.post("/api/v1/chat/completions", json={"model": "m", "messages": messages})
+        streamed = await client.post(
+            "/api/v1/chat/completions", json={"model": "m", "stream": True, "messages": messages}
+        )
+
+    assert response.json()["choices"][0]["message"]["content"] == "hello"
+    assert streamed.headers["content-type"] == "text/event-stream"
+    events = [line[len("data: "):] for line in streamed.text.splitlines() if line.startswith("data: ")]
+    assert json.loads(events[0])["choices"][0]["delta"]["content"] == "hello"
+    assert events[-1] == "[DONE]"
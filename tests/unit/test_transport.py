@@ -1,15 +1,16 @@
-import asyncio
-
+import httpx
 import pytest
 
 from src.adapters.providers import transport
 
 
 class DummyClient:
-    def __init__(self, base_url=None, timeout=None, headers=None):
+    def __init__(self, base_url=None, timeout=None, headers=None, limits=None, http2=False):
         self.base_url = base_url
         self.timeout = timeout
         self.headers = headers or {}
+        self.limits = limits
+        self.http2 = http2
         self.closed = False
 
     @property
@@ -21,6 +22,10 @@ class DummyClient:
         return None
 
 
+def _fake_httpx():
+    return type("X", (), {"AsyncClient": DummyClient, "Limits": httpx.Limits, "Timeout": httpx.Timeout})
+
+
 class DummySettings:
     def __init__(self, api_key=None):
         self.openrouter_base_url = "https://example.com"
@@ -29,8 +34,8 @@ class DummySettings:
 
 
 def test_get_client_sets_auth_header(monkeypatch):
-    monkeypatch.setattr(transport, "_client", None)
-    monkeypatch.setattr(transport, "httpx", type("X", (), {"AsyncClient": DummyClient}))
+    monkeypatch.setattr(transport, "_clients", {})
+    monkeypatch.setattr(transport, "httpx", _fake_httpx())
     monkeypatch.setattr(transport, "get_settings", lambda: DummySettings(api_key="secret"))
 
     client = transport.get_client()
@@ -45,14 +50,15 @@ async def test_close_client_handles_closed_loop(monkeypatch):
         async def aclose(self):
             raise RuntimeError("Event loop is closed")
 
-    monkeypatch.setattr(transport, "_client", RaisingClient())
+    monkeypatch.setattr(transport, "_clients", {"https://example.com": RaisingClient()})
     # Should not raise
     await transport.close_client()
-    assert transport._client is None
+    assert transport._clients == {}
 
 
 def test_get_client_recreates_if_closed(monkeypatch):
-    monkeypatch.setattr(transport, "httpx", type("X", (), {"AsyncClient": DummyClient}))
+    monkeypatch.setattr(transport, "_clients", {})
+    monkeypatch.setattr(transport, "httpx", _fake_httpx())
     monkeypatch.setattr(transport, "get_settings", lambda: DummySettings())
 
     first = transport.get_client()
@@ -61,59 +67,69 @@ def test_get_client_recreates_if_closed(monkeypatch):
     assert first is not second
 
 
-def test_get_client_recreates_closes_prior_without_loop(monkeypatch):
-    monkeypatch.setattr(transport, "httpx", type("X", (), {"AsyncClient": DummyClient}))
+def test_get_client_reuses_pool_across_timeouts(monkeypatch):
+    monkeypatch.setattr(transport, "httpx", _fake_httpx())
     monkeypatch.setattr(transport, "get_settings", lambda: DummySettings())
-    transport._client = DummyClient()
+    monkeypatch.setattr(transport, "_clients", {})
 
-    run_called = False
+    first = transport.get_client(timeout_ms=1234)
+    second = transport.get_client(timeout_ms=9999)
 
-    def fake_run(coro):
-        nonlocal run_called
-        run_called = True
-        return asyncio.run(coro)
+    assert first is second
+    assert first.closed is False
 
-    monkeypatch.setattr(transport.asyncio, "get_running_loop", lambda: (_ for _ in ()).throw(RuntimeError()))
-    monkeypatch.setattr(transport.asyncio, "run", fake_run)
 
-    new_client = transport.get_client(timeout_ms=1234)
+def test_get_client_keeps_one_pool_per_base_url(monkeypatch):
+    monkeypatch.setattr(transport, "httpx", _fake_httpx())
+    monkeypatch.setattr(transport, "get_settings", lambda: DummySettings())
+    monkeypatch.setattr(transport, "_clients", {})
 
-    assert run_called is True
-    assert transport._client is new_client
-    # prior client should have been closed by the async close path
-    assert isinstance(new_client, DummyClient)
+    default = transport.get_client()
+    other = transport.get_client(base_url="https://other.example.com")
 
+    assert default is not other
+    assert default.base_url == "https://example.com"
+    assert other.base_url == "https://other.example.com"
 
-def test_get_client_recreates_closes_prior_with_running_loop(monkeypatch):
-    monkeypatch.setattr(transport, "httpx", type("X", (), {"AsyncClient": DummyClient}))
-    monkeypatch.setattr(transport, "get_settings", lambda: DummySettings())
-    prior = DummyClient()
-    transport._client = prior
 
-    class DummyLoop:
-        def __init__(self):
-            self.tasks = []
+def test_get_client_applies_pool_limits(monkeypatch):
+    settings = DummySettings()
+    settings.http_max_connections = 7
+    settings.http_max_keepalive_connections = 3
+    settings.http_keepalive_expiry_s = 1.5
+    monkeypatch.setattr(transport, "httpx", _fake_httpx())
+    monkeypatch.setattr(transport, "get_settings", lambda: settings)
+    monkeypatch.setattr(transport, "_clients", {})
+
+    client = transport.get_client()
+
+    assert client.limits.max_connections == 7
+    assert client.limits.max_keepalive_connections == 3
+    assert client.limits.keepalive_expiry == 1.5
+    assert client.http2 is False
 
-        def create_task(self, coro):
-            # Run immediately to keep deterministic tests
-            asyncio.run(coro)
-            self.tasks.append(coro)
-            return coro
 
-    dummy_loop = DummyLoop()
-    monkeypatch.setattr(transport.asyncio, "get_running_loop", lambda: dummy_loop)
+def test_request_timeout_uses_override_or_settings(monkeypatch):
+    monkeypatch.setattr(transport, "get_settings", lambda: DummySettings())
+
+    assert transport.request_timeout(1500).read == 1.5
+    assert transport.request_timeout().read == 4.0
 
-    new_client = transport.get_client(timeout_ms=9999)
 
-    assert prior.closed is True
-    assert transport._client is new_client
-    assert dummy_loop.tasks, "close coroutine should have been scheduled"
+@pytest.mark.asyncio
+async def test_pooled_request_tracks_in_flight(monkeypatch):
+    monkeypatch.setattr(transport, "get_settings", lambda: DummySettings())
+    monkeypatch.setattr(transport, "_in_flight", {})
+
+    async with transport.pooled_request():
+        assert transport._in_flight["https://example.com"] == 1
+    assert transport._in_flight["https://example.com"] == 0
 
 
 def test_get_client_reuses_when_open(monkeypatch):
-    monkeypatch.setattr(transport, "httpx", type("X", (), {"AsyncClient": DummyClient}))
+    monkeypatch.setattr(transport, "httpx", _fake_httpx())
     monkeypatch.setattr(transport, "get_settings", lambda: DummySettings())
-    transport._client = None
+    monkeypatch.setattr(transport, "_clients", {})
 
     first = transport.get_client()
     second = transport.get_client()
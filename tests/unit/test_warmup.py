@@ -0,0 +1,111 @@
+import gc
+
+import pytest
+
+from src.adapters.orchestration.warmup import warm_up
+from src.adapters.providers import registry
+from src.adapters.providers import openrouter
+from src.adapters.providers.openrouter import register_default_openrouter
+from src.client import LcsClient
+from src.policy.loader import PolicyStore
+from src.policy.models import Policy
+
+
+@pytest.fixture(autouse=True)
+def reset_registry():
+    registry.clear_registry()
+    register_default_openrouter()
+    yield
+    registry.clear_registry()
+    register_default_openrouter()
+
+
+class WarmProvider:
+    name = "warm"
+
+    def __init__(self, fail: bool = False):
+        self.fail = fail
+        self.warmups = 0
+
+    def supports(self, model: str) -> bool:
+        return True
+
+    async def call(self, *args, **kwargs):
+        raise AssertionError("warm-up must not call models")
+
+    async def warmup(self, timeout_ms=None):
+        self.warmups += 1
+        if self.fail:
+            raise ConnectionError("unreachable")
+
+
+def _store() -> PolicyStore:
+    policy = Policy.model_validate({"policy_id": "warm-policy"})
+    return PolicyStore(loader=lambda path=None: policy, policy=policy)
+
+
+@pytest.mark.asyncio
+async def test_warm_up_reports_each_step():
+    provider = WarmProvider()
+    registry.register_provider(provider)
+
+    report = await warm_up(["warm::a", "warm::b"], policy_store=_store())
+
+    assert [step.name for step in report.steps] == ["policy", "preambles", "connections", "analyzers"]
+    assert report.ready
+    assert report.steps[0].detail == "warm-policy"
+    assert provider.warmups == 1
+    assert report.total_ms >= 0
+
+
+@pytest.mark.asyncio
+async def test_failed_connection_keeps_report_not_ready():
+    registry.register_provider(WarmProvider(fail=True))
+
+    report = await warm_up(["warm::a"], policy_store=_store())
+
+    connections = next(step for step in report.steps if step.name == "connections")
+    assert not connections.ok
+    assert "warm" in connections.detail
+    assert not report.ready
+    assert report.steps[-1].name == "analyzers"
+
+
+@pytest.mark.asyncio
+async def test_client_warmup_can_freeze_gc(monkeypatch):
+    registry.register_provider(WarmProvider())
+    frozen = []
+    monkeypatch.setattr(gc, "freeze", lambda: frozen.append(True))
+
+    report = await LcsClient().warmup(models=["warm::a"], freeze_gc=True)
+
+    assert report.steps[-1].name == "gc_freeze"
+    assert frozen == [True]
+
+
+@pytest.mark.asyncio
+async def test_preambles_step_loads_the_catalog(monkeypatch):
+    monkeypatch.setattr(openrouter, "_PREAMBLE_CATALOG_CACHE", None)
+
+    report = await warm_up([], policy_store=_store())
+
+    preambles = next(step for step in report.steps if step.name == "preambles")
+    assert preambles.ok
+    assert preambles.detail == f"{len(openrouter._PREAMBLE_CATALOG_CACHE)} catalog preambles"
+    assert {"code_v1", "qa_v1"} <= set(openrouter._PREAMBLE_CATALOG_CACHE)
+
+
+@pytest.mark.asyncio
+async def test_missing_catalog_fails_the_preambles_step(monkeypatch):
+    def missing():
+        raise FileNotFoundError("catalog.yaml")
+
+    monkeypatch.setattr(openrouter, "_PREAMBLE_CATALOG_CACHE", None)
+    monkeypatch.setattr(openrouter, "load_preamble_catalog", missing)
+
+    report = await warm_up([], policy_store=_store())
+
+    preambles = next(step for step in report.steps if step.name == "preambles")
+    assert not preambles.ok
+    assert "preamble catalog configuration missing" in preambles.detail
+    assert not report.ready